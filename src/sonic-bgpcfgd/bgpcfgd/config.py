@@ -1,23 +1,110 @@
+import re
+import time
+
+
+class ConfigIndex(object):
+    """ Index of FRR configuration text by prefix-list, community-list, route-map and peer-group """
+    RE_PEER_GROUP = re.compile(r'^\s*neighbor\s+(\S+)\s+peer-group\s*$')
+    RE_NEIGHBOR_RM_IN = re.compile(r'^\s*neighbor (\S+) route-map (\S+) in$')
+    RE_ROUTE_MAP = re.compile(r'^route-map (\S+) (permit|deny) (\d+)$')
+
+    def __init__(self, text):
+        """
+        Build the index
+        :param text: FRR configuration. Type: List of Strings
+        """
+        self.prefix_lists = {}  # (family, name) -> list of rules after 'seq N'
+        self.community_lists = {}  # name -> value of the first 'bgp community-list standard <name> permit' entry
+        self.route_maps = {}  # name -> list of (action, seq number, list of stripped lines of the entry)
+        self.peer_groups = []  # peer-group names in the order of the config
+        self.neighbor_route_maps_in = {}  # neighbor or peer-group name -> its first inbound route-map
+        entry_lines = None
+        for line in text:
+            if entry_lines is not None and line[:1].isspace():
+                entry_lines.append(line.strip())
+                continue
+            entry_lines = None
+            if line.startswith('ip prefix-list ') or line.startswith('ipv6 prefix-list '):
+                tokens = line.strip().split(' ')
+                if len(tokens) > 4 and tokens[3] == 'seq':
+                    self.prefix_lists.setdefault((tokens[0], tokens[2]), []).append(" ".join(tokens[5:]))
+            elif line.startswith('route-map '):
+                m = self.RE_ROUTE_MAP.match(line)
+                if m:
+                    entry_lines = []
+                    self.route_maps.setdefault(m.group(1), []).append((m.group(2), int(m.group(3)), entry_lines))
+            elif line.startswith('bgp community-list standard '):
+                tokens = line.strip().split(' ', 5)
+                if len(tokens) == 6 and tokens[4] == 'permit':
+                    self.community_lists.setdefault(tokens[3], tokens[5])
+            else:
+                m = self.RE_PEER_GROUP.match(line)
+                if m:
+                    self.peer_groups.append(m.group(1))
+                    continue
+                m = self.RE_NEIGHBOR_RM_IN.match(line)
+                if m:
+                    self.neighbor_route_maps_in.setdefault(m.group(1), m.group(2))
+
+    def get_prefix_list(self, family, name):
+        """
+        Get rules of a prefix-list
+        :param family: 'ip' or 'ipv6'
+        :param name: name of the prefix-list
+        :return: list of rules of the prefix-list, None if the prefix-list doesn't exist
+        """
+        return self.prefix_lists.get((family, name))
+
+    def get_route_map_entries(self, name, action='permit'):
+        """
+        Get entries of a route-map
+        :param name: name of the route-map
+        :param action: action of the entries: 'permit' or 'deny'
+        :return: list of tuples: sequence number, list of the stripped lines of the entry
+        """
+        return [(seq, lines) for entry_action, seq, lines in self.route_maps.get(name, []) if entry_action == action]
+
+
 class ConfigMgr(object):
     """ The class represents frr configuration """
-    def __init__(self, frr):
+    MAX_CONFIG_AGE = 1.0  # seconds. How long the config which was read from FRR can be reused
+
+    def __init__(self, frr, max_config_age=MAX_CONFIG_AGE):
         self.frr = frr
-        self.current_config = None
+        self.max_config_age = max_config_age
         self.current_config_raw = None
+        self.current_config_index = None
+        self.current_config_time = None
+        self.canonical_config = None
         self.changes = ""
         self.peer_groups_to_restart = []
 
     def reset(self):
         """ Reset stored config """
-        self.current_config = None
         self.current_config_raw = None
+        self.current_config_index = None
+        self.current_config_time = None
+        self.canonical_config = None
         self.changes = ""
         self.peer_groups_to_restart = []
 
+    @property
+    def current_config(self):
+        """ Current config in the canonical format. It is built on the first request """
+        if self.canonical_config is None and self.current_config_raw is not None:
+            self.canonical_config = self.to_canonical("\n".join(self.current_config_raw))
+        return self.canonical_config
+
     def update(self):
-        """ Read current config from FRR """
-        self.current_config = None
+        """
+        Read current config from FRR. The config which was read is reused until
+        a commit changes FRR config, or for max_config_age seconds
+        """
+        if self.current_config_raw is not None and time.monotonic() - self.current_config_time < self.max_config_age:
+            return
         self.current_config_raw = None
+        self.current_config_index = None
+        self.canonical_config = None
         out = self.frr.get_config()
         text = []
         for line in out.split('\n'):
@@ -26,7 +113,7 @@ class ConfigMgr(object):
             text.append(line)
         text += ["     "]  # Add empty line to have something to work on, if there is no text
         self.current_config_raw = text
-        self.current_config = self.to_canonical(out)  # FIXME: use text as an input
+        self.current_config_time = time.monotonic()
 
     def push_list(self, cmdlist):
         """
@@ -45,10 +132,12 @@ class ConfigMgr(object):
 
     def restart_peer_groups(self, peer_groups):
         """
-        Schedule peer_groups for restart on commit
+        Schedule peer_groups for restart on commit. A peer_group is restarted once per commit
         :param peer_groups: List of peer_groups
         """
-        self.peer_groups_to_restart.extend(peer_groups)
+        for peer_group in peer_groups:
+            if peer_group not in self.peer_groups_to_restart:
+                self.peer_groups_to_restart.append(peer_group)
 
     def commit(self):
         """
@@ -65,6 +154,12 @@ class ConfigMgr(object):
     def get_text(self):
         return self.current_config_raw
 
+    def get_index(self):
+        """ Get the index of the current config. It is built once for every read of the config """
+        if self.current_config_index is None and self.current_config_raw is not None:
+            self.current_config_index = ConfigIndex(self.current_config_raw)
+        return self.current_config_index
+
     @staticmethod
     def to_canonical(raw_config):
         """
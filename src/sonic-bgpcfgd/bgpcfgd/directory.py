@@ -8,13 +8,34 @@ class Directory(object):
         as some value is changed. This class works as DB cache mostly """
     def __init__(self):
         self.data = defaultdict(dict)  # storage. A key is a slot name, a value is a dictionary with data
-        self.notify = defaultdict(lambda: defaultdict(list))  # registered callbacks: slot -> path -> handlers[]
+        self.notify = defaultdict(lambda: defaultdict(list))  # registered callbacks: slot -> entry -> [(path, handler)]
 
     @staticmethod
     def get_slot_name(db, table):
         """ Convert db, table pair into a slot name """
         return db + "__" + table
 
+    @staticmethod
+    def get_path_entry(path):
+        """ Get the slot entry of a path: its first component. The entry is '' for the path of the whole slot """
+        return path.split("/", 1)[0]
+
+    @staticmethod
+    def get_affected_entries(key):
+        """
+        Get the slot entries, which paths are affected by a change of the key.
+        These are the whole slot, the key and the parents of the key in the db key hierarchy.
+        Example: a change of key "Loopback0|10.1.0.32/32" affects entries "", "Loopback0" and the key itself
+        :param key: changed key
+        :return: list of the affected entries
+        """
+        entries = ['', key]
+        pos = key.find('|')
+        while pos != -1:
+            entries.append(key[:pos])
+            pos = key.find('|', pos + 1)
+        return entries
+
     def path_traverse(self, slot, path):
         """
         Traverse a path in the storage.
@@ -70,12 +91,20 @@ class Directory(object):
         :return:
         """
         slot = self.get_slot_name(db, table)
-        self.data[slot][key] = value
-        if slot in self.notify:
-            for path in self.notify[slot].keys():
-                if self.path_exist(db, table, path):
-                    for handler in self.notify[slot][path]:
-                        handler()
+        slot_data = self.data[slot]
+        # The same value is put again. The handlers were notified about it already
+        unchanged = key in slot_data and slot_data[key] is not value and slot_data[key] == value
+        slot_data[key] = value
+        if unchanged or slot not in self.notify:
+            return
+        subscriptions = self.notify[slot]
+        handlers = []
+        for entry in self.get_affected_entries(key):
+            for path, handler in subscriptions.get(entry, []):
+                if handler not in handlers and self.path_traverse(slot, path)[0]:
+                    handlers.append(handler)
+        for handler in handlers:
+            handler()
 
     def get(self, db, table, key):
         """
@@ -156,4 +185,4 @@ class Directory(object):
         """
         for db, table, path in deps:
             slot = self.get_slot_name(db, table)
-            self.notify[slot][path].append(handler)
\ No newline at end of file
+            self.notify[slot][self.get_path_entry(path)].append((path, handler))
\ No newline at end of file
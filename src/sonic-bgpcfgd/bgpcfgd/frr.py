@@ -1,13 +1,113 @@
 import os
 import datetime
+import socket
+import threading
 import time
 import tempfile
 
-from bgpcfgd.log import log_err, log_info, log_warn, log_crit
+from bgpcfgd.log import log_err, log_info, log_warn, log_crit, log_debug
 from .vars import g_debug
 from .utils import run_command
 
 
+VTY_SOCKET_PATH = '/run/frr/%s.vty'
+VTY_TIMEOUT = 120.0  # seconds to wait for a command reply from a daemon
+VTY_RECV_SIZE = 65536
+
+
+class VtyClient(object):
+    """ Persistent connection to the vty socket of an FRR daemon """
+    def __init__(self, daemon, timeout=VTY_TIMEOUT):
+        self.daemon = daemon
+        self.path = VTY_SOCKET_PATH % daemon
+        self.timeout = timeout
+        self.sock = None
+        self.lock = threading.Lock()
+
+    def connect(self):
+        """
+        Connect to the daemon and enter the enable mode
+        :return: True if the connection is ready for commands, False otherwise
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+            self.sock = sock
+            ret_code, out = self.send('enable')
+        except socket.error as e:
+            log_debug("Can't connect to %s vty socket '%s': %s" % (self.daemon, self.path, str(e)))
+            sock.close()
+            self.sock = None
+            return False
+        if ret_code != 0:
+            log_warn("Can't enter enable mode on %s vty socket: rc=%d out='%s'" % (self.daemon, ret_code, out))
+            self.close()
+            return False
+        log_info("Connected to %s vty socket '%s'" % (self.daemon, self.path))
+        return True
+
+    def close(self):
+        """ Close the connection """
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def send(self, command):
+        """
+        Send a command and read its reply. The daemon terminates a reply with three zero bytes and the return code
+        :param command: vty command
+        :return: Tuple: integer return code of the command, output as a string
+        """
+        self.sock.sendall(command.encode('utf-8') + b'\0')
+        reply = bytearray()
+        while True:
+            data = self.sock.recv(VTY_RECV_SIZE)
+            if not data:
+                raise socket.error("connection closed by %s" % self.daemon)
+            reply += data
+            if len(reply) >= 4 and reply[-4:-1] == b'\0\0\0':
+                return reply[-1], reply[:-4].decode('utf-8', 'replace')
+
+    def execute(self, command):
+        """
+        Execute a command on the daemon, (re)connecting to it when it is required
+        :param command: vty command
+        :return: Tuple: integer return code of the command, output as a string. None, if the daemon is not reachable
+        """
+        with self.lock:
+            for _ in range(2):
+                if self.sock is None and not self.connect():
+                    return None
+                try:
+                    return self.send(command)
+                except socket.error as e:
+                    # The daemon was restarted, or the reply is lost. Don't reuse the connection
+                    log_warn("Lost %s vty connection on command '%s': %s" % (self.daemon, command, str(e)))
+                    self.close()
+            return None
+
+
+vty_clients = {}
+
+
+def vtysh(command, daemon="bgpd"):
+    """
+    Run a vtysh command on a daemon through its persistent vty connection.
+    Fall back to a vtysh process if the daemon's vty socket isn't available
+    :param command: vtysh command. Type: String
+    :param daemon: the daemon which serves the command. Type: String
+    :return: Tuple: integer return code of the command, stdout as a string, stderr as a string
+    """
+    if daemon not in vty_clients:
+        vty_clients[daemon] = VtyClient(daemon)
+    res = vty_clients[daemon].execute(command)
+    if res is None:
+        return run_command(["vtysh", "-c", command])
+    ret_code, out = res
+    return ret_code, out, ""
+
+
 class FRR(object):
     """Proxy object with FRR"""
     def __init__(self, daemons):
@@ -32,7 +132,8 @@ class FRR(object):
 
     @staticmethod
     def get_config():
-        ret_code, out, err = run_command(["vtysh", "-c", "show running-config"])
+        # bgpcfgd manages the bgpd configuration only, so the running config of bgpd is read
+        ret_code, out, err = vtysh("show running-config")
         if ret_code != 0:
             log_crit("can't update running config: rc=%d out='%s' err='%s'" % (ret_code, out, err))
             return ""
@@ -40,6 +141,7 @@ class FRR(object):
 
     @staticmethod
     def write(config_text):
+        # The configuration goes through vtysh, which dispatches every command to the daemons serving it
         fd, tmp_filename = tempfile.mkstemp(dir='/tmp')
         os.close(fd)
         with open(tmp_filename, 'w') as fp:
@@ -62,7 +164,7 @@ class FRR(object):
         """
         res = True
         for peer_group in sorted(peer_groups):
-            rc, out, err = run_command(["vtysh", "-c", "clear bgp peer-group %s soft in" % peer_group])
+            rc, out, err = vtysh("clear bgp peer-group %s soft in" % peer_group)
             if rc != 0:
                 log_value = peer_group, rc, out, err
                 log_crit("Can't restart bgp peer-group '%s'. rc='%d', out='%s', err='%s'" % log_value)
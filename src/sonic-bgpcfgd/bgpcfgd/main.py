@@ -35,11 +35,13 @@ def do_work():
     frr = FRR(["bgpd", "zebra", "staticd"])
     frr.wait_for_daemons(seconds=20)
     #
+    constants = read_constants()
+    running_config_constants = constants.get('bgp', {}).get('running_config', {})
     common_objs = {
         'directory': Directory(),
-        'cfg_mgr':   ConfigMgr(frr),
+        'cfg_mgr':   ConfigMgr(frr, max_config_age=running_config_constants.get('max_age_ms', 0) / 1000.0),
         'tf':        TemplateFabric(),
-        'constants': read_constants(),
+        'constants': constants,
     }
     managers = [
         # Config DB managers
@@ -74,7 +76,10 @@ def do_work():
         # Device Global Manager
         DeviceGlobalCfgMgr(common_objs, "CONFIG_DB", swsscommon.CFG_BGP_DEVICE_GLOBAL_TABLE_NAME),
     ]
-    runner = Runner(common_objs['cfg_mgr'])
+    commit_constants = common_objs['constants'].get('bgp', {}).get('commit', {})
+    runner = Runner(common_objs['cfg_mgr'],
+                    commit_window=commit_constants.get('window_ms', 0) / 1000.0,
+                    commit_max_changes=commit_constants.get('max_changes', Runner.COMMIT_MAX_CHANGES))
     for mgr in managers:
         runner.add_manager(mgr)
     runner.run()
@@ -7,7 +7,7 @@ import netaddr
 from .log import log_warn, log_err, log_info, log_debug, log_crit
 from .manager import Manager
 from .template import TemplateFabric
-from .utils import run_command
+from .frr import vtysh
 from .managers_device_global import DeviceGlobalCfgMgr
 
 
@@ -379,8 +379,42 @@ class BGPPeerMgrBase(Manager):
         Load peers from FRR.
         :return: set of peers, which are already installed in FRR
         """
-        command = ["vtysh", "-c", "show bgp vrfs json"]
-        ret_code, out, err = run_command(command)
+        peers = BGPPeerMgrBase.load_all_vrfs_peers()
+        if peers is None:
+            peers = BGPPeerMgrBase.load_peers_by_vrf()
+        return peers
+
+    @staticmethod
+    def load_all_vrfs_peers():
+        """
+        Load peers of all vrfs from FRR with one request
+        :return: set of peers, which are already installed in FRR. None if FRR can't return them
+        """
+        ret_code, out, err = vtysh("show bgp vrf all neighbors json")
+        if ret_code != 0:
+            log_warn("Can't read neighbors of all bgp vrfs: %s" % err)
+            return None
+        try:
+            js_vrfs = json.loads(out)
+        except ValueError as e:
+            log_warn("Can't parse neighbors of all bgp vrfs: %s" % str(e))
+            return None
+        peers = set()
+        for vrf, js_bgp in js_vrfs.items():
+            if not isinstance(js_bgp, dict):
+                log_warn("Unexpected neighbors of bgp vrf '%s': %s" % (vrf, str(js_bgp)))
+                return None
+            # Besides the neighbors, the vrf object has vrfId and vrfName attributes
+            peers.update((vrf, nbr) for nbr, js_nbr in js_bgp.items() if isinstance(js_nbr, dict))
+        return peers
+
+    @staticmethod
+    def load_peers_by_vrf():
+        """
+        Load peers from FRR, one vrf at a time
+        :return: set of peers, which are already installed in FRR
+        """
+        ret_code, out, err = vtysh("show bgp vrfs json")
         if ret_code == 0:
             js_vrf = json.loads(out)
             vrfs = js_vrf['vrfs'].keys()
@@ -389,8 +423,7 @@ class BGPPeerMgrBase(Manager):
             raise Exception("Can't read bgp vrfs: %s" % err)
         peers = set()
         for vrf in vrfs:
-            command = ["vtysh", "-c", 'show bgp vrf %s neighbors json' % str(vrf)]
-            ret_code, out, err = run_command(command)
+            ret_code, out, err = vtysh('show bgp vrf %s neighbors json' % str(vrf))
             if ret_code == 0:
                 js_bgp = json.loads(out)
                 for nbr in js_bgp.keys():
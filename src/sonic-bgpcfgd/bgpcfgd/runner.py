@@ -1,3 +1,4 @@
+import time
 from collections import defaultdict
 from swsscommon import swsscommon
 
@@ -19,10 +20,19 @@ class Runner(object):
         when corresponding db/table is updated
     """
     SELECT_TIMEOUT = 1000
+    COMMIT_WINDOW = 0.0
+    COMMIT_MAX_CHANGES = 1000
 
-    def __init__(self, cfg_manager):
-        """ Constructor """
+    def __init__(self, cfg_manager, commit_window=COMMIT_WINDOW, commit_max_changes=COMMIT_MAX_CHANGES):
+        """
+        Constructor
+        :param cfg_manager: ConfigMgr object, which commits the changes to FRR
+        :param commit_window: seconds to keep collecting changes after the first one, before they're committed together
+        :param commit_max_changes: number of received changes which are committed right away, even inside of the window
+        """
         self.cfg_manager = cfg_manager
+        self.commit_window = commit_window
+        self.commit_max_changes = commit_max_changes
         self.db_connectors = {}
         self.selector = swsscommon.Select()
         self.callbacks = defaultdict(lambda: defaultdict(list))  # db -> table -> handlers[]
@@ -50,21 +60,42 @@ class Runner(object):
 
     def run(self):
         """ Main loop """
+        n_pending = 0  # number of changes received since the last commit
+        commit_time = 0.0  # time when the pending changes are committed at the latest
         while g_run:
-            state, _ = self.selector.select(Runner.SELECT_TIMEOUT)
-            if state == self.selector.TIMEOUT:
-                continue
-            elif state == self.selector.ERROR:
+            if n_pending:
+                timeout = max(0, int((commit_time - time.monotonic()) * 1000))
+            else:
+                timeout = Runner.SELECT_TIMEOUT
+            state, _ = self.selector.select(timeout)
+            if state == self.selector.ERROR:
                 raise Exception("Received error from select")
+            elif state != self.selector.TIMEOUT:
+                n_received = self.process_events()
+                if n_received and not n_pending:
+                    commit_time = time.monotonic() + self.commit_window
+                n_pending += n_received
+
+            # Changes of all managers received inside of the window go to FRR together
+            if n_pending and (n_pending >= self.commit_max_changes or time.monotonic() >= commit_time):
+                n_pending = 0
+                rc = self.cfg_manager.commit()
+                if not rc:
+                    log_crit("Runner::commit was unsuccessful")
 
-            for subscriber in self.subscribers:
-                while True:
-                    key, op, fvs = subscriber.pop()
-                    if not key:
-                        break
-                    log_debug("Received message : '%s'" % str((key, op, fvs)))
-                    for callback in self.callbacks[subscriber.getDbConnector().getDbId()][subscriber.getTableName()]:
-                        callback(key, op, dict(fvs))
-            rc = self.cfg_manager.commit()
-            if not rc:
-                log_crit("Runner::commit was unsuccessful")
+    def process_events(self):
+        """
+        Run the handlers for all messages waiting in the subscribers
+        :return: number of processed messages
+        """
+        n_received = 0
+        for subscriber in self.subscribers:
+            while True:
+                key, op, fvs = subscriber.pop()
+                if not key:
+                    break
+                log_debug("Received message : '%s'" % str((key, op, fvs)))
+                n_received += 1
+                for callback in self.callbacks[subscriber.getDbConnector().getDbId()][subscriber.getTableName()]:
+                    callback(key, op, dict(fvs))
+        return n_received
@@ -1,17 +1,68 @@
+import os
 from collections import OrderedDict
-from functools import partial
+from functools import lru_cache, partial
 
 import jinja2
 import netaddr
 
-from .log import log_err
+from .log import log_err, log_warn
+
+# Directory of the compiled template cache. The default is a directory private
+# to the user in the system temp directory. An empty value disables the cache.
+J2_CACHE_DIR_ENV = 'SONIC_J2_CACHE_DIR'
+
+
+# Number of parsed prefixes kept by parse_prefix()
+PREFIX_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=PREFIX_CACHE_SIZE)
+def parse_prefix(value):
+    """
+    Parse a prefix string. Templates and managers check the same interface and
+    neighbor addresses many times, so the parsed prefixes are cached.
+    :param value: string representation of an ip prefix or address
+    :return: shared IPNetwork object, which must not be modified, or None if the value isn't valid
+    """
+    try:
+        return netaddr.IPNetwork(value)
+    except (netaddr.NotRegisteredError, netaddr.AddrFormatError, netaddr.AddrConversionError):
+        return None
+
+
+class BytecodeCache(jinja2.FileSystemBytecodeCache):
+    """ Compiled templates stored on disk. A failure to store a template doesn't fail its rendering """
+    def dump_bytecode(self, bucket):
+        try:
+            super(BytecodeCache, self).dump_bytecode(bucket)
+        except (IOError, OSError) as e:
+            log_warn("Can't store compiled template '%s': %s" % (bucket.key, str(e)))
+
+
+def get_bytecode_cache():
+    """
+    Create the cache of compiled templates. Cache entries are named after the jinja2 version,
+    and a template is compiled again when its source changes.
+    :return: BytecodeCache object, or None if the cache is disabled or can't be created
+    """
+    directory = os.environ.get(J2_CACHE_DIR_ENV)
+    if directory == '':
+        return None
+    try:
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        return BytecodeCache(directory, '__bgpcfgd_%s_%%s.cache' % jinja2.__version__)
+    except (IOError, OSError, RuntimeError) as e:
+        log_warn("Can't create the compiled template cache: %s" % str(e))
+        return None
+
 
 class TemplateFabric(object):
     """ Fabric for rendering jinja2 templates """
     def __init__(self, template_path = '/usr/share/sonic/templates'):
         j2_template_paths = [template_path]
         j2_loader = jinja2.FileSystemLoader(j2_template_paths)
-        j2_env = jinja2.Environment(loader=j2_loader, trim_blocks=False)
+        j2_env = jinja2.Environment(loader=j2_loader, trim_blocks=False, bytecode_cache=get_bytecode_cache())
         j2_env.filters['ipv4'] = self.is_ipv4
         j2_env.filters['ipv6'] = self.is_ipv6
         j2_env.filters['pfx_filter'] = self.pfx_filter
@@ -35,33 +86,27 @@ class TemplateFabric(object):
         """
         return self.env.from_string(tmpl)
 
+    @staticmethod
+    def prefix_version(value):
+        """ Return the ip version of the value, or None if it isn't a valid ip address """
+        if isinstance(value, netaddr.IPNetwork):
+            return value.version
+        prefix = parse_prefix(str(value))
+        return prefix.version if prefix is not None else None
+
     @staticmethod
     def is_ipv4(value):
         """ Return True if the value is an ipv4 address """
         if not value:
             return False
-        if isinstance(value, netaddr.IPNetwork):
-            addr = value
-        else:
-            try:
-                addr = netaddr.IPNetwork(str(value))
-            except (netaddr.NotRegisteredError, netaddr.AddrFormatError, netaddr.AddrConversionError):
-                return False
-        return addr.version == 4
+        return TemplateFabric.prefix_version(value) == 4
 
     @staticmethod
     def is_ipv6(value):
         """ Return True if the value is an ipv6 address """
         if not value:
             return False
-        if isinstance(value, netaddr.IPNetwork):
-            addr = value
-        else:
-            try:
-                addr = netaddr.IPNetwork(str(value))
-            except (netaddr.NotRegisteredError, netaddr.AddrFormatError, netaddr.AddrConversionError):
-                return False
-        return addr.version == 6
+        return TemplateFabric.prefix_version(value) == 6
 
     @staticmethod
     def prefix_attr(attr, value):
@@ -73,11 +118,9 @@ class TemplateFabric(object):
         """
         if not value:
             return None
-        else:
-            try:
-                prefix = netaddr.IPNetwork(str(value).strip())
-            except (netaddr.NotRegisteredError, netaddr.AddrFormatError, netaddr.AddrConversionError):
-                return None
+        prefix = parse_prefix(str(value).strip())
+        if prefix is None:
+            return None
         return str(getattr(prefix, attr))
 
     @staticmethod
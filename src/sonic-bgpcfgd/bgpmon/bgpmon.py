@@ -17,6 +17,11 @@ Description: bgpmon.py -- populating bgp related information in stateDB.
     done periodically (every 15 second). When triggered, it looks specifically
     for the neighbor state in the json output of show ip bgp neighbors json
     and update the state DB for each neighbor accordingly.
+    Between the periodic checks, the script follows the neighbor adjacency
+    changes logged by bgpd. The rsyslogd of the bgp docker writes them into a
+    dedicated file (see bgpmon_rsyslog.conf in docker-fpm-frr), which is
+    watched through inotify. When a change is logged, the state of this
+    neighbor only is requested and updated in the state DB right away.
     In order to not disturb and hold on to the State DB access too long and
     removal of the stale neighbors (neighbors that was there previously on
     previous get request but no longer there in the current get request), a
@@ -24,8 +29,12 @@ Description: bgpmon.py -- populating bgp related information in stateDB.
     is a need to perform update or the peer is stale to be removed from the
     state DB
 """
+import ctypes
+import ctypes.util
 import json
 import os
+import re
+import select
 import sys
 import syslog
 from swsscommon import swsscommon
@@ -33,6 +42,120 @@ import time
 from sonic_py_common.general import getstatusoutput_noshell
 
 PIPE_BATCH_MAX_COUNT = 50
+RESYNC_INTERVAL = 15  # seconds between the checks of the whole neighbor table
+# bgpd adjacency change messages, written by the rsyslogd of the bgp docker
+ADJCHANGE_LOG_FILE = "/var/run/bgpmon/adjchange.log"
+ADJCHANGE_LOG_MAX_SIZE = 1024 * 1024  # the file is emptied when it was read up to this size
+LOG_POLL_INTERVAL = 1  # seconds between the checks of the file, when inotify is not available
+# bgpd message on a neighbor going to or from the Established state. Ex:
+# "%ADJCHANGE: neighbor 10.0.0.57(ARISTA01T1) in vrf default Up"
+ADJCHANGE_RE = re.compile(r'%ADJCHANGE: neighbor ([^\s(]+)(?:\([^)]*\))?(?: in vrf (\S+))? (?:Up|Down)')
+
+IN_MODIFY = 0x00000002
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+
+
+class AdjChangeWatcher:
+    """Follow the adjacency change log file, and report the neighbors which changes were logged into it"""
+    def __init__(self, path=ADJCHANGE_LOG_FILE):
+        self.path = path
+        self.fp = None
+        self.inode = None
+        self.pending = ''
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            pass
+        self.inotify_fd = self.create_inotify(directory)
+        self.open_log(from_start=False)
+
+    @staticmethod
+    def create_inotify(directory):
+        # The directory is watched, so the file is noticed when rsyslogd creates it
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            if libc.inotify_add_watch(fd, directory.encode(), IN_MODIFY | IN_MOVED_TO | IN_CREATE) < 0:
+                errno = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(errno, "inotify_add_watch failed for %s" % directory)
+            return fd
+        except (OSError, AttributeError) as e:
+            syslog.syslog(syslog.LOG_WARNING, "*WARNING* Can't watch {} with inotify: {}. Poll it every {} seconds".format(directory, e, LOG_POLL_INTERVAL))
+            return None
+
+    def open_log(self, from_start):
+        try:
+            fp = open(self.path, 'r', errors='replace')
+        except (IOError, OSError):
+            return
+        if self.fp is not None:
+            self.fp.close()
+        self.fp = fp
+        self.inode = os.fstat(fp.fileno()).st_ino
+        self.pending = ''
+        if not from_start:
+            self.fp.seek(0, os.SEEK_END)
+
+    def wait(self, timeout):
+        """Wait up to timeout seconds for a change in the log directory
+        Returns:
+            True if something could be written into the log file
+        """
+        if self.inotify_fd is None:
+            time.sleep(min(timeout, LOG_POLL_INTERVAL))
+            return True
+        ready, _, _ = select.select([self.inotify_fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self.inotify_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def read_lines(self):
+        """Read the lines written into the log file since the last call"""
+        lines = []
+        if self.fp is not None:
+            lines = self.read_fp()
+        try:
+            st = os.stat(self.path)
+        except (IOError, OSError):
+            return lines
+        # The log file was created, replaced or truncated
+        if self.fp is None or st.st_ino != self.inode or st.st_size < self.fp.tell():
+            self.open_log(from_start=True)
+            if self.fp is not None:
+                lines += self.read_fp()
+        elif not self.pending and self.fp.tell() >= ADJCHANGE_LOG_MAX_SIZE:
+            # Keep the file small. rsyslogd appends to it, so the next line
+            # is written at the start again. A line written in between is
+            # lost, the periodic check of the whole table catches up on it.
+            os.truncate(self.path, 0)
+            self.fp.seek(0)
+        return lines
+
+    def read_fp(self):
+        data = self.pending + self.fp.read()
+        lines = data.split('\n')
+        self.pending = lines.pop()
+        return lines
+
+    def get_changed_peers(self):
+        """Get neighbors of the default vrf, which adjacency changes were logged since the last call"""
+        peers = set()
+        for line in self.read_lines():
+            m = ADJCHANGE_RE.search(line)
+            if m and m.group(2) in (None, 'default'):
+                peers.add(m.group(1))
+        return peers
+
 
 class BgpStateGet:
     def __init__(self):
@@ -117,6 +240,45 @@ class BgpStateGet:
         sys.exit(1)
 
 
+    # Get the state of one BGP neighbor, in the same format as the whole table
+    def get_neigh_state(self, peer):
+        cmd = ["vtysh", "-c", 'show bgp summary neighbor {} json'.format(peer)]
+        try:
+            rc, output = getstatusoutput_noshell(cmd)
+            if rc:
+                syslog.syslog(syslog.LOG_ERR, "*ERROR* Failed with rc:{} when execute: {}".format(rc, cmd))
+                return None
+            peer_info = json.loads(output)
+            for key, value in peer_info.items():
+                if key == "ipv4Unicast" or key == "ipv6Unicast":
+                    peer_dict = value.get("peers", {}).get(peer)
+                    if peer_dict is not None:
+                        return (peer_dict["state"], peer_dict["remoteAs"], peer_dict["localAs"])
+            return None
+        except (ValueError, KeyError, AttributeError) as e:
+            syslog.syslog(syslog.LOG_WARNING, "*WARNING* Can't get the neighbor state: {} when execute: {}".format(e, cmd))
+            return None
+
+    # Update State DB for the neighbors, which adjacency changes were logged by bgpd.
+    # Returns False if a neighbor can't be read, so the whole neighbor table has to be read.
+    def update_changed_neigh_states(self, peers):
+        data = {}
+        res = True
+        for peer in peers:
+            peer_state = self.get_neigh_state(peer)
+            if peer_state is None:
+                res = False
+                continue
+            state, remote_as, local_as = peer_state
+            if peer not in self.peer_l or self.peer_state[peer] != state:
+                peerType = "i-BGP" if remote_as == local_as else "e-BGP"
+                data["NEIGH_STATE_TABLE|%s" % peer] = {'state':state, 'peerType':peerType}
+                self.peer_state[peer] = state
+                self.peer_l.add(peer)
+        if len(data) > 0:
+            self.flush_pipe(data)
+        return res
+
     # This method will take the caller's dictionary which contains the peer state operation
     # That need to be updated in StateDB using Redis pipeline.
     # The data{} will be cleared at the end of this method before returning to caller.
@@ -195,12 +357,20 @@ def main():
         syslog.syslog(syslog.LOG_ERR, "{}: error exit 1, reason {}".format("THIS_MODULE", str(e)))
         sys.exit(1)
 
+    # update the neighbors, which adjacency changes are logged, right away.
     # periodically obtain the new neighbor information and update if necessary
+    adjchange_watcher = AdjChangeWatcher()
+    next_resync = time.monotonic() + RESYNC_INTERVAL
     while True:
-        time.sleep(15)
-        if bgp_state_get.bgp_activity_detected():
-            bgp_state_get.get_all_neigh_states()
-            bgp_state_get.update_neigh_states()
+        if adjchange_watcher.wait(max(0, next_resync - time.monotonic())):
+            peers = adjchange_watcher.get_changed_peers()
+            if peers and not bgp_state_get.update_changed_neigh_states(peers):
+                next_resync = time.monotonic()
+        if time.monotonic() >= next_resync:
+            next_resync = time.monotonic() + RESYNC_INTERVAL
+            if bgp_state_get.bgp_activity_detected():
+                bgp_state_get.get_all_neigh_states()
+                bgp_state_get.update_neigh_states()
 
 if __name__ == '__main__':
     main()
@@ -98,6 +98,7 @@ def check_ip(ip):
 class StaticRouteBfd(object):
 
     SELECT_TIMEOUT = 1000
+    APPL_DB_PIPELINE_SIZE = 1024  # the APPL_DB changes are written when the pipeline is full, or at the end of a select cycle
     BFD_DEFAULT_CFG = {"multihop": "false", "rx_interval": "50", "tx_interval": "50"}
 
     def __init__(self):
@@ -115,9 +116,11 @@ class StaticRouteBfd(object):
         self.appl_db = swsscommon.DBConnector(APPL_DB_NAME, 0, True)
         self.state_db = swsscommon.DBConnector(STATE_DB_NAME, 0, True)
 
-        self.bfd_appl_tbl = swsscommon.ProducerStateTable(self.appl_db, BFD_SESSION_TABLE_NAME)
+        # A BFD state change can update thousands of routes. Send them to APPL_DB in batches
+        self.appl_db_pipeline = swsscommon.RedisPipeline(self.appl_db, self.APPL_DB_PIPELINE_SIZE)
+        self.bfd_appl_tbl = swsscommon.ProducerStateTable(self.appl_db_pipeline, BFD_SESSION_TABLE_NAME, True)
 
-        self.static_route_appl_tbl = swsscommon.Table(self.appl_db, STATIC_ROUTE_TABLE_NAME)
+        self.static_route_appl_tbl = swsscommon.Table(self.appl_db_pipeline, STATIC_ROUTE_TABLE_NAME, True)
 
         self.selector = swsscommon.Select()
         self.callbacks = defaultdict(lambda: defaultdict(list))  # db -> table -> handlers[]
@@ -181,6 +184,10 @@ class StaticRouteBfd(object):
     def del_bfd_session_from_appl_db(self, key):
         self.bfd_appl_tbl.delete(key)
 
+    def flush_appl_db(self):
+        """ Write the buffered bfd session and static route changes into appl_db """
+        self.appl_db_pipeline.flush()
+
     def interface_set_handler(self, key, data):
         valid, is_ipv4, if_name, ip = self.get_ip_from_key(key)
         if not valid:
@@ -745,6 +752,7 @@ class StaticRouteBfd(object):
             if self.first_time:
                 self.first_time = False
                 self.reconciliation()
+                self.flush_appl_db()
 
             for sub in self.subscribers:
                 while True:
@@ -754,6 +762,7 @@ class StaticRouteBfd(object):
                     log_debug("Received message : '%s'" % str((key, op, fvs)))
                     for callback in self.callbacks[sub.getDbConnector().getDbId()][sub.getTableName()]:
                         callback(key, op, dict(fvs))
+            self.flush_appl_db()
 
 def do_work():
     sr_bfd = StaticRouteBfd()
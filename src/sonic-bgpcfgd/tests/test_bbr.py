@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+from bgpcfgd.config import ConfigIndex
 from bgpcfgd.directory import Directory
 from bgpcfgd.template import TemplateFabric
 from copy import deepcopy
@@ -372,6 +373,7 @@ def test__get_available_peer_groups():
         'constants': global_constants,
     }
     m = BBRMgr(common_objs, "CONFIG_DB", "BGP_BBR")
+    m.cfg_mgr.get_index = lambda: ConfigIndex(m.cfg_mgr.get_text())
     m.cfg_mgr.get_text = MagicMock(return_value=[
         '  neighbor PEER_V4 peer-group',
         '  neighbor PEER_V6 peer-group',
@@ -6,6 +6,7 @@ from bgpcfgd.template import TemplateFabric
 from . import swsscommon_test
 from .util import load_constants
 from swsscommon import swsscommon
+import bgpcfgd.frr
 import bgpcfgd.managers_bgp
 
 TEMPLATE_PATH = os.path.abspath('../../dockers/docker-fpm-frr/frr')
@@ -32,11 +33,10 @@ def constructor(constants_path):
     }
 
     return_value_map = {
-        "['vtysh', '-c', 'show bgp vrfs json']": (0, "{\"vrfs\": {\"default\": {}}}", ""),
-        "['vtysh', '-c', 'show bgp vrf default neighbors json']": (0, "{\"10.10.10.1\": {}, \"20.20.20.1\": {}, \"fc00:10::1\": {}}", "")
+        "['vtysh', '-c', 'show bgp vrf all neighbors json']": (0, "{\"default\": {\"vrfId\": 0, \"vrfName\": \"default\", \"10.10.10.1\": {}, \"20.20.20.1\": {}, \"fc00:10::1\": {}}}", ""),
     }
 
-    bgpcfgd.managers_bgp.run_command = lambda cmd: return_value_map[str(cmd)]
+    bgpcfgd.frr.run_command = lambda cmd: return_value_map[str(cmd)]
     m = bgpcfgd.managers_bgp.BGPPeerMgrBase(common_objs, "CONFIG_DB", swsscommon.CFG_BGP_NEIGHBOR_TABLE_NAME, "general", True)
     assert m.peer_type == "general"
     assert m.check_neig_meta == ('bgp' in constants and 'use_neighbors_meta' in constants['bgp'] and constants['bgp']['use_neighbors_meta'])
@@ -135,3 +135,21 @@ def test_del_handler_nonexist_peer(mocked_log_warn):
         m = constructor(constant)
         m.del_handler("40.40.40.1")
         mocked_log_warn.assert_called_with("Peer '(default|40.40.40.1)' has not been found")
+
+def test_load_peers():
+    bgpcfgd.frr.run_command = lambda cmd: {
+        "['vtysh', '-c', 'show bgp vrf all neighbors json']":
+            (0, '{"default": {"vrfId": 0, "vrfName": "default", "10.10.10.1": {}}, "Vnet1": {"vrfId": 5, "vrfName": "Vnet1", "fc00:10::1": {}}}', ""),
+    }[str(cmd)]
+    assert bgpcfgd.managers_bgp.BGPPeerMgrBase.load_peers() == {("default", "10.10.10.1"), ("Vnet1", "fc00:10::1")}
+
+@patch('bgpcfgd.managers_bgp.log_warn')
+def test_load_peers_by_vrf(mocked_log_warn):
+    bgpcfgd.frr.run_command = lambda cmd: {
+        "['vtysh', '-c', 'show bgp vrf all neighbors json']": (1, "", "some error"),
+        "['vtysh', '-c', 'show bgp vrfs json']": (0, '{"vrfs": {"default": {}, "Vnet1": {}}}', ""),
+        "['vtysh', '-c', 'show bgp vrf default neighbors json']": (0, '{"10.10.10.1": {}}', ""),
+        "['vtysh', '-c', 'show bgp vrf Vnet1 neighbors json']": (0, '{"fc00:10::1": {}}', ""),
+    }[str(cmd)]
+    assert bgpcfgd.managers_bgp.BGPPeerMgrBase.load_peers() == {("default", "10.10.10.1"), ("Vnet1", "fc00:10::1")}
+    mocked_log_warn.assert_called_with("Can't read neighbors of all bgp vrfs: some error")
@@ -0,0 +1,101 @@
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+from . import swsscommon_test
+
+with patch.dict("sys.modules", swsscommon=swsscommon_test):
+    from bgpmon import bgpmon
+
+
+def summary_output(peers):
+    return json.dumps({
+        "ipv4Unicast": {"peers": dict((peer, {"state": state, "remoteAs": 65200, "localAs": 65100})
+                                      for peer, state in peers.items())},
+    })
+
+
+def get_state_get():
+    bgp_state_get = bgpmon.BgpStateGet()
+    bgp_state_get.flush_pipe = MagicMock()
+    return bgp_state_get
+
+
+def test_adjchange_re():
+    m = bgpmon.ADJCHANGE_RE.search("bgpd[44]: [M59KS-A3ZXZ] %ADJCHANGE: neighbor 10.0.0.57(ARISTA01T1) in vrf default Up")
+    assert m.groups() == ("10.0.0.57", "default")
+    m = bgpmon.ADJCHANGE_RE.search("%ADJCHANGE: neighbor fc00::72 Down Peer closed the session")
+    assert m.groups() == ("fc00::72", None)
+    assert bgpmon.ADJCHANGE_RE.search("%NOTIFICATION: sent to neighbor 10.0.0.57 4/0 (Hold Timer Expired)") is None
+
+
+def test_adjchange_watcher(tmp_path):
+    path = str(tmp_path / "bgpmon" / "adjchange.log")
+    watcher = bgpmon.AdjChangeWatcher(path)
+    assert os.path.isdir(os.path.dirname(path))
+    assert watcher.get_changed_peers() == set()
+
+    # The file is created by rsyslogd on the first message
+    with open(path, "w") as fp:
+        fp.write("%ADJCHANGE: neighbor 10.0.0.1(T1) in vrf default Up\n")
+        fp.write("%ADJCHANGE: neighbor 10.0.0.5(T1) in vrf Vrf_red Up\n")
+        fp.write("%ADJCHANGE: neighbor 10.0.0.9(T1) in vrf default Do")
+    assert watcher.wait(1)
+    assert watcher.get_changed_peers() == {"10.0.0.1"}
+
+    # A partial line is only reported once it is complete
+    with open(path, "a") as fp:
+        fp.write("wn Peer closed the session\n")
+    assert watcher.get_changed_peers() == {"10.0.0.9"}
+    assert watcher.get_changed_peers() == set()
+
+    # The file is emptied once it is read up to the maximum size
+    with patch.object(bgpmon, "ADJCHANGE_LOG_MAX_SIZE", 1):
+        assert watcher.get_changed_peers() == set()
+    assert os.path.getsize(path) == 0
+    with open(path, "a") as fp:
+        fp.write("%ADJCHANGE: neighbor 10.0.0.13(T1) in vrf default Up\n")
+    assert watcher.get_changed_peers() == {"10.0.0.13"}
+
+    # The file is replaced
+    os.rename(path, path + ".1")
+    with open(path, "w") as fp:
+        fp.write("%ADJCHANGE: neighbor 10.0.0.17(T1) in vrf default Up\n")
+    assert watcher.get_changed_peers() == {"10.0.0.17"}
+
+
+@patch.object(bgpmon, "getstatusoutput_noshell")
+def test_update_changed_neigh_states(mock_run):
+    bgp_state_get = get_state_get()
+    mock_run.return_value = (0, summary_output({"10.0.0.1": "Established", "10.0.0.5": "Active"}))
+    bgp_state_get.get_all_neigh_states()
+    bgp_state_get.update_neigh_states()
+    assert bgp_state_get.peer_state == {"10.0.0.1": "Established", "10.0.0.5": "Active"}
+    bgp_state_get.flush_pipe.reset_mock()
+
+    # Only the logged neighbor is read and updated
+    mock_run.return_value = (0, summary_output({"10.0.0.5": "Established"}))
+    assert bgp_state_get.update_changed_neigh_states({"10.0.0.5"})
+    mock_run.assert_called_with(["vtysh", "-c", "show bgp summary neighbor 10.0.0.5 json"])
+    bgp_state_get.flush_pipe.assert_called_once_with(
+        {"NEIGH_STATE_TABLE|10.0.0.5": {"state": "Established", "peerType": "e-BGP"}})
+    assert bgp_state_get.peer_state == {"10.0.0.1": "Established", "10.0.0.5": "Established"}
+
+    # No change of the state
+    bgp_state_get.flush_pipe.reset_mock()
+    assert bgp_state_get.update_changed_neigh_states({"10.0.0.5"})
+    bgp_state_get.flush_pipe.assert_not_called()
+
+    # A new neighbor is added
+    mock_run.return_value = (0, summary_output({"10.0.0.9": "Connect"}))
+    assert bgp_state_get.update_changed_neigh_states({"10.0.0.9"})
+    bgp_state_get.flush_pipe.assert_called_once_with(
+        {"NEIGH_STATE_TABLE|10.0.0.9": {"state": "Connect", "peerType": "e-BGP"}})
+    assert "10.0.0.9" in bgp_state_get.peer_l
+
+    # A neighbor which can't be read is left to the whole table check
+    mock_run.return_value = (0, json.dumps({"ipv4Unicast": {}}))
+    assert not bgp_state_get.update_changed_neigh_states({"10.0.0.13"})
+    mock_run.return_value = (1, "")
+    assert not bgp_state_get.update_changed_neigh_states({"10.0.0.1"})
+    assert bgp_state_get.peer_state["10.0.0.1"] == "Established"
@@ -1,6 +1,6 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from bgpcfgd.config import ConfigMgr
+from bgpcfgd.config import ConfigMgr, ConfigIndex
 
 
 def test_constructor():
@@ -37,6 +37,73 @@ def test_update():
     assert c.current_config_raw == [' text1', ' text2', ' text3', ' text4', '    ', '     ']
     assert c.current_config == [['text1'], ['text2'], ['text3'], ['text4']]
 
+@patch('bgpcfgd.config.time.monotonic')
+def test_update_reuses_config(mocked_monotonic):
+    mocked_monotonic.return_value = 100.0
+    frr = MagicMock()
+    frr.get_config = MagicMock(return_value="text1\n")
+    frr.write = MagicMock(return_value=True)
+    frr.restart_peer_groups = MagicMock(return_value=True)
+    c = ConfigMgr(frr, max_config_age=1.0)
+    c.update()
+    index = c.get_index()
+    mocked_monotonic.return_value = 100.5
+    c.update()
+    assert frr.get_config.call_count == 1
+    assert c.get_index() is index
+    # The config is read again after its own commit
+    c.push("text2")
+    c.commit()
+    assert c.get_text() is None
+    c.update()
+    assert frr.get_config.call_count == 2
+    # and after max_config_age, to see external changes
+    mocked_monotonic.return_value = 101.4
+    c.update()
+    assert frr.get_config.call_count == 2
+    mocked_monotonic.return_value = 101.6
+    c.update()
+    assert frr.get_config.call_count == 3
+    assert c.get_index() is not index
+
+def test_config_index():
+    index = ConfigIndex([
+        'ip prefix-list PL_V4 seq 10 deny 0.0.0.0/0 le 17',
+        'ip prefix-list PL_V4 seq 20 permit 20.20.30.0/24 le 32',
+        'ipv6 prefix-list PL_V4 seq 10 deny ::/0 le 59',
+        'bgp community-list standard COMMUNITY_1 permit 1010:2020',
+        'bgp community-list standard COMMUNITY_1 permit 1010:3030',
+        'router bgp 64601',
+        ' neighbor PEER_V4 peer-group',
+        ' neighbor PEER_V6  peer-group',
+        ' address-family ipv4 unicast',
+        '  neighbor PEER_V4 route-map FROM_BGP_PEER_V4 in',
+        '  neighbor PEER_V4 route-map TO_BGP_PEER_V4 out',
+        '  neighbor PEER_V4 route-map FROM_BGP_PEER_V4_2 in',
+        ' exit-address-family',
+        'exit',
+        'route-map RM permit 10',
+        ' match ip address prefix-list PL_V4',
+        ' call RM_CALL',
+        'exit',
+        'route-map RM deny 20',
+        'route-map RM permit 65535',
+        ' set community 123:123 additive',
+        '     ',
+    ])
+    assert index.get_prefix_list('ip', 'PL_V4') == ['deny 0.0.0.0/0 le 17', 'permit 20.20.30.0/24 le 32']
+    assert index.get_prefix_list('ipv6', 'PL_V4') == ['deny ::/0 le 59']
+    assert index.get_prefix_list('ipv6', 'PL_V6') is None
+    assert index.community_lists == {'COMMUNITY_1': '1010:2020'}
+    assert index.peer_groups == ['PEER_V4', 'PEER_V6']
+    assert index.neighbor_route_maps_in == {'PEER_V4': 'FROM_BGP_PEER_V4'}
+    assert index.get_route_map_entries('RM') == [
+        (10, ['match ip address prefix-list PL_V4', 'call RM_CALL']),
+        (65535, ['set community 123:123 additive', '']),
+    ]
+    assert index.get_route_map_entries('RM', 'deny') == [(20, [])]
+    assert index.get_route_map_entries('RM_CALL') == []
+
 def test_push_list():
     frr = MagicMock()
     c = ConfigMgr(frr)
@@ -68,6 +135,13 @@ def test_restart_peer_groups():
     c.restart_peer_groups(["pg_3", "pg_4"])
     assert c.peer_groups_to_restart == ["pg_1", "pg_2", "pg_3", "pg_4"]
 
+def test_restart_peer_groups_dedup():
+    frr = MagicMock()
+    c = ConfigMgr(frr)
+    c.restart_peer_groups(["pg_1", "pg_2"])
+    c.restart_peer_groups(["pg_2", "pg_3", "pg_1"])
+    assert c.peer_groups_to_restart == ["pg_1", "pg_2", "pg_3"]
+
 def test_commit_empty_changes():
     frr = MagicMock()
     c = ConfigMgr(frr)
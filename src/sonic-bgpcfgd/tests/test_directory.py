@@ -55,3 +55,34 @@ def test_directory(mocked_log_err):
     # Test remove_slot() with nonexist table
     directory.remove_slot("db_name", "table_nonexist")
     mocked_log_err.assert_called_with("Directory: Can't remove slot 'db_name__table_nonexist'. The slot doesn't exist")
+
+def test_directory_notify():
+    directory = Directory()
+    on_asn = MagicMock()
+    on_loopback = MagicMock()
+    on_slot = MagicMock()
+    directory.subscribe([("CONFIG_DB", "DEVICE_METADATA", "localhost/bgp_asn"),
+                         ("CONFIG_DB", "DEVICE_METADATA", "localhost/type")], on_asn)
+    directory.subscribe([("CONFIG_DB", "LOOPBACK_INTERFACE", "Loopback0")], on_loopback)
+    directory.subscribe([("LOCAL", "interfaces", "")], on_slot)
+
+    # A handler is run once, when one of its paths appears
+    directory.put("CONFIG_DB", "DEVICE_METADATA", "localhost", {"bgp_asn": "65100", "type": "LeafRouter"})
+    assert on_asn.call_count == 1
+    # and isn't run for changes of other entries, or for the same value
+    directory.put("CONFIG_DB", "DEVICE_METADATA", "other", {"bgp_asn": "65100"})
+    directory.put("CONFIG_DB", "DEVICE_METADATA", "localhost", {"bgp_asn": "65100", "type": "LeafRouter"})
+    assert on_asn.call_count == 1
+    directory.put("CONFIG_DB", "DEVICE_METADATA", "localhost", {"bgp_asn": "65200"})
+    assert on_asn.call_count == 2
+
+    # A change of a child key affects the paths of its parent entry
+    directory.put("CONFIG_DB", "LOOPBACK_INTERFACE", "Loopback0", {})
+    directory.put("CONFIG_DB", "LOOPBACK_INTERFACE", "Loopback0|10.1.0.32/32", {})
+    directory.put("CONFIG_DB", "LOOPBACK_INTERFACE", "Loopback1|10.1.0.33/32", {})
+    assert on_loopback.call_count == 2
+
+    # A path of the whole slot is affected by every key
+    directory.put("LOCAL", "interfaces", "Ethernet0|10.0.0.0/31", {})
+    directory.put("LOCAL", "interfaces", "Ethernet4|10.0.0.2/31", {})
+    assert on_slot.call_count == 2
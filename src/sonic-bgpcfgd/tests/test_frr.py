@@ -1,3 +1,5 @@
+import socket
+import threading
 from unittest.mock import patch
 import bgpcfgd.frr
 import pytest
@@ -66,3 +68,84 @@ def test_restart_peer_groups_fail(mocked_log_crit):
     res = f.restart_peer_groups(["pg_1", "pg_2"])
     assert not res, "Expect False return value"
     mocked_log_crit.assert_called_with("Can't restart bgp peer-group 'pg_2'. rc='1', out='some output', err='some error'")
+
+class FakeVtyDaemon(object):
+    """ vty socket server, which replies to every command from a map """
+    def __init__(self, path, replies, drop_after=()):
+        self.replies = replies
+        self.drop_after = drop_after
+        self.commands = []
+        self.connections = 0
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(path)
+        self.server.listen(1)
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            buf = b''
+            while True:
+                data = conn.recv(4096)
+                if not data:
+                    break
+                buf += data
+                while b'\0' in buf:
+                    command, buf = buf.split(b'\0', 1)
+                    command = command.decode()
+                    self.commands.append(command)
+                    rc, out = self.replies.get(command, (0, ""))
+                    conn.sendall(out.encode() + b'\0\0\0' + bytes([rc]))
+                    if command in self.drop_after:
+                        break
+                else:
+                    continue
+                break
+            conn.close()
+
+    def stop(self):
+        self.server.close()
+
+@pytest.fixture
+def vty_daemon(tmp_path):
+    bgpcfgd.frr.vty_clients.clear()
+    daemons = []
+    def start(replies, drop_after=()):
+        daemon = FakeVtyDaemon(str(tmp_path / "bgpd.vty"), replies, drop_after)
+        daemons.append(daemon)
+        return daemon
+    with patch('bgpcfgd.frr.VTY_SOCKET_PATH', str(tmp_path / "%s.vty")):
+        yield start
+    for daemon in daemons:
+        daemon.stop()
+    for client in bgpcfgd.frr.vty_clients.values():
+        client.close()
+    bgpcfgd.frr.vty_clients.clear()
+
+def test_vtysh_persistent_connection(vty_daemon):
+    bgpcfgd.frr.run_command = lambda cmd: pytest.fail("Unexpected vtysh process: %s" % cmd)
+    daemon = vty_daemon({"show running-config": (0, "router bgp 65100\n"), "clear bgp peer-group pg_2 soft in": (1, "% error")})
+    f = bgpcfgd.frr.FRR(["abc", "cde"])
+    assert f.get_config() == "router bgp 65100\n"
+    assert not f.restart_peer_groups(["pg_2", "pg_1"])
+    assert bgpcfgd.frr.vtysh("show bgp vrfs json") == (0, "", "")
+    assert daemon.connections == 1
+    assert daemon.commands == ["enable", "show running-config", "clear bgp peer-group pg_1 soft in",
+                               "clear bgp peer-group pg_2 soft in", "show bgp vrfs json"]
+
+def test_vtysh_reconnect(vty_daemon):
+    bgpcfgd.frr.run_command = lambda cmd: pytest.fail("Unexpected vtysh process: %s" % cmd)
+    daemon = vty_daemon({"show running-config": (0, "expected config")}, drop_after=["show version"])
+    assert bgpcfgd.frr.vtysh("show version") == (0, "", "")
+    # The daemon has closed the connection. The client reconnects to it
+    assert bgpcfgd.frr.vtysh("show running-config") == (0, "expected config", "")
+    assert daemon.connections == 2
+
+def test_vtysh_fallback(vty_daemon):
+    bgpcfgd.frr.run_command = lambda cmd: (0, "output of %s" % cmd, "")
+    assert bgpcfgd.frr.vtysh("show bgp vrfs json") == (0, "output of ['vtysh', '-c', 'show bgp vrfs json']", "")
@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock, patch
+
+import bgpcfgd.runner
+from bgpcfgd.runner import Runner
+
+
+class FakeSelect(object):
+    """ Select which returns one batch of messages per call, at the given time """
+    TIMEOUT = 1
+    ERROR = 2
+    OBJECT = 0
+
+    def __init__(self, subscriber, batches):
+        self.subscriber = subscriber
+        self.batches = list(batches)
+        self.timeouts = []
+        self.now = 0.0
+
+    def select(self, timeout):
+        self.timeouts.append(timeout)
+        if not self.batches:
+            bgpcfgd.runner.g_run = False
+            return self.TIMEOUT, None
+        self.now, batch = self.batches.pop(0)
+        if not batch:
+            return self.TIMEOUT, None
+        self.subscriber.messages.extend(batch)
+        return self.OBJECT, None
+
+
+class FakeSubscriber(object):
+    def __init__(self):
+        self.messages = []
+
+    def pop(self):
+        if self.messages:
+            return self.messages.pop(0)
+        return "", "", ()
+
+    def getDbConnector(self):
+        return MagicMock(getDbId=MagicMock(return_value=4))
+
+    def getTableName(self):
+        return "BGP_NEIGHBOR"
+
+
+def run_runner(batches, commit_window, commit_max_changes):
+    cfg_mgr = MagicMock()
+    cfg_mgr.commit = MagicMock(return_value=True)
+    subscriber = FakeSubscriber()
+    with patch('bgpcfgd.runner.swsscommon'):
+        runner = Runner(cfg_mgr, commit_window, commit_max_changes)
+    selector = FakeSelect(subscriber, batches)
+    runner.selector = selector
+    runner.subscribers = {subscriber}
+    handler = MagicMock()
+    runner.callbacks[4]["BGP_NEIGHBOR"].append(handler)
+    bgpcfgd.runner.g_run = True
+    with patch('bgpcfgd.runner.time.monotonic', side_effect=lambda: selector.now):
+        runner.run()
+    return cfg_mgr, handler, selector
+
+def msg(n):
+    return ("10.0.0.%d" % n, "SET", (("asn", "65100"),))
+
+def test_commit_every_wakeup_without_window():
+    cfg_mgr, handler, _ = run_runner([(0.0, [msg(1)]), (0.5, [msg(2), msg(3)])], 0.0, 1000)
+    assert handler.call_count == 3
+    assert cfg_mgr.commit.call_count == 2
+
+def test_commit_window():
+    # The changes of three wakeups inside of the window are committed together,
+    # when the window expires
+    batches = [(0.0, [msg(1)]), (0.05, [msg(2)]), (0.09, [msg(3)]), (0.1, None), (0.5, [msg(4)])]
+    cfg_mgr, handler, selector = run_runner(batches, 0.1, 1000)
+    assert handler.call_count == 4
+    assert cfg_mgr.commit.call_count == 1
+    assert selector.timeouts[:5] == [Runner.SELECT_TIMEOUT, 100, 50, 10, Runner.SELECT_TIMEOUT]
+
+def test_commit_max_changes():
+    batches = [(0.0, [msg(1), msg(2)]), (0.01, [msg(3), msg(4)]), (0.02, [msg(5)])]
+    cfg_mgr, handler, _ = run_runner(batches, 10.0, 2)
+    assert handler.call_count == 5
+    # Full batches are committed right away, the last change waits for the window
+    assert cfg_mgr.commit.call_count == 2
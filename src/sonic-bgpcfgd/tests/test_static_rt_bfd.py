@@ -5,10 +5,12 @@ from staticroutebfd.main import *
 from swsscommon import swsscommon
 
 @patch('swsscommon.swsscommon.DBConnector.__init__')
+@patch('swsscommon.swsscommon.RedisPipeline.__init__')
 @patch('swsscommon.swsscommon.ProducerStateTable.__init__')
 @patch('swsscommon.swsscommon.Table.__init__')
-def constructor(mock_db, mock_producer, mock_tbl):
+def constructor(mock_db, mock_pipeline, mock_producer, mock_tbl):
     mock_db.return_value = None
+    mock_pipeline.return_value = None
     mock_producer.return_value = None
     mock_tbl.return_value = None
 
@@ -164,3 +164,19 @@ def test_sentinel_pg():
 def test_sentinel_instance():
     test_data = load_tests("sentinels", "instance.conf")
     run_tests("sentinel_instance", *test_data)
+
+def test_compiled_template_cache(tmpdir, monkeypatch):
+    cache_dir = str(tmpdir.join("j2cache"))
+    monkeypatch.setenv("SONIC_J2_CACHE_DIR", cache_dir)
+    template_fname, tests = load_tests("general", "policies.conf")
+    _, param_fname, _ = tests[0]
+    params = load_json(param_fname)
+    expected = TemplateFabric(TEMPLATE_PATH).from_file(template_fname).render(params)
+    assert len(os.listdir(cache_dir)) == 1
+    # A new fabric loads the compiled template from the cache
+    assert TemplateFabric(TEMPLATE_PATH).from_file(template_fname).render(params) == expected
+    assert len(os.listdir(cache_dir)) == 1
+
+def test_compiled_template_cache_disabled(monkeypatch):
+    monkeypatch.setenv("SONIC_J2_CACHE_DIR", "")
+    assert TemplateFabric(TEMPLATE_PATH).env.bytecode_cache is None
@@ -0,0 +1,136 @@
+"""json_stream.py
+
+Incremental reading of large json config files.
+
+A config file is a json object of tables, and a table is an object of
+entries. iter_table_entries() parses such a file one entry at a time, so that
+the caller can merge each entry into its data as soon as it is read. Only a
+small window of the file text is kept in memory, instead of the whole text
+and a whole parsed copy of the config next to the merged data.
+"""
+
+import json
+import re
+
+READ_CHUNK_SIZE = 65536
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_OBJECT_START = re.compile(r'[ \t\n\r]*\{[ \t\n\r]*(\}?)')
+_FIRST_MEMBER = re.compile(r'[ \t\n\r]*"((?:[^"\\]|\\.)*)"[ \t\n\r]*:[ \t\n\r]*')
+_NEXT_MEMBER = re.compile(r'[ \t\n\r]*(?:(\})|,[ \t\n\r]*"((?:[^"\\]|\\.)*)"[ \t\n\r]*:[ \t\n\r]*)')
+_NUMBER_CHARS = '0123456789.eE+-'
+
+_decoder = json.JSONDecoder()
+
+
+class _Reader(object):
+    def __init__(self, stream, chunk_size):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def read_more(self, size):
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+        # Drop the text which was already parsed
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+
+    def match(self, pattern):
+        """
+        Match the pattern at the current position, reading more text while
+        the match might go on in the next chunk. Return None if there is no
+        match.
+        """
+        while True:
+            m = pattern.match(self.buf, self.pos)
+            if m is not None and (m.end() < len(self.buf) or self.eof):
+                return m
+            if self.eof:
+                return None
+            self.read_more(self.chunk_size)
+
+    def expect(self, pattern, what):
+        m = self.match(pattern)
+        if m is None:
+            raise ValueError("Expecting {} near '{}'".format(what, self.buf[self.pos:self.pos + 32]))
+        self.pos = m.end()
+        return m
+
+    def decode(self):
+        """
+        Parse the json value at the current position
+        """
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _decoder.scan_once(self.buf, self.pos)
+                # A number cut by the end of the buffer may go on in the next chunk
+                if self.eof or (end < len(self.buf) and self.buf[end] not in _NUMBER_CHARS):
+                    self.pos = end
+                    return value
+            except (StopIteration, ValueError):
+                pos = _WHITESPACE.match(self.buf, self.pos).end()
+                if pos != self.pos:
+                    self.pos = pos
+                    continue
+                if self.eof:
+                    raise ValueError("Invalid json value near '{}'".format(self.buf[self.pos:self.pos + 32]))
+            # Read more text, growing the reads so a large value is not
+            # parsed again for every chunk
+            self.read_more(size)
+            size *= 2
+
+    def iter_keys(self):
+        """
+        Iterate over the keys of the json object at the current position.
+        The caller parses the value of each key before asking for the next one.
+        """
+        if self.expect(_OBJECT_START, "'{'").group(1):
+            return
+        m = self.expect(_FIRST_MEMBER, "a string key")
+        while True:
+            key = m.group(m.lastindex)
+            if '\\' in key:
+                key = json.loads('"' + key + '"')
+            yield key
+
+            m = _NEXT_MEMBER.match(self.buf, self.pos)
+            if m is not None and m.end() < len(self.buf):
+                self.pos = m.end()
+            else:
+                m = self.expect(_NEXT_MEMBER, "',' or '}'")
+            if m.group(1):
+                return
+
+
+def iter_table_entries(stream, chunk_size=READ_CHUNK_SIZE):
+    """
+    Parse a json object of tables one table entry at a time.
+
+    Keyword arguments:
+    stream -- text stream holding a json object
+    chunk_size -- number of characters to read at a time
+
+    Return:
+        generator of (table, key, value) tuples, in the order of the stream.
+        A member of the object which is not an object itself, or an empty
+        object, is returned as (name, None, value). Raises ValueError if the
+        stream is not a json object.
+    """
+    reader = _Reader(stream, chunk_size)
+    for table in reader.iter_keys():
+        if reader.match(_OBJECT_START) is None:
+            yield table, None, reader.decode()
+            continue
+        empty = True
+        for key in reader.iter_keys():
+            empty = False
+            yield table, key, reader.decode()
+        if empty:
+            yield table, None, {}
+    if reader.match(_WHITESPACE).end() != len(reader.buf):
+        raise ValueError("Extra data after the json object")
@@ -79,6 +79,34 @@ acl_table_type_defination = {
 #
 ###############################################################################
 
+# Element tags in Clark notation, '{namespace}name', by (namespace, name).
+# Building them with QName on every lookup is a noticeable part of the parse
+# time of large minigraphs.
+_tags = {}
+
+def _tag(namespace, name):
+    tag = _tags.get((namespace, name))
+    if tag is None:
+        tag = str(QName(namespace, name))
+        _tags[(namespace, name)] = tag
+    return tag
+
+class ElementChildren(object):
+    """ Children of an element indexed by tag, for elements whose children
+    are looked up many times.
+    """
+    def __init__(self, element):
+        self.children = {}
+        for child in element:
+            self.children.setdefault(child.tag, []).append(child)
+
+    def find(self, tag):
+        children = self.children.get(tag)
+        return children[0] if children else None
+
+    def findall(self, tag):
+        return self.children.get(tag, [])
+
 class minigraph_encoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, (
@@ -88,6 +116,48 @@ class minigraph_encoder(json.JSONEncoder):
             return str(obj)
         return json.JSONEncoder.default(self, obj)
 
+class ParsedMinigraph(object):
+    """ Parsed minigraph tree shared by the parse_* helpers.
+
+    The top level sections (DpgDec, PngDec, MetadataDeclaration, ...) are
+    indexed by tag, and the asic metadata looked up by parse_asic_sub_role and
+    parse_asic_switch_type is remembered per asic.
+    """
+    def __init__(self, root):
+        self.root = root
+        self.sections = {}
+        for child in root:
+            self.sections.setdefault(child.tag, child)
+        self.asic_metas = {}
+
+    def find(self, tag):
+        return self.sections.get(tag)
+
+    def asic_meta(self, asic_name):
+        if asic_name not in self.asic_metas:
+            meta = self.find(_tag(ns, "MetadataDeclaration"))
+            self.asic_metas[asic_name] = parse_asic_meta(meta, asic_name) if meta is not None else None
+        return self.asic_metas[asic_name]
+
+# Parsed minigraph files, by path, with the file stamp they were parsed at
+_parsed_minigraphs = {}
+
+def parse_minigraph_file(filename):
+    """ Parse a minigraph xml file, reusing the tree of an earlier call as long
+    as the file was not modified since.
+    """
+    if not isinstance(filename, (str, UNICODE_TYPE)):
+        return ParsedMinigraph(ET.parse(filename).getroot())
+
+    path = os.path.realpath(filename)
+    st = os.stat(path)
+    stamp = (st.st_mtime, st.st_size, st.st_ino)
+    cached = _parsed_minigraphs.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, ParsedMinigraph(ET.parse(path).getroot()))
+        _parsed_minigraphs[path] = cached
+    return cached[1]
+
 def exec_cmd(cmd):
     p = subprocess.Popen(cmd, shell=False, stdout=subprocess.PIPE)
     outs, errs = p.communicate()
@@ -124,29 +194,29 @@ def parse_device(device):
     d_subtype = None
 
     for node in device:
-        if node.tag == str(QName(ns, "Address")):
-            lo_prefix = node.find(str(QName(ns2, "IPPrefix"))).text
-        elif node.tag == str(QName(ns, "AddressV6")):
-            lo_prefix_v6 = node.find(str(QName(ns2, "IPPrefix"))).text
-        elif node.tag == str(QName(ns, "ManagementAddress")):
-            mgmt_prefix = node.find(str(QName(ns2, "IPPrefix"))).text
-        elif node.tag == str(QName(ns, "ManagementAddressV6")):
-            mgmt_prefix_v6 = node.find(str(QName(ns2, "IPPrefix"))).text
-        elif node.tag == str(QName(ns, "Hostname")):
+        if node.tag == _tag(ns, "Address"):
+            lo_prefix = node.find(_tag(ns2, "IPPrefix")).text
+        elif node.tag == _tag(ns, "AddressV6"):
+            lo_prefix_v6 = node.find(_tag(ns2, "IPPrefix")).text
+        elif node.tag == _tag(ns, "ManagementAddress"):
+            mgmt_prefix = node.find(_tag(ns2, "IPPrefix")).text
+        elif node.tag == _tag(ns, "ManagementAddressV6"):
+            mgmt_prefix_v6 = node.find(_tag(ns2, "IPPrefix")).text
+        elif node.tag == _tag(ns, "Hostname"):
             name = node.text
-        elif node.tag == str(QName(ns, "HwSku")):
+        elif node.tag == _tag(ns, "HwSku"):
             hwsku = node.text
-        elif node.tag == str(QName(ns, "DeploymentId")):
+        elif node.tag == _tag(ns, "DeploymentId"):
             deployment_id = node.text
-        elif node.tag == str(QName(ns, "ElementType")):
+        elif node.tag == _tag(ns, "ElementType"):
             d_type = node.text
-        elif node.tag == str(QName(ns, "ClusterName")):
+        elif node.tag == _tag(ns, "ClusterName"):
             cluster = node.text
-        elif node.tag == str(QName(ns, "SubType")):
+        elif node.tag == _tag(ns, "SubType"):
             d_subtype = node.text
 
-    if d_type is None and str(QName(ns3, "type")) in device.attrib:
-        d_type = device.attrib[str(QName(ns3, "type"))]
+    if d_type is None and _tag(ns3, "type") in device.attrib:
+        d_type = device.attrib[_tag(ns3, "type")]
 
     return (lo_prefix, lo_prefix_v6, mgmt_prefix, mgmt_prefix_v6, name, hwsku, d_type, deployment_id, cluster, d_subtype)
 
@@ -231,16 +301,18 @@ def parse_png(png, hname, dpg_ecmp_content = None):
     NEIGH = {}
 
     for child in png:
-        if child.tag == str(QName(ns, "DeviceInterfaceLinks")):
-            for link in child.findall(str(QName(ns, "DeviceLinkBase"))):
-                linktype = link.find(str(QName(ns, "ElementType"))).text
+        if child.tag == _tag(ns, "DeviceInterfaceLinks"):
+            for link in child.findall(_tag(ns, "DeviceLinkBase")):
+                link_fields = ElementChildren(link)
+                linktype = link_fields.find(_tag(ns, "ElementType")).text
                 if linktype == "DeviceSerialLink":
-                    enddevice = link.find(str(QName(ns, "EndDevice"))).text
-                    endport = link.find(str(QName(ns, "EndPort"))).text
-                    startdevice = link.find(str(QName(ns, "StartDevice"))).text
-                    startport = link.find(str(QName(ns, "StartPort"))).text
-                    baudrate = link.find(str(QName(ns, "Bandwidth"))).text
-                    flowcontrol = 1 if link.find(str(QName(ns, "FlowControl"))) is not None and link.find(str(QName(ns, "FlowControl"))).text == 'true' else 0
+                    enddevice = link_fields.find(_tag(ns, "EndDevice")).text
+                    endport = link_fields.find(_tag(ns, "EndPort")).text
+                    startdevice = link_fields.find(_tag(ns, "StartDevice")).text
+                    startport = link_fields.find(_tag(ns, "StartPort")).text
+                    baudrate = link_fields.find(_tag(ns, "Bandwidth")).text
+                    flowcontrol_node = link_fields.find(_tag(ns, "FlowControl"))
+                    flowcontrol = 1 if flowcontrol_node is not None and flowcontrol_node.text == 'true' else 0
                     if enddevice.lower() == hname.lower() and endport.isdigit():
                         console_ports[endport] = {
                             'remote_device': startdevice,
@@ -256,18 +328,18 @@ def parse_png(png, hname, dpg_ecmp_content = None):
                     continue
 
                 if linktype == "DeviceInterfaceLink":
-                    endport = link.find(str(QName(ns, "EndPort"))).text
-                    startdevice = link.find(str(QName(ns, "StartDevice"))).text
+                    endport = link_fields.find(_tag(ns, "EndPort")).text
+                    startdevice = link_fields.find(_tag(ns, "StartDevice")).text
                     port_device_map[endport] = startdevice
 
                 if linktype != "DeviceInterfaceLink" and linktype != "UnderlayInterfaceLink" and linktype != "DeviceMgmtLink":
                     continue
 
-                enddevice = link.find(str(QName(ns, "EndDevice"))).text
-                endport = link.find(str(QName(ns, "EndPort"))).text
-                startdevice = link.find(str(QName(ns, "StartDevice"))).text
-                startport = link.find(str(QName(ns, "StartPort"))).text
-                bandwidth_node = link.find(str(QName(ns, "Bandwidth")))
+                enddevice = link_fields.find(_tag(ns, "EndDevice")).text
+                endport = link_fields.find(_tag(ns, "EndPort")).text
+                startdevice = link_fields.find(_tag(ns, "StartDevice")).text
+                startport = link_fields.find(_tag(ns, "StartPort")).text
+                bandwidth_node = link_fields.find(_tag(ns, "Bandwidth"))
                 bandwidth = bandwidth_node.text if bandwidth_node is not None else None
                 if enddevice.lower() == hname.lower():
                     if endport in port_alias_map:
@@ -284,8 +356,8 @@ def parse_png(png, hname, dpg_ecmp_content = None):
                     if bandwidth:
                         port_speeds[startport] = bandwidth
 
-        if child.tag == str(QName(ns, "Devices")):
-            for device in child.findall(str(QName(ns, "Device"))):
+        if child.tag == _tag(ns, "Devices"):
+            for device in child.findall(_tag(ns, "Device")):
                 (lo_prefix, lo_prefix_v6, mgmt_prefix, mgmt_prefix_v6, name, hwsku, d_type, deployment_id, cluster, d_subtype) = parse_device(device)
                 device_data = {}
                 if hwsku != None:
@@ -308,29 +380,29 @@ def parse_png(png, hname, dpg_ecmp_content = None):
                     device_data['subtype'] = d_subtype
                 devices[name] = device_data
 
-        if child.tag == str(QName(ns, "DeviceInterfaceLinks")):
-            for if_link in child.findall(str(QName(ns, 'DeviceLinkBase'))):
-                if str(QName(ns3, "type")) in if_link.attrib:
-                    link_type = if_link.attrib[str(QName(ns3, "type"))]
+        if child.tag == _tag(ns, "DeviceInterfaceLinks"):
+            for if_link in child.findall(_tag(ns, 'DeviceLinkBase')):
+                if _tag(ns3, "type") in if_link.attrib:
+                    link_type = if_link.attrib[_tag(ns3, "type")]
                     if link_type == 'DeviceSerialLink':
                         for node in if_link:
-                            if node.tag == str(QName(ns, "EndPort")):
+                            if node.tag == _tag(ns, "EndPort"):
                                 console_port = node.text.split()[-1]
-                            elif node.tag == str(QName(ns, "EndDevice")):
+                            elif node.tag == _tag(ns, "EndDevice"):
                                 console_dev = node.text
                     elif link_type == 'DeviceMgmtLink':
                         for node in if_link:
-                            if node.tag == str(QName(ns, "EndPort")):
+                            if node.tag == _tag(ns, "EndPort"):
                                 mgmt_port = node.text.split()[-1]
-                            elif node.tag == str(QName(ns, "EndDevice")):
+                            elif node.tag == _tag(ns, "EndDevice"):
                                 mgmt_dev = node.text
 
 
-        if child.tag == str(QName(ns, "DeviceInterfaceLinks")):
-            for link in child.findall(str(QName(ns, 'DeviceLinkBase'))):
-                if link.find(str(QName(ns, "ElementType"))).text == "LogicalLink":
-                    intf_name = link.find(str(QName(ns, "EndPort"))).text
-                    start_device = link.find(str(QName(ns, "StartDevice"))).text
+        if child.tag == _tag(ns, "DeviceInterfaceLinks"):
+            for link in child.findall(_tag(ns, 'DeviceLinkBase')):
+                if link.find(_tag(ns, "ElementType")).text == "LogicalLink":
+                    intf_name = link.find(_tag(ns, "EndPort")).text
+                    start_device = link.find(_tag(ns, "StartDevice")).text
                     if intf_name in port_alias_map:
                         intf_name = port_alias_map[intf_name]
 
@@ -351,11 +423,11 @@ def parse_png(png, hname, dpg_ecmp_content = None):
 def parse_asic_external_link(link, asic_name, hostname):
     neighbors = {}
     port_speeds = {}
-    enddevice = link.find(str(QName(ns, "EndDevice"))).text
-    endport = link.find(str(QName(ns, "EndPort"))).text
-    startdevice = link.find(str(QName(ns, "StartDevice"))).text
-    startport = link.find(str(QName(ns, "StartPort"))).text
-    bandwidth_node = link.find(str(QName(ns, "Bandwidth")))
+    enddevice = link.find(_tag(ns, "EndDevice")).text
+    endport = link.find(_tag(ns, "EndPort")).text
+    startdevice = link.find(_tag(ns, "StartDevice")).text
+    startport = link.find(_tag(ns, "StartPort")).text
+    bandwidth_node = link.find(_tag(ns, "Bandwidth"))
     bandwidth = bandwidth_node.text if bandwidth_node is not None else None
     # if chassis internal is false, the interface name will be
     # interface alias which should be converted to asic port name
@@ -377,11 +449,11 @@ def parse_asic_external_link(link, asic_name, hostname):
 def parse_asic_internal_link(link, asic_name, hostname):
     neighbors = {}
     port_speeds = {}
-    enddevice = link.find(str(QName(ns, "EndDevice"))).text
-    endport = link.find(str(QName(ns, "EndPort"))).text
-    startdevice = link.find(str(QName(ns, "StartDevice"))).text
-    startport = link.find(str(QName(ns, "StartPort"))).text
-    bandwidth_node = link.find(str(QName(ns, "Bandwidth")))
+    enddevice = link.find(_tag(ns, "EndDevice")).text
+    endport = link.find(_tag(ns, "EndPort")).text
+    startdevice = link.find(_tag(ns, "StartDevice")).text
+    startport = link.find(_tag(ns, "StartPort")).text
+    bandwidth_node = link.find(_tag(ns, "Bandwidth"))
     bandwidth = bandwidth_node.text if bandwidth_node is not None else None
     if ((enddevice.lower() == asic_name.lower()) and
             (startdevice.lower() != hostname.lower())):
@@ -405,13 +477,13 @@ def parse_asic_png(png, asic_name, hostname):
     devices = {}
     port_speeds = {}
     for child in png:
-        if child.tag == str(QName(ns, "DeviceInterfaceLinks")):
-            for link in child.findall(str(QName(ns, "DeviceLinkBase"))):
+        if child.tag == _tag(ns, "DeviceInterfaceLinks"):
+            for link in child.findall(_tag(ns, "DeviceLinkBase")):
                 # Chassis internal node is used in multi-asic device or chassis minigraph
                 # where the minigraph will contain the internal asic connectivity and
                 # external neighbor information. The ChassisInternal node will be used to
                 # determine if the link is internal to the device or chassis.
-                chassis_internal_node = link.find(str(QName(ns, "ChassisInternal")))
+                chassis_internal_node = link.find(_tag(ns, "ChassisInternal"))
                 chassis_internal = chassis_internal_node.text if chassis_internal_node is not None else "false"
 
                 # If the link is an external link include the external neighbor
@@ -425,8 +497,8 @@ def parse_asic_png(png, asic_name, hostname):
                     neighbors.update(int_neighbors)
                     port_speeds.update(int_port_speeds)
 
-        if child.tag == str(QName(ns, "Devices")):
-            for device in child.findall(str(QName(ns, "Device"))):
+        if child.tag == _tag(ns, "Devices"):
+            for device in child.findall(_tag(ns, "Device")):
                 (lo_prefix, lo_prefix_v6, mgmt_prefix, mgmt_prefix_v6, name, hwsku, d_type, deployment_id, cluster, _) = parse_device(device)
                 device_data = {}
                 if hwsku != None:
@@ -451,11 +523,11 @@ def parse_asic_png(png, asic_name, hostname):
 
 
 def parse_loopback_intf(child):
-    lointfs = child.find(str(QName(ns, "LoopbackIPInterfaces")))
+    lointfs = child.find(_tag(ns, "LoopbackIPInterfaces"))
     lo_intfs = {}
-    for lointf in lointfs.findall(str(QName(ns1, "LoopbackIPInterface"))):
-        intfname = lointf.find(str(QName(ns, "AttachTo"))).text
-        ipprefix = lointf.find(str(QName(ns1, "PrefixStr"))).text
+    for lointf in lointfs.findall(_tag(ns1, "LoopbackIPInterface")):
+        intfname = lointf.find(_tag(ns, "AttachTo")).text
+        ipprefix = lointf.find(_tag(ns1, "PrefixStr")).text
         lo_intfs[(intfname, ipprefix)] = {}
     return lo_intfs
 
@@ -483,96 +555,99 @@ def parse_dpg(dpg, hname):
     tunnelintfs_qos_remap_config = defaultdict(dict)
 
     for child in dpg:
+        children = ElementChildren(child)
         """
             In Multi-NPU platforms the acl intfs are defined only for the host not for individual asic.
             There is just one aclintf node in the minigraph
             Get the aclintfs node first.
         """
-        if not aclintfs and child.find(str(QName(ns, "AclInterfaces"))) is not None and child.find(str(QName(ns, "AclInterfaces"))).findall(str(QName(ns, "AclInterface"))):
-            aclintfs = child.find(str(QName(ns, "AclInterfaces"))).findall(str(QName(ns, "AclInterface")))
+        aclintfs_node = children.find(_tag(ns, "AclInterfaces"))
+        if not aclintfs and aclintfs_node is not None:
+            aclintfs = aclintfs_node.findall(_tag(ns, "AclInterface"))
         """
             In Multi-NPU platforms the mgmt intfs are defined only for the host not for individual asic
             There is just one mgmtintf node in the minigraph
             Get the mgmtintfs node first. We need mgmt intf to get mgmt ip in per asic dockers.
         """
-        if not mgmtintfs and child.find(str(QName(ns, "ManagementIPInterfaces"))) is not None and  child.find(str(QName(ns, "ManagementIPInterfaces"))).findall(str(QName(ns1, "ManagementIPInterface"))):
-            mgmtintfs = child.find(str(QName(ns, "ManagementIPInterfaces"))).findall(str(QName(ns1, "ManagementIPInterface")))
-        hostname = child.find(str(QName(ns, "Hostname")))
+        mgmtintfs_node = children.find(_tag(ns, "ManagementIPInterfaces"))
+        if not mgmtintfs and mgmtintfs_node is not None:
+            mgmtintfs = mgmtintfs_node.findall(_tag(ns1, "ManagementIPInterface"))
+        hostname = children.find(_tag(ns, "Hostname"))
         if hostname.text.lower() != hname.lower():
             continue
 
         vni = vni_default
-        vni_element = child.find(str(QName(ns, "VNI")))
+        vni_element = children.find(_tag(ns, "VNI"))
         if vni_element != None:
             if vni_element.text.isdigit():
                 vni = int(vni_element.text)
             else:
                 print("VNI must be an integer (use default VNI %d instead)" % vni_default, file=sys.stderr)
 
-        ipintfs = child.find(str(QName(ns, "IPInterfaces")))
+        ipintfs = children.find(_tag(ns, "IPInterfaces"))
         intfs = {}
         ip_intfs_map = {}
-        for ipintf in ipintfs.findall(str(QName(ns, "IPInterface"))):
-            intfalias = ipintf.find(str(QName(ns, "AttachTo"))).text
+        for ipintf in ipintfs.findall(_tag(ns, "IPInterface")):
+            intfalias = ipintf.find(_tag(ns, "AttachTo")).text
             intfname = port_alias_map.get(intfalias, intfalias)
-            ipprefix = ipintf.find(str(QName(ns, "Prefix"))).text
+            ipprefix = ipintf.find(_tag(ns, "Prefix")).text
             intfs[(intfname, ipprefix)] = {}
             ip_intfs_map[ipprefix] = intfalias
         lo_intfs = parse_loopback_intf(child)
 
-        subintfs = child.find(str(QName(ns, "SubInterfaces")))
+        subintfs = children.find(_tag(ns, "SubInterfaces"))
         if subintfs is not None:
-            for subintf in subintfs.findall(str(QName(ns, "SubInterface"))):
-                intfalias = subintf.find(str(QName(ns, "AttachTo"))).text
+            for subintf in subintfs.findall(_tag(ns, "SubInterface")):
+                intfalias = subintf.find(_tag(ns, "AttachTo")).text
                 intfname = port_alias_map.get(intfalias, intfalias)
-                ipprefix = subintf.find(str(QName(ns, "Prefix"))).text
-                subintfvlan = subintf.find(str(QName(ns, "Vlan"))).text
+                ipprefix = subintf.find(_tag(ns, "Prefix")).text
+                subintfvlan = subintf.find(_tag(ns, "Vlan")).text
                 subintfname = intfname + VLAN_SUB_INTERFACE_SEPARATOR + subintfvlan
                 intfs[(subintfname, ipprefix)] = {}
 
-        mvrfConfigs = child.find(str(QName(ns, "MgmtVrfConfigs")))
+        mvrfConfigs = children.find(_tag(ns, "MgmtVrfConfigs"))
         mvrf = {}
         if mvrfConfigs != None:
-            mv = mvrfConfigs.find(str(QName(ns1, "MgmtVrfGlobal")))
+            mv = mvrfConfigs.find(_tag(ns1, "MgmtVrfGlobal"))
             if mv != None:
-                mvrf_en_flag = mv.find(str(QName(ns, "mgmtVrfEnabled"))).text
+                mvrf_en_flag = mv.find(_tag(ns, "mgmtVrfEnabled")).text
                 mvrf["vrf_global"] = {"mgmtVrfEnabled": mvrf_en_flag}
 
         mgmt_intf = {}
         for mgmtintf in mgmtintfs:
-            intfname = mgmtintf.find(str(QName(ns, "AttachTo"))).text
-            ipprefix = mgmtintf.find(str(QName(ns1, "PrefixStr"))).text
+            intfname = mgmtintf.find(_tag(ns, "AttachTo")).text
+            ipprefix = mgmtintf.find(_tag(ns1, "PrefixStr")).text
             mgmtipn = ipaddress.ip_network(UNICODE_TYPE(ipprefix), False)
             gwaddr = ipaddress.ip_address(next(mgmtipn.hosts()))
             mgmt_intf[(intfname, ipprefix)] = {'gwaddr': gwaddr}
 
-        voqinbandintfs = child.find(str(QName(ns, "VoqInbandInterfaces")))
+        voqinbandintfs = children.find(_tag(ns, "VoqInbandInterfaces"))
         voq_inband_intfs = {}
         if voqinbandintfs:
-            for voqintf in voqinbandintfs.findall(str(QName(ns1, "VoqInbandInterface"))):
-                intfname = voqintf.find(str(QName(ns, "Name"))).text
-                intftype = voqintf.find(str(QName(ns, "Type"))).text
-                ipprefix = voqintf.find(str(QName(ns1, "PrefixStr"))).text
+            for voqintf in voqinbandintfs.findall(_tag(ns1, "VoqInbandInterface")):
+                intfname = voqintf.find(_tag(ns, "Name")).text
+                intftype = voqintf.find(_tag(ns, "Type")).text
+                ipprefix = voqintf.find(_tag(ns1, "PrefixStr")).text
                 if intfname not in voq_inband_intfs:
                    voq_inband_intfs[intfname] = {'inband_type': intftype}
                 voq_inband_intfs["%s|%s" % (intfname, ipprefix)] = {}
 
-        pcintfs = child.find(str(QName(ns, "PortChannelInterfaces")))
+        pcintfs = children.find(_tag(ns, "PortChannelInterfaces"))
         pc_intfs = []
         pcs = {}
         pc_members = {}
         intfs_inpc = [] # List to hold all the LAG member interfaces
-        for pcintf in pcintfs.findall(str(QName(ns, "PortChannel"))):
-            pcintfname = pcintf.find(str(QName(ns, "Name"))).text
-            pcintfmbr = pcintf.find(str(QName(ns, "AttachTo"))).text
+        for pcintf in pcintfs.findall(_tag(ns, "PortChannel")):
+            pcintfname = pcintf.find(_tag(ns, "Name")).text
+            pcintfmbr = pcintf.find(_tag(ns, "AttachTo")).text
             pcmbr_list = pcintfmbr.split(';')
             pc_intfs.append(pcintfname)
             for i, member in enumerate(pcmbr_list):
                 pcmbr_list[i] = port_alias_map.get(member, member)
                 intfs_inpc.append(pcmbr_list[i])
                 pc_members[(pcintfname, pcmbr_list[i])] = {}
-            if pcintf.find(str(QName(ns, "Fallback"))) != None:
-                pcs[pcintfname] = {'fallback': pcintf.find(str(QName(ns, "Fallback"))).text, 'min_links': str(int(math.ceil(len() * 0.75))), 'lacp_key': 'auto'}
+            if pcintf.find(_tag(ns, "Fallback")) != None:
+                pcs[pcintfname] = {'fallback': pcintf.find(_tag(ns, "Fallback")).text, 'min_links': str(int(math.ceil(len() * 0.75))), 'lacp_key': 'auto'}
             else:
                 pcs[pcintfname] = {'min_links': str(int(math.ceil(len(pcmbr_list) * 0.75))), 'lacp_key': 'auto' }
         port_nhipv4_map = {}
@@ -581,26 +656,26 @@ def parse_dpg(dpg, hname):
         nhportlist = []
         dpg_ecmp_content = {}
         static_routes = {}
-        ipnhs = child.find(str(QName(ns, "IPNextHops")))
+        ipnhs = children.find(_tag(ns, "IPNextHops"))
         if ipnhs is not None:
-            for ipnh in ipnhs.findall(str(QName(ns, "IPNextHop"))):
-                if ipnh.find(str(QName(ns, "Type"))).text == 'FineGrainedECMPGroupMember':
-                    ipnhfmbr = ipnh.find(str(QName(ns, "AttachTo"))).text
-                    ipnhaddr = ipnh.find(str(QName(ns, "Address"))).text
+            for ipnh in ipnhs.findall(_tag(ns, "IPNextHop")):
+                if ipnh.find(_tag(ns, "Type")).text == 'FineGrainedECMPGroupMember':
+                    ipnhfmbr = ipnh.find(_tag(ns, "AttachTo")).text
+                    ipnhaddr = ipnh.find(_tag(ns, "Address")).text
                     nhportlist.append(ipnhfmbr)
                     if "." in ipnhaddr:
                         port_nhipv4_map[ipnhfmbr] = ipnhaddr
                     elif ":" in ipnhaddr:
                         port_nhipv6_map[ipnhfmbr] = ipnhaddr
-                elif ipnh.find(str(QName(ns, "Type"))).text == 'StaticRoute':
-                    prefix = ipnh.find(str(QName(ns, "Address"))).text
+                elif ipnh.find(_tag(ns, "Type")).text == 'StaticRoute':
+                    prefix = ipnh.find(_tag(ns, "Address")).text
                     ifname = []
                     nexthop = []
-                    for nexthop_tuple in ipnh.find(str(QName(ns, "AttachTo"))).text.split(";"):
+                    for nexthop_tuple in ipnh.find(_tag(ns, "AttachTo")).text.split(";"):
                         ifname.append(nexthop_tuple.split(",")[0])
                         nexthop.append(nexthop_tuple.split(",")[1])
-                    if ipnh.find(str(QName(ns, "Advertise"))):
-                       advertise = ipnh.find(str(QName(ns, "Advertise"))).text
+                    if ipnh.find(_tag(ns, "Advertise")):
+                       advertise = ipnh.find(_tag(ns, "Advertise")).text
                     else:
                         advertise = "false"
                     if '/' not in prefix:
@@ -624,30 +699,30 @@ def parse_dpg(dpg, hname):
                 dpg_ecmp_content['ipv4'] = ipv4_content
                 dpg_ecmp_content['ipv6'] = ipv6_content
 
-        vlanintfs = child.find(str(QName(ns, "VlanInterfaces")))
+        vlanintfs = children.find(_tag(ns, "VlanInterfaces"))
         vlans = {}
         vlan_members = {}
         vlan_member_list = {}
         dhcp_relay_table = {}
         # Dict: vlan member (port/PortChannel) -> set of VlanID, in which the member if an untagged vlan member
         untagged_vlan_mbr = defaultdict(set)
-        for vintf in vlanintfs.findall(str(QName(ns, "VlanInterface"))):
-            vlanid = vintf.find(str(QName(ns, "VlanID"))).text
-            vlantype = vintf.find(str(QName(ns, "Type")))
+        for vintf in vlanintfs.findall(_tag(ns, "VlanInterface")):
+            vlanid = vintf.find(_tag(ns, "VlanID")).text
+            vlantype = vintf.find(_tag(ns, "Type"))
             if vlantype is None:
                 vlantype_name = ""
             else:
                 vlantype_name = vlantype.text
-            vintfmbr = vintf.find(str(QName(ns, "AttachTo"))).text
+            vintfmbr = vintf.find(_tag(ns, "AttachTo")).text
             vmbr_list = vintfmbr.split(';')
             if vlantype_name != "Tagged":
                 for member in vmbr_list:
                     untagged_vlan_mbr[member].add(vlanid)
-        for vintf in vlanintfs.findall(str(QName(ns, "VlanInterface"))):
-            vintfname = vintf.find(str(QName(ns, "Name"))).text
-            vlanid = vintf.find(str(QName(ns, "VlanID"))).text
-            vintfmbr = vintf.find(str(QName(ns, "AttachTo"))).text
-            vlantype = vintf.find(str(QName(ns, "Type")))
+        for vintf in vlanintfs.findall(_tag(ns, "VlanInterface")):
+            vintfname = vintf.find(_tag(ns, "Name")).text
+            vlanid = vintf.find(_tag(ns, "VlanID")).text
+            vintfmbr = vintf.find(_tag(ns, "AttachTo")).text
+            vlantype = vintf.find(_tag(ns, "Type"))
             if vlantype is None:
                 vlantype_name = ""
             else:
@@ -668,13 +743,13 @@ def parse_dpg(dpg, hname):
 
             # If this VLAN requires a DHCP relay agent, it will contain a <DhcpRelays> element
             # containing a list of DHCP server IPs
-            vintf_node = vintf.find(str(QName(ns, "DhcpRelays")))
+            vintf_node = vintf.find(_tag(ns, "DhcpRelays"))
             if vintf_node is not None and vintf_node.text is not None:
                 vintfdhcpservers = vintf_node.text
                 vdhcpserver_list = vintfdhcpservers.split(';')
                 vlan_attributes['dhcp_servers'] = vdhcpserver_list
 
-            vintf_node = vintf.find(str(QName(ns, "Dhcpv6Relays")))
+            vintf_node = vintf.find(_tag(ns, "Dhcpv6Relays"))
             if vintf_node is not None and vintf_node.text is not None:
                 vintfdhcpservers = vintf_node.text
                 vdhcpserver_list = vintfdhcpservers.split(';')
@@ -683,11 +758,11 @@ def parse_dpg(dpg, hname):
                 sonic_vlan_member_name = "Vlan%s" % (vlanid)
                 dhcp_relay_table[sonic_vlan_member_name] = dhcp_attributes
 
-            vlanmac = vintf.find(str(QName(ns, "MacAddress")))
+            vlanmac = vintf.find(_tag(ns, "MacAddress"))
             if vlanmac is not None and vlanmac.text is not None:
                 vlan_attributes['mac'] = vlanmac.text
 
-            vintf_node = vintf.find(str(QName(ns, "SecondarySubnets")))
+            vintf_node = vintf.find(_tag(ns, "SecondarySubnets"))
             if vintf_node is not None and vintf_node.text is not None:
                 subnets = vintf_node.text.split(';')
                 for subnet in subnets:
@@ -705,15 +780,15 @@ def parse_dpg(dpg, hname):
             vlan_member_list[sonic_vlan_name] = vmbr_list
 
         for aclintf in aclintfs:
-            if aclintf.find(str(QName(ns, "InAcl"))) is not None:
-                aclname = aclintf.find(str(QName(ns, "InAcl"))).text.upper().replace(" ", "_").replace("-", "_")
+            if aclintf.find(_tag(ns, "InAcl")) is not None:
+                aclname = aclintf.find(_tag(ns, "InAcl")).text.upper().replace(" ", "_").replace("-", "_")
                 stage = "ingress"
-            elif aclintf.find(str(QName(ns, "OutAcl"))) is not None:
-                aclname = aclintf.find(str(QName(ns, "OutAcl"))).text.upper().replace(" ", "_").replace("-", "_")
+            elif aclintf.find(_tag(ns, "OutAcl")) is not None:
+                aclname = aclintf.find(_tag(ns, "OutAcl")).text.upper().replace(" ", "_").replace("-", "_")
                 stage = "egress"
             else:
                 sys.exit("Error: 'AclInterface' must contain either an 'InAcl' or 'OutAcl' subelement.")
-            aclattach = aclintf.find(str(QName(ns, "AttachTo"))).text.split(';')
+            aclattach = aclintf.find(_tag(ns, "AttachTo")).text.split(';')
             acl_intfs = []
             is_bmc_data = False
             is_bmc_data_v6 = False
@@ -799,7 +874,7 @@ def parse_dpg(dpg, hname):
                         if panel_port not in intfs_inpc and panel_port not in acl_intfs:
                             acl_intfs.append(panel_port)
                     break
-            if aclintf.find(str(QName(ns, "Type"))) is not None and aclintf.find(str(QName(ns, "Type"))).text.upper() == "BMCDATA":
+            if aclintf.find(_tag(ns, "Type")) is not None and aclintf.find(_tag(ns, "Type")).text.upper() == "BMCDATA":
                 if 'v6' in aclname.lower():
                     is_bmc_data_v6 = True
                     acl_table_types['BMCDATAV6'] = acl_table_type_defination['BMCDATAV6']
@@ -835,7 +910,7 @@ def parse_dpg(dpg, hname):
             else:
                 # This ACL has no interfaces to attach to -- consider this a control plane ACL
                 try:
-                    aclservice = aclintf.find(str(QName(ns, "Type"))).text
+                    aclservice = aclintf.find(_tag(ns, "Type")).text
 
                     # If we already have an ACL with this name and this ACL is bound to a different service,
                     # append the service to our list of services
@@ -855,7 +930,7 @@ def parse_dpg(dpg, hname):
                     print("Warning: Ignoring Control Plane ACL %s without type" % aclname, file=sys.stderr)
 
 
-        mg_tunnels = child.find(str(QName(ns, "TunnelInterfaces")))
+        mg_tunnels = children.find(_tag(ns, "TunnelInterfaces"))
         if mg_tunnels is not None:
             table_key_to_mg_key_map = {"encap_ecn_mode": "EcnEncapsulationMode",
                                        "ecn_mode": "EcnDecapsulationMode",
@@ -868,7 +943,7 @@ def parse_dpg(dpg, hname):
                                        "encap_tc_to_queue_map": "EncapTcToQueueMap",
                                        "encap_tc_to_dscp_map": "EncapTcToDscpMap"}
 
-            for mg_tunnel in mg_tunnels.findall(str(QName(ns, "TunnelInterface"))):
+            for mg_tunnel in mg_tunnels.findall(_tag(ns, "TunnelInterface")):
                 tunnel_type = mg_tunnel.attrib["Type"]
                 tunnel_name = mg_tunnel.attrib["Name"]
                 tunnelintfs[tunnel_type][tunnel_name] = {
@@ -893,7 +968,7 @@ def parse_dpg(dpg, hname):
 
 def parse_host_loopback(dpg, hname):
     for child in dpg:
-        hostname = child.find(str(QName(ns, "Hostname")))
+        hostname = child.find(_tag(ns, "Hostname"))
         if hostname.text.lower() != hname.lower():
             continue
         lo_intfs = parse_loopback_intf(child)
@@ -909,25 +984,25 @@ def parse_cpg(cpg, hname, local_devices=[]):
     bgp_sentinel_sessions = {}
     for child in cpg:
         tag = child.tag
-        if tag == str(QName(ns, "PeeringSessions")):
-            for session in child.findall(str(QName(ns, "BGPSession"))):
-                start_router = session.find(str(QName(ns, "StartRouter"))).text
-                start_peer = session.find(str(QName(ns, "StartPeer"))).text
-                end_router = session.find(str(QName(ns, "EndRouter"))).text
-                end_peer = session.find(str(QName(ns, "EndPeer"))).text
-                rrclient = 1 if session.find(str(QName(ns, "RRClient"))) is not None else 0
-                if session.find(str(QName(ns, "HoldTime"))) is not None:
-                    holdtime = session.find(str(QName(ns, "HoldTime"))).text
+        if tag == _tag(ns, "PeeringSessions"):
+            for session in child.findall(_tag(ns, "BGPSession")):
+                start_router = session.find(_tag(ns, "StartRouter")).text
+                start_peer = session.find(_tag(ns, "StartPeer")).text
+                end_router = session.find(_tag(ns, "EndRouter")).text
+                end_peer = session.find(_tag(ns, "EndPeer")).text
+                rrclient = 1 if session.find(_tag(ns, "RRClient")) is not None else 0
+                if session.find(_tag(ns, "HoldTime")) is not None:
+                    holdtime = session.find(_tag(ns, "HoldTime")).text
                 else:
                     holdtime = 180
-                if session.find(str(QName(ns, "KeepAliveTime"))) is not None:
-                    keepalive = session.find(str(QName(ns, "KeepAliveTime"))).text
+                if session.find(_tag(ns, "KeepAliveTime")) is not None:
+                    keepalive = session.find(_tag(ns, "KeepAliveTime")).text
                 else:
                     keepalive = 60
-                nhopself = 1 if session.find(str(QName(ns, "NextHopSelf"))) is not None else 0
+                nhopself = 1 if session.find(_tag(ns, "NextHopSelf")) is not None else 0
 
                 # choose the right table and admin_status for the peer
-                chassis_internal_ibgp = session.find(str(QName(ns, "ChassisInternal")))
+                chassis_internal_ibgp = session.find(_tag(ns, "ChassisInternal"))
                 if chassis_internal_ibgp is not None and chassis_internal_ibgp.text == "voq":
                     table = bgp_voq_chassis_sessions
                     admin_status = 'up'
@@ -963,48 +1038,44 @@ def parse_cpg(cpg, hname, local_devices=[]):
                     }
                     if admin_status:
                         table[end_peer.lower()]['admin_status'] = admin_status
-        elif child.tag == str(QName(ns, "Routers")):
-            for router in child.findall(str(QName(ns1, "BGPRouterDeclaration"))):
-                asn = router.find(str(QName(ns1, "ASN"))).text
-                hostname = router.find(str(QName(ns1, "Hostname"))).text
+        elif child.tag == _tag(ns, "Routers"):
+            # Index the sessions parsed so far by neighbor name, so each
+            # router declaration does not scan every session
+            sessions_by_name = {}
+            for table in (bgp_sessions, bgp_internal_sessions, bgp_voq_chassis_sessions):
+                for session in table.values():
+                    sessions_by_name.setdefault(session['name'].lower(), []).append(session)
+            for router in child.findall(_tag(ns1, "BGPRouterDeclaration")):
+                asn = router.find(_tag(ns1, "ASN")).text
+                hostname = router.find(_tag(ns1, "Hostname")).text
                 if hostname.lower() == hname.lower():
                     myasn = asn
-                    peers = router.find(str(QName(ns1, "Peers")))
-                    for bgpPeer in peers.findall(str(QName(ns, "BGPPeer"))):
-                        addr = bgpPeer.find(str(QName(ns, "Address"))).text
-                        if bgpPeer.find(str(QName(ns1, "PeersRange"))) is not None: # FIXME: is better to check for type BGPPeerPassive
-                            name = bgpPeer.find(str(QName(ns1, "Name"))).text
-                            ip_range = bgpPeer.find(str(QName(ns1, "PeersRange"))).text
+                    peers = router.find(_tag(ns1, "Peers"))
+                    for bgpPeer in peers.findall(_tag(ns, "BGPPeer")):
+                        addr = bgpPeer.find(_tag(ns, "Address")).text
+                        if bgpPeer.find(_tag(ns1, "PeersRange")) is not None: # FIXME: is better to check for type BGPPeerPassive
+                            name = bgpPeer.find(_tag(ns1, "Name")).text
+                            ip_range = bgpPeer.find(_tag(ns1, "PeersRange")).text
                             ip_range_group = ip_range.split(';') if ip_range and ip_range != "" else []
                             if name == "BGPSentinel" or name == "BGPSentinelV6":
                                 bgp_sentinel_sessions[name] = {
                                     'name': name,
                                     'ip_range': ip_range_group
                                 }
-                                if bgpPeer.find(str(QName(ns, "Address"))) is not None:
-                                    bgp_sentinel_sessions[name]['src_address'] = bgpPeer.find(str(QName(ns, "Address"))).text
+                                if bgpPeer.find(_tag(ns, "Address")) is not None:
+                                    bgp_sentinel_sessions[name]['src_address'] = bgpPeer.find(_tag(ns, "Address")).text
                             else:
                                 bgp_peers_with_range[name] = {
                                     'name': name,
                                     'ip_range': ip_range_group
                                 }
-                                if bgpPeer.find(str(QName(ns, "Address"))) is not None:
-                                    bgp_peers_with_range[name]['src_address'] = bgpPeer.find(str(QName(ns, "Address"))).text
-                                if bgpPeer.find(str(QName(ns1, "PeerAsn"))) is not None:
-                                    bgp_peers_with_range[name]['peer_asn'] = bgpPeer.find(str(QName(ns1, "PeerAsn"))).text
+                                if bgpPeer.find(_tag(ns, "Address")) is not None:
+                                    bgp_peers_with_range[name]['src_address'] = bgpPeer.find(_tag(ns, "Address")).text
+                                if bgpPeer.find(_tag(ns1, "PeerAsn")) is not None:
+                                    bgp_peers_with_range[name]['peer_asn'] = bgpPeer.find(_tag(ns1, "PeerAsn")).text
                 else:
-                    for peer in bgp_sessions:
-                        bgp_session = bgp_sessions[peer]
-                        if hostname.lower() == bgp_session['name'].lower():
-                            bgp_session['asn'] = asn
-                    for peer in bgp_internal_sessions:
-                        bgp_internal_session = bgp_internal_sessions[peer]
-                        if hostname.lower() == bgp_internal_session['name'].lower():
-                            bgp_internal_session['asn'] = asn
-                    for peer in bgp_voq_chassis_sessions:
-                        bgp_session = bgp_voq_chassis_sessions[peer]
-                        if hostname.lower() == bgp_session['name'].lower():
-                            bgp_session['asn'] = asn
+                    for bgp_session in sessions_by_name.get(hostname.lower(), []):
+                        bgp_session['asn'] = asn
 
     bgp_monitors = { key: bgp_sessions[key] for key in bgp_sessions if 'asn' in bgp_sessions[key] and bgp_sessions[key]['name'] == 'BGPMonitor' }
     def filter_bad_asn(table):
@@ -1039,13 +1110,13 @@ def parse_meta(meta, hname):
     qos_profile = None
     rack_mgmt_map = None
 
-    device_metas = meta.find(str(QName(ns, "Devices")))
-    for device in device_metas.findall(str(QName(ns1, "DeviceMetadata"))):
-        if device.find(str(QName(ns1, "Name"))).text.lower() == hname.lower():
-            properties = device.find(str(QName(ns1, "Properties")))
-            for device_property in properties.findall(str(QName(ns1, "DeviceProperty"))):
-                name = device_property.find(str(QName(ns1, "Name"))).text
-                value = device_property.find(str(QName(ns1, "Value"))).text
+    device_metas = meta.find(_tag(ns, "Devices"))
+    for device in device_metas.findall(_tag(ns1, "DeviceMetadata")):
+        if device.find(_tag(ns1, "Name")).text.lower() == hname.lower():
+            properties = device.find(_tag(ns1, "Properties"))
+            for device_property in properties.findall(_tag(ns1, "DeviceProperty")):
+                name = device_property.find(_tag(ns1, "Name")).text
+                value = device_property.find(_tag(ns1, "Value")).text
                 value_group = value.strip().split(';') if value and value != "" else []
                 if name == "DhcpResources":
                     dhcp_servers = value_group
@@ -1093,14 +1164,14 @@ def parse_meta(meta, hname):
 
 
 def parse_linkmeta(meta, hname):
-    link = meta.find(str(QName(ns, "Link")))
+    link = meta.find(_tag(ns, "Link"))
     linkmetas = {}
-    for linkmeta in link.findall(str(QName(ns1, "LinkMetadata"))):
+    for linkmeta in link.findall(_tag(ns1, "LinkMetadata")):
         port = None
         fec_disabled = None
 
         # Sample: ARISTA05T1:Ethernet1/33;switch-t0:fortyGigE0/4
-        key = linkmeta.find(str(QName(ns1, "Key"))).text
+        key = linkmeta.find(_tag(ns1, "Key")).text
         endpoints = key.split(';')
         for endpoint in endpoints:
             t = endpoint.split(':')
@@ -1118,10 +1189,10 @@ def parse_linkmeta(meta, hname):
         macsec_enabled = False
         tx_power = None
         laser_freq = None
-        properties = linkmeta.find(str(QName(ns1, "Properties")))
-        for device_property in properties.findall(str(QName(ns1, "DeviceProperty"))):
-            name = device_property.find(str(QName(ns1, "Name"))).text
-            value = device_property.find(str(QName(ns1, "Value"))).text
+        properties = linkmeta.find(_tag(ns1, "Properties"))
+        for device_property in properties.findall(_tag(ns1, "DeviceProperty")):
+            name = device_property.find(_tag(ns1, "Name")).text
+            value = device_property.find(_tag(ns1, "Value")).text
             if name == "FECDisabled":
                 fec_disabled = value
             elif name in [ "GeminiPeeringLink", "LibraPeeringLink" ]:
@@ -1177,13 +1248,13 @@ def parse_asic_meta(meta, hname):
     max_cores = None
     deployment_id = None
     macsec_profile = {}
-    device_metas = meta.find(str(QName(ns, "Devices")))
-    for device in device_metas.findall(str(QName(ns1, "DeviceMetadata"))):
-        if device.find(str(QName(ns1, "Name"))).text.lower() == hname.lower():
-            properties = device.find(str(QName(ns1, "Properties")))
-            for device_property in properties.findall(str(QName(ns1, "DeviceProperty"))):
-                name = device_property.find(str(QName(ns1, "Name"))).text
-                value = device_property.find(str(QName(ns1, "Value"))).text
+    device_metas = meta.find(_tag(ns, "Devices"))
+    for device in device_metas.findall(_tag(ns1, "DeviceMetadata")):
+        if device.find(_tag(ns1, "Name")).text.lower() == hname.lower():
+            properties = device.find(_tag(ns1, "Properties"))
+            for device_property in properties.findall(_tag(ns1, "DeviceProperty")):
+                name = device_property.find(_tag(ns1, "Name")).text
+                value = device_property.find(_tag(ns1, "Value")).text
                 if name == "SubRole":
                     sub_role = value
                 elif name == "SwitchId":
@@ -1203,31 +1274,31 @@ def parse_deviceinfo(meta, hwsku):
     port_speeds = {}
     port_descriptions = {}
     sys_ports = {}
-    for device_info in meta.findall(str(QName(ns, "DeviceInfo"))):
-        dev_sku = device_info.find(str(QName(ns, "HwSku"))).text
+    for device_info in meta.findall(_tag(ns, "DeviceInfo")):
+        dev_sku = device_info.find(_tag(ns, "HwSku")).text
         if dev_sku == hwsku:
-            interfaces = device_info.find(str(QName(ns, "EthernetInterfaces"))).findall(str(QName(ns1, "EthernetInterface")))
-            interfaces = interfaces + device_info.find(str(QName(ns, "ManagementInterfaces"))).findall(str(QName(ns1, "ManagementInterface")))
+            interfaces = device_info.find(_tag(ns, "EthernetInterfaces")).findall(_tag(ns1, "EthernetInterface"))
+            interfaces = interfaces + device_info.find(_tag(ns, "ManagementInterfaces")).findall(_tag(ns1, "ManagementInterface"))
             for interface in interfaces:
-                alias = interface.find(str(QName(ns, "InterfaceName"))).text
-                speed = interface.find(str(QName(ns, "Speed"))).text
-                desc  = interface.find(str(QName(ns, "Description")))
+                alias = interface.find(_tag(ns, "InterfaceName")).text
+                speed = interface.find(_tag(ns, "Speed")).text
+                desc  = interface.find(_tag(ns, "Description"))
                 if desc != None:
                     port_descriptions[port_alias_map.get(alias, alias)] = desc.text
                 port_speeds[port_alias_map.get(alias, alias)] = speed
 
-            sysports = device_info.find(str(QName(ns, "SystemPorts")))
+            sysports = device_info.find(_tag(ns, "SystemPorts"))
             if sysports is not None:
-                for sysport in sysports.findall(str(QName(ns, "SystemPort"))):
-                    portname = sysport.find(str(QName(ns, "Name"))).text
-                    hostname = sysport.find(str(QName(ns, "Hostname")))
-                    asic_name = sysport.find(str(QName(ns, "AsicName")))
-                    system_port_id = sysport.find(str(QName(ns, "SystemPortId"))).text
-                    switch_id = sysport.find(str(QName(ns, "SwitchId"))).text
-                    core_id = sysport.find(str(QName(ns, "CoreId"))).text
-                    core_port_id = sysport.find(str(QName(ns, "CorePortId"))).text
-                    speed = sysport.find(str(QName(ns, "Speed"))).text
-                    num_voq = sysport.find(str(QName(ns, "NumVoq"))).text
+                for sysport in sysports.findall(_tag(ns, "SystemPort")):
+                    portname = sysport.find(_tag(ns, "Name")).text
+                    hostname = sysport.find(_tag(ns, "Hostname"))
+                    asic_name = sysport.find(_tag(ns, "AsicName"))
+                    system_port_id = sysport.find(_tag(ns, "SystemPortId")).text
+                    switch_id = sysport.find(_tag(ns, "SwitchId")).text
+                    core_id = sysport.find(_tag(ns, "CoreId")).text
+                    core_port_id = sysport.find(_tag(ns, "CorePortId")).text
+                    speed = sysport.find(_tag(ns, "Speed")).text
+                    num_voq = sysport.find(_tag(ns, "NumVoq")).text
                     key = portname
                     if asic_name is not None:
                        key = "%s|%s" % (asic_name.text, key)
@@ -1366,13 +1437,12 @@ def filter_acl_table_bindings(acls, neighbors, port_channels, pc_members, sub_ro
     front_port_channel_intf = []
 
     # List of Backplane ports
-    backplane_port_list = [v for k,v in port_alias_map.items() if v.startswith(backplane_prefix())]
+    backplane_port_list = set(v for k,v in port_alias_map.items() if v.startswith(backplane_prefix()))
 
     # Get the front panel port channel.
+    backend_port_channels = set(lag_member[0] for lag_member in pc_members if lag_member[1] in backplane_port_list)
     for port_channel_intf in port_channels:
-        backend_port_channel = any(lag_member[1] in backplane_port_list \
-                                   for lag_member in list(pc_members.keys()) if lag_member[0] == port_channel_intf)
-        if not backend_port_channel:
+        if port_channel_intf not in backend_port_channels:
             front_port_channel_intf.append(port_channel_intf)
 
     for acl_table, group_params in acls.items():
@@ -1503,7 +1573,7 @@ def parse_xml(filename, platform=None, port_config_file=None, asic_name=None, hw
     fabric_port_config_file -- fabric port config file name
      """
 
-    root = ET.parse(filename).getroot()
+    root = parse_minigraph_file(filename).root
 
     u_neighbors = None
     u_devices = None
@@ -1567,19 +1637,23 @@ def parse_xml(filename, platform=None, port_config_file=None, asic_name=None, hw
     qos_profile = None
     rack_mgmt_map = None
 
-    hwsku_qn = QName(ns, "HwSku")
-    hostname_qn = QName(ns, "Hostname")
-    docker_routing_config_mode_qn = QName(ns, "DockerRoutingConfigMode")
+    hwsku_qn = _tag(ns, "HwSku")
+    hostname_qn = _tag(ns, "Hostname")
+    docker_routing_config_mode_qn = _tag(ns, "DockerRoutingConfigMode")
     for child in root:
-        if child.tag == str(hwsku_qn):
+        if child.tag == hwsku_qn:
             hwsku = child.text
-        if child.tag == str(hostname_qn):
+        if child.tag == hostname_qn:
             hostname = child.text
-        if child.tag == str(docker_routing_config_mode_qn):
+        if child.tag == docker_routing_config_mode_qn:
             docker_routing_config_mode = child.text
 
     (ports, alias_map, alias_asic_map) = get_port_config(hwsku=hwsku, platform=platform, port_config_file=port_config_file, asic_name=asic_name, hwsku_config_file=hwsku_config_file)
 
+    # Drop the ports of a namespace parsed earlier in the same process
+    port_names_map.clear()
+    port_alias_map.clear()
+    port_alias_asic_map.clear()
     port_names_map.update(ports)
     port_alias_map.update(alias_map)
     port_alias_asic_map.update(alias_asic_map)
@@ -1589,33 +1663,33 @@ def parse_xml(filename, platform=None, port_config_file=None, asic_name=None, hw
 
     for child in root:
         if asic_name is None:
-            if child.tag == str(QName(ns, "DpgDec")):
+            if child.tag == _tag(ns, "DpgDec"):
                 (intfs, lo_intfs, mvrf, mgmt_intf, voq_inband_intfs, vlans, vlan_members, dhcp_relay_table, pcs, pc_members, acls, acl_table_types, vni, tunnel_intfs, dpg_ecmp_content, static_routes, tunnel_intfs_qos_remap_config) = parse_dpg(child, hostname)
-            elif child.tag == str(QName(ns, "CpgDec")):
+            elif child.tag == _tag(ns, "CpgDec"):
                 (bgp_sessions, bgp_internal_sessions, bgp_voq_chassis_sessions, bgp_asn, bgp_peers_with_range, bgp_monitors, bgp_sentinel_sessions) = parse_cpg(child, hostname)
-            elif child.tag == str(QName(ns, "PngDec")):
+            elif child.tag == _tag(ns, "PngDec"):
                 (neighbors, devices, console_dev, console_port, mgmt_dev, mgmt_port, port_speed_png, console_ports, mux_cable_ports, png_ecmp_content) = parse_png(child, hostname, dpg_ecmp_content)
-            elif child.tag == str(QName(ns, "UngDec")):
+            elif child.tag == _tag(ns, "UngDec"):
                 (u_neighbors, u_devices, _, _, _, _, _, _) = parse_png(child, hostname, None)
-            elif child.tag == str(QName(ns, "MetadataDeclaration")):
+            elif child.tag == _tag(ns, "MetadataDeclaration"):
                 (syslog_servers, dhcp_servers, dhcpv6_servers, ntp_servers, tacacs_servers, mgmt_routes, erspan_dst, deployment_id, region, cloudtype, resource_type, downstream_subrole, switch_id, switch_type, max_cores, kube_data, macsec_profile, downstream_redundancy_types, redundancy_type, qos_profile, rack_mgmt_map) = parse_meta(child, hostname)
-            elif child.tag == str(QName(ns, "LinkMetadataDeclaration")):
+            elif child.tag == _tag(ns, "LinkMetadataDeclaration"):
                 linkmetas = parse_linkmeta(child, hostname)
-            elif child.tag == str(QName(ns, "DeviceInfos")):
+            elif child.tag == _tag(ns, "DeviceInfos"):
                 (port_speeds_default, port_descriptions, sys_ports) = parse_deviceinfo(child, hwsku)
         else:
-            if child.tag == str(QName(ns, "DpgDec")):
+            if child.tag == _tag(ns, "DpgDec"):
                 (intfs, lo_intfs, mvrf, mgmt_intf, voq_inband_intfs, vlans, vlan_members, dhcp_relay_table, pcs, pc_members, acls, acl_table_types, vni, tunnel_intfs, dpg_ecmp_content, static_routes, tunnel_intfs_qos_remap_config) = parse_dpg(child, asic_name)
                 host_lo_intfs = parse_host_loopback(child, hostname)
-            elif child.tag == str(QName(ns, "CpgDec")):
+            elif child.tag == _tag(ns, "CpgDec"):
                 (bgp_sessions, bgp_internal_sessions, bgp_voq_chassis_sessions, bgp_asn, bgp_peers_with_range, bgp_monitors, bgp_sentinel_sessions) = parse_cpg(child, asic_name, local_devices)
-            elif child.tag == str(QName(ns, "PngDec")):
+            elif child.tag == _tag(ns, "PngDec"):
                 (neighbors, devices, port_speed_png) = parse_asic_png(child, asic_name, hostname)
-            elif child.tag == str(QName(ns, "MetadataDeclaration")):
+            elif child.tag == _tag(ns, "MetadataDeclaration"):
                 (sub_role, switch_id, switch_type, max_cores, deployment_id, macsec_profile) = parse_asic_meta(child, asic_name)
-            elif child.tag == str(QName(ns, "LinkMetadataDeclaration")):
+            elif child.tag == _tag(ns, "LinkMetadataDeclaration"):
                 linkmetas = parse_linkmeta(child, hostname)
-            elif child.tag == str(QName(ns, "DeviceInfos")):
+            elif child.tag == _tag(ns, "DeviceInfos"):
                 (port_speeds_default, port_descriptions, sys_ports) = parse_deviceinfo(child, hwsku)
 
     select_mmu_profiles(qos_profile, platform, hwsku)
@@ -2217,11 +2291,11 @@ def get_ports_in_active_active(root, devices, neighbors):
     """Parse out ports in active-active cable type."""
     servers = {hostname.lower(): device_data for hostname, device_data in devices.items() if device_data["type"] == "Server"}
     ports_in_active_active = {}
-    dpg_section = root.find(str(QName(ns, "DpgDec")))
+    dpg_section = root.find(_tag(ns, "DpgDec"))
     neighbor_to_port_mapping = {neighbor["name"].lower(): port for port, neighbor in neighbors.items()}
     if dpg_section is not None:
         for child in dpg_section:
-            hostname = child.find(str(QName(ns, "Hostname")))
+            hostname = child.find(_tag(ns, "Hostname"))
             if hostname is None:
                 continue
             hostname = hostname.text.lower()
@@ -2283,7 +2357,7 @@ def get_mux_cable_entries(ports, mux_cable_ports, active_active_ports, neighbors
 
 
 def parse_device_desc_xml(filename):
-    root = ET.parse(filename).getroot()
+    root = parse_minigraph_file(filename).root
     (lo_prefix, lo_prefix_v6, mgmt_prefix, mgmt_prefix_v6, hostname, hwsku, d_type, _, _, _) = parse_device(root)
 
     results = {}
@@ -2314,29 +2388,27 @@ def parse_device_desc_xml(filename):
 def parse_asic_sub_role(filename, asic_name):
     if not os.path.isfile(filename):
         return None
-    root = ET.parse(filename).getroot()
-    for child in root:
-        if child.tag == str(QName(ns, "MetadataDeclaration")):
-            sub_role, _, _, _, _, _= parse_asic_meta(child, asic_name)
-            return sub_role
+    asic_meta = parse_minigraph_file(filename).asic_meta(asic_name)
+    if asic_meta is not None:
+        sub_role, _, _, _, _, _= asic_meta
+        return sub_role
 
 def parse_asic_switch_type(filename, asic_name):
     if os.path.isfile(filename):
-        root = ET.parse(filename).getroot()
-        for child in root:
-            if child.tag == str(QName(ns, "MetadataDeclaration")):
-                _, _, switch_type, _, _, _ = parse_asic_meta(child, asic_name)
-                return switch_type
+        asic_meta = parse_minigraph_file(filename).asic_meta(asic_name)
+        if asic_meta is not None:
+            _, _, switch_type, _, _, _ = asic_meta
+            return switch_type
     return None
 
 def parse_asic_meta_get_devices(root):
     local_devices = []
 
     for child in root:
-        if child.tag == str(QName(ns, "MetadataDeclaration")):
-            device_metas = child.find(str(QName(ns, "Devices")))
-            for device in device_metas.findall(str(QName(ns1, "DeviceMetadata"))):
-                name = device.find(str(QName(ns1, "Name"))).text.lower()
+        if child.tag == _tag(ns, "MetadataDeclaration"):
+            device_metas = child.find(_tag(ns, "Devices"))
+            for device in device_metas.findall(_tag(ns1, "DeviceMetadata")):
+                name = device.find(_tag(ns1, "Name")).text.lower()
                 local_devices.append(name)
 
     return local_devices
@@ -0,0 +1,202 @@
+"""render_server.py
+
+Long-lived rendering service for sonic-cfggen.
+
+A sonic-cfggen process started with '--serve <socket>' keeps the imported
+modules, the loaded CONFIG_DB data and the compiled jinja2 templates in memory
+and runs the command lines it receives on a local unix socket. A sonic-cfggen
+invocation finds the server through the SONIC_CFGGEN_SERVER environment
+variable and only forwards its arguments, so it does not pay for the module
+imports and the database dump on every call.
+
+This module only depends on the standard library, so the client side can be
+used before sonic-cfggen imports anything heavy.
+"""
+
+from __future__ import print_function
+
+import errno
+import json
+import os
+import socket
+import sys
+
+try:
+    import socketserver
+except ImportError:
+    import SocketServer as socketserver
+
+# Environment variable with the unix socket path of a running render server
+SERVER_SOCKET_ENV = 'SONIC_CFGGEN_SERVER'
+
+# Environment variables of the client which affect the rendering result
+FORWARDED_ENV = ['NAMESPACE_ID', 'CFGGEN_UNIT_TESTING']
+
+RECV_CHUNK_SIZE = 65536
+
+# Option of sonic-cfggen which starts a render server
+SERVE_OPTION = '--serve'
+
+# Seconds a client waits for the server before giving up
+CLIENT_TIMEOUT = 60
+
+
+def _recv_all(sock):
+    chunks = []
+    while True:
+        chunk = sock.recv(RECV_CHUNK_SIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def is_serve_command(argv):
+    """
+    Check whether a sonic-cfggen command line starts a render server.
+
+    argparse accepts '--serve <socket>', '--serve=<socket>' and any
+    unambiguous abbreviation of the option, e.g. '--ser <socket>'. No other
+    long option of sonic-cfggen starts with '--s'.
+
+    Keyword arguments:
+    argv -- sonic-cfggen arguments, without the program name
+    """
+    for arg in argv:
+        if arg == '--':
+            break
+        option = arg.split('=', 1)[0]
+        if len(option) > 2 and SERVE_OPTION.startswith(option):
+            return True
+    return False
+
+
+def forward_to_server(argv, socket_path=None):
+    """
+    Run a sonic-cfggen command line on the render server.
+
+    The command is only run locally when no server accepts the connection.
+    Once the request was sent the server may already be running it, e.g.
+    writing to CONFIG_DB or to a template output file, so a missing or
+    broken reply is reported as an error instead of running it twice.
+
+    Keyword arguments:
+    argv -- sonic-cfggen arguments, without the program name
+    socket_path -- unix socket of the server; SONIC_CFGGEN_SERVER by default
+
+    Return:
+        exit code of the command, after its output was written to
+        stdout/stderr, 1 if the server did not reply properly, or None if
+        no server could be reached and the command has to be run locally.
+    """
+    if socket_path is None:
+        socket_path = os.environ.get(SERVER_SOCKET_ENV)
+    if not socket_path:
+        return None
+
+    request = {
+        'argv': list(argv),
+        'cwd': os.getcwd(),
+        'env': dict((name, os.environ[name]) for name in FORWARDED_ENV if name in os.environ),
+    }
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CLIENT_TIMEOUT)
+    try:
+        try:
+            sock.connect(socket_path)
+        except socket.timeout:
+            return None
+        except (OSError, socket.error) as e:
+            if e.errno in (errno.ENOENT, errno.ECONNREFUSED, errno.EACCES):
+                return None
+            raise
+        try:
+            sock.sendall(json.dumps(request).encode())
+            sock.shutdown(socket.SHUT_WR)
+            reply = _recv_all(sock)
+        except (OSError, socket.error) as e:
+            print('sonic-cfggen: no reply from render server {}: {}'.format(socket_path, e), file=sys.stderr)
+            return 1
+    finally:
+        sock.close()
+
+    if not reply:
+        # The server went away while handling the request, e.g. it was
+        # restarted, and may have run part of the command already
+        print('sonic-cfggen: render server {} closed the connection without reply'.format(socket_path),
+              file=sys.stderr)
+        return 1
+
+    try:
+        response = json.loads(reply.decode())
+        out, err, rc = response['stdout'], response['stderr'], response['rc']
+    except (ValueError, KeyError, TypeError) as e:
+        print('sonic-cfggen: invalid reply from render server {}: {}'.format(socket_path, e), file=sys.stderr)
+        return 1
+
+    sys.stdout.write(out)
+    sys.stdout.flush()
+    sys.stderr.write(err)
+    sys.stderr.flush()
+    return rc
+
+
+class _RenderRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        request = json.loads(_recv_all(self.request).decode())
+        rc, out, err = self.server.run_request(request['argv'], request['cwd'], request['env'])
+        response = {'rc': rc, 'stdout': out, 'stderr': err}
+        self.request.sendall(json.dumps(response).encode())
+
+
+class RenderServer(socketserver.UnixStreamServer):
+    """
+    Unix socket server which runs forwarded sonic-cfggen command lines.
+
+    Requests are handled one at a time, since a request temporarily changes
+    the working directory, the environment and sys.stdout/sys.stderr of the
+    server process.
+    """
+    def __init__(self, socket_path, handler):
+        """
+        Keyword arguments:
+        socket_path -- unix socket to listen on
+        handler -- callable taking the argument list, returning
+        (exit code, stdout text, stderr text)
+        """
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        self.socket_path = socket_path
+        self.handler = handler
+        # The socket is created accessible by the owner only, clients without
+        # access to it fall back to local rendering
+        saved_umask = os.umask(0o077)
+        try:
+            socketserver.UnixStreamServer.__init__(self, socket_path, _RenderRequestHandler)
+        finally:
+            os.umask(saved_umask)
+
+    def run_request(self, argv, cwd, env):
+        saved_cwd = os.getcwd()
+        saved_env = dict((name, os.environ.get(name)) for name in FORWARDED_ENV)
+        try:
+            os.chdir(cwd)
+            for name in FORWARDED_ENV:
+                if name in env:
+                    os.environ[name] = env[name]
+                else:
+                    os.environ.pop(name, None)
+            return self.handler(argv)
+        finally:
+            os.chdir(saved_cwd)
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
@@ -47,9 +47,11 @@ else:
 # Common modules for python2 and python3
 py_modules = [
     'config_samples',
+    'json_stream',
     'minigraph',
     'openconfig_acl',
     'portconfig',
+    'render_server',
 ]
 if sys.version_info.major == 3:
     # Python 3-only modules
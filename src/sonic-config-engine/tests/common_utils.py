@@ -1,5 +1,7 @@
 import json
 import filecmp
+import importlib.machinery
+import importlib.util
 import os
 import re
 import sys
@@ -10,6 +12,15 @@ PY3x = sys.version_info >= (3, 0)
 PYvX_DIR = "py3" if PY3x else "py2"
 PYTHON_INTERPRETTER = "python3" if PY3x else "python2"
 YANG_MODELS_DIR = "/usr/local/yang-models"
+CFGGEN_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'sonic-cfggen')
+
+def load_cfggen():
+    """ Load the sonic-cfggen script as a module, to run it in the test process """
+    loader = importlib.machinery.SourceFileLoader('sonic_cfggen', CFGGEN_PATH)
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
 
 def tuple_to_str(tuplestr):
     """ Convert Python tuple '('elem1', 'elem2')' representation into string on the for "elem1|elem2" """
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""minigraph_benchmark.py
+
+Measure minigraph.parse_xml on large generated T1/T2 minigraphs, with
+thousands of links, BGP sessions, PortChannels and ACL bindings.
+
+Examples:
+    python3 tests/minigraph_benchmark.py
+    python3 tests/minigraph_benchmark.py --topo t2 --neighbors 2000 --acls 5000
+"""
+
+from __future__ import print_function
+
+import argparse
+import ipaddress
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+os.environ.setdefault("CFGGEN_UNIT_TESTING", "0")
+
+import minigraph
+
+HOSTNAME = 'bench-switch'
+HWSKU = 'Bench-SKU'
+ASN = 65100
+
+TOPOLOGIES = {
+    # topology: (device type, neighbor device type, neighbor name prefix)
+    't1': ('LeafRouter', 'SpineRouter', 'ARISTA{:04d}T2'),
+    't2': ('SpineRouter', 'LeafRouter', 'ARISTA{:04d}T1'),
+}
+
+
+def _port_alias(index):
+    return 'etp{}'.format(index)
+
+
+def _neighbor_addresses(index):
+    """ Local and remote address of the /31 and /126 of a neighbor """
+    v4 = ipaddress.ip_address(u'10.0.0.0') + 2 * index
+    v6 = ipaddress.ip_address(u'fc00::') + 4 * index
+    return (str(v4), str(v4 + 1)), (str(v6 + 1), str(v6 + 2))
+
+
+def generate_port_config(num_ports):
+    lines = ['# name lanes alias index']
+    for port in range(num_ports):
+        lanes = ','.join(str(lane) for lane in range(port * 4, port * 4 + 4))
+        lines.append('Ethernet{} {} {} {}'.format(port * 4, lanes, _port_alias(port), port))
+    return '\n'.join(lines) + '\n'
+
+
+def generate_minigraph(topo, num_neighbors, num_acls):
+    """
+    Generate a minigraph where every neighbor is connected through a
+    PortChannel of two ports, with an IPv4 and an IPv6 BGP session, and
+    num_acls ACL tables are bound to the PortChannels.
+    """
+    device_type, neighbor_type, neighbor_name = TOPOLOGIES[topo]
+    neighbors = [neighbor_name.format(i) for i in range(num_neighbors)]
+
+    sessions = []
+    routers = []
+    portchannels = []
+    ipintfs = []
+    links = []
+    devices = []
+    interfaces = []
+    for i, neighbor in enumerate(neighbors):
+        (v4_local, v4_peer), (v6_local, v6_peer) = _neighbor_addresses(i)
+        for local, peer in ((v4_local, v4_peer), (v6_local, v6_peer)):
+            sessions.append(
+                '<BGPSession><StartRouter>{0}</StartRouter><StartPeer>{1}</StartPeer>'
+                '<EndRouter>{2}</EndRouter><EndPeer>{3}</EndPeer><Multihop>1</Multihop>'
+                '<HoldTime>180</HoldTime><KeepAliveTime>60</KeepAliveTime></BGPSession>'.format(HOSTNAME, local, neighbor, peer))
+        routers.append(
+            '<a:BGPRouterDeclaration><a:ASN>{}</a:ASN><a:Hostname>{}</a:Hostname>'
+            '<a:RouteMaps/></a:BGPRouterDeclaration>'.format(64600 + i, neighbor))
+
+        members = [_port_alias(2 * i), _port_alias(2 * i + 1)]
+        portchannel = 'PortChannel{}'.format(i + 1)
+        portchannels.append(
+            '<PortChannel><Name>{}</Name><AttachTo>{}</AttachTo><SubInterface/></PortChannel>'.format(portchannel, ';'.join(members)))
+        for local in (v4_local, v6_local):
+            prefix = '{}/{}'.format(local, 31 if '.' in local else 126)
+            ipintfs.append(
+                '<IPInterface><Name i:nil="true"/><AttachTo>{}</AttachTo><Prefix>{}</Prefix></IPInterface>'.format(portchannel, prefix))
+        for port, member in enumerate(members):
+            links.append(
+                '<DeviceLinkBase i:type="DeviceInterfaceLink"><ElementType>DeviceInterfaceLink</ElementType>'
+                '<Bandwidth>100000</Bandwidth><EndDevice>{}</EndDevice><EndPort>Ethernet{}</EndPort>'
+                '<FlowControl>true</FlowControl><StartDevice>{}</StartDevice><StartPort>{}</StartPort>'
+                '<Validate>true</Validate></DeviceLinkBase>'.format(neighbor, port + 1, HOSTNAME, member))
+            interfaces.append(
+                '<a:EthernetInterface><ElementType>DeviceInterface</ElementType><Index>1</Index>'
+                '<InterfaceName>{}</InterfaceName><MultiPortsInterface>false</MultiPortsInterface>'
+                '<PortName>0</PortName><Priority>0</Priority><Speed>100000</Speed>'
+                '<Description>{}:Ethernet{}</Description></a:EthernetInterface>'.format(member, neighbor, port + 1))
+        devices.append(
+            '<Device i:type="{}"><Hostname>{}</Hostname><HwSku>Arista-VM</HwSku>'
+            '<Address xmlns:a="Microsoft.Search.Autopilot.NetMux"><a:IPPrefix>10.1.{}.{}/32</a:IPPrefix></Address>'
+            '</Device>'.format(neighbor_type, neighbor, i // 256, i % 256))
+
+    acls = []
+    for i in range(num_acls):
+        acls.append(
+            '<AclInterface><AttachTo>PortChannel{}</AttachTo><InAcl>DataAcl{}</InAcl>'
+            '<Type>DataPlane</Type></AclInterface>'.format(i % num_neighbors + 1, i))
+
+    return '''<DeviceMiniGraph xmlns="Microsoft.Search.Autopilot.Evolution" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
+  <CpgDec>
+    <PeeringSessions>{sessions}</PeeringSessions>
+    <Routers xmlns:a="http://schemas.datacontract.org/2004/07/Microsoft.Search.Autopilot.Evolution">
+      <a:BGPRouterDeclaration><a:ASN>{asn}</a:ASN><a:Hostname>{hostname}</a:Hostname><a:Peers/><a:RouteMaps/></a:BGPRouterDeclaration>
+      {routers}
+    </Routers>
+  </CpgDec>
+  <DpgDec>
+    <DeviceDataPlaneInfo>
+      <LoopbackIPInterfaces xmlns:a="http://schemas.datacontract.org/2004/07/Microsoft.Search.Autopilot.Evolution">
+        <a:LoopbackIPInterface><Name>HostIP</Name><AttachTo>Loopback0</AttachTo>
+          <a:Prefix xmlns:b="Microsoft.Search.Autopilot.Evolution"><b:IPPrefix>10.1.0.32/32</b:IPPrefix></a:Prefix>
+          <a:PrefixStr>10.1.0.32/32</a:PrefixStr>
+        </a:LoopbackIPInterface>
+      </LoopbackIPInterfaces>
+      <ManagementIPInterfaces xmlns:a="http://schemas.datacontract.org/2004/07/Microsoft.Search.Autopilot.Evolution">
+        <a:ManagementIPInterface><Name>HostIP</Name><AttachTo>eth0</AttachTo>
+          <a:Prefix xmlns:b="Microsoft.Search.Autopilot.Evolution"><b:IPPrefix>10.250.0.10/24</b:IPPrefix></a:Prefix>
+          <a:PrefixStr>10.250.0.10/24</a:PrefixStr>
+        </a:ManagementIPInterface>
+      </ManagementIPInterfaces>
+      <Hostname>{hostname}</Hostname>
+      <PortChannelInterfaces>{portchannels}</PortChannelInterfaces>
+      <VlanInterfaces/>
+      <IPInterfaces>{ipintfs}</IPInterfaces>
+      <DataAcls/>
+      <AclInterfaces>{acls}</AclInterfaces>
+    </DeviceDataPlaneInfo>
+  </DpgDec>
+  <PngDec>
+    <DeviceInterfaceLinks>{links}</DeviceInterfaceLinks>
+    <Devices>
+      <Device i:type="{device_type}"><Hostname>{hostname}</Hostname><HwSku>{hwsku}</HwSku></Device>
+      {devices}
+    </Devices>
+  </PngDec>
+  <DeviceInfos>
+    <DeviceInfo>
+      <EthernetInterfaces xmlns:a="http://schemas.datacontract.org/2004/07/Microsoft.Search.Autopilot.Evolution">{interfaces}</EthernetInterfaces>
+      <ManagementInterfaces xmlns:a="http://schemas.datacontract.org/2004/07/Microsoft.Search.Autopilot.Evolution"/>
+      <HwSku>{hwsku}</HwSku>
+    </DeviceInfo>
+  </DeviceInfos>
+  <Hostname>{hostname}</Hostname>
+  <HwSku>{hwsku}</HwSku>
+</DeviceMiniGraph>
+'''.format(sessions=''.join(sessions), routers='\n      '.join(routers), portchannels=''.join(portchannels),
+           ipintfs=''.join(ipintfs), acls=''.join(acls), links=''.join(links), devices='\n      '.join(devices),
+           interfaces=''.join(interfaces), device_type=device_type, hostname=HOSTNAME, hwsku=HWSKU, asn=ASN)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark minigraph parsing on a generated minigraph")
+    parser.add_argument("--topo", choices=sorted(TOPOLOGIES), default='t1')
+    parser.add_argument("--neighbors", type=int, default=1000, help="number of BGP neighbors, each on a 2-port PortChannel")
+    parser.add_argument("--acls", type=int, default=2000, help="number of ACL tables bound to the PortChannels")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        graph_file = os.path.join(work_dir, 'minigraph.xml')
+        port_config_file = os.path.join(work_dir, 'port_config.ini')
+        with open(graph_file, 'w') as f:
+            f.write(generate_minigraph(args.topo, args.neighbors, args.acls))
+        with open(port_config_file, 'w') as f:
+            f.write(generate_port_config(2 * args.neighbors))
+
+        print('{} minigraph: {} neighbors, {} ACL tables, {:.1f} MB'.format(
+            args.topo.upper(), args.neighbors, args.acls, os.path.getsize(graph_file) / 1e6))
+
+        timings = []
+        for _ in range(args.iterations):
+            minigraph._parsed_minigraphs.clear()
+            start = time.time()
+            results = minigraph.parse_xml(graph_file, port_config_file=port_config_file)
+            timings.append(time.time() - start)
+
+        print('parse_xml: min {:.1f} ms, mean {:.1f} ms over {} runs ({} BGP sessions, {} ACL tables)'.format(
+            min(timings) * 1000, sum(timings) / len(timings) * 1000, len(timings),
+            len(results['BGP_NEIGHBOR']), len(results.get('ACL_TABLE', {}))))
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    main()
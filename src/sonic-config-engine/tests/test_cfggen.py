@@ -1,9 +1,16 @@
 import json
 import subprocess
 import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import render_server
 import tests.common_utils as utils
 
-from unittest import TestCase
+from unittest import TestCase, mock
+from io import StringIO
 
 TOR_ROUTER = 'ToRRouter'
 BACKEND_TOR_ROUTER = 'BackEndToRRouter'
@@ -82,6 +89,109 @@ class TestCfgGen(TestCase):
         output = self.run_script(argument)
         self.assertEqual(output, '')
 
+    def test_render_server(self):
+        socket_path = os.path.join(self.test_dir, 'render.sock')
+        server = subprocess.Popen(self.script_file + ['--serve', socket_path])
+        try:
+            for _ in range(100):
+                if os.path.exists(socket_path):
+                    break
+                time.sleep(0.1)
+            self.assertEqual(os.stat(socket_path).st_mode & 0o077, 0)
+            argument = ['-y', os.path.join(self.test_dir, 'test.yml'), '-a', '{"key1":"value"}',
+                        '-t', os.path.join(self.test_dir, 'test.j2')]
+            expected = self.run_script(argument)
+            for _ in range(2):
+                with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+                    rc = render_server.forward_to_server(argument, socket_path)
+                self.assertEqual(rc, 0)
+                self.assertEqual(stdout.getvalue(), expected)
+
+            with mock.patch('sys.stdout', new_callable=StringIO), mock.patch('sys.stderr', new_callable=StringIO):
+                rc = render_server.forward_to_server(['-v', 'undefined_filter|no_such_filter'], socket_path)
+            self.assertNotEqual(rc, 0)
+        finally:
+            server.terminate()
+            server.wait()
+        self.assertFalse(os.path.exists(socket_path))
+        self.assertIsNone(render_server.forward_to_server(argument, socket_path))
+
+    def test_render_server_timeout(self):
+        socket_path = os.path.join(self.test_dir, 'render.sock')
+        # A server which accepts the connection and never replies
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+        try:
+            # The server may be running the command, so it is not run locally again
+            with mock.patch('render_server.CLIENT_TIMEOUT', 0.5), \
+                    mock.patch('sys.stdout', new_callable=StringIO) as stdout, \
+                    mock.patch('sys.stderr', new_callable=StringIO) as stderr:
+                rc = render_server.forward_to_server(['-v', 'key1'], socket_path)
+            self.assertEqual(rc, 1)
+            self.assertEqual(stdout.getvalue(), '')
+            self.assertIn('no reply from render server', stderr.getvalue())
+        finally:
+            server.close()
+            os.unlink(socket_path)
+
+    def test_render_server_invalid_reply(self):
+        socket_path = os.path.join(self.test_dir, 'render.sock')
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+
+        def reply(data):
+            conn, _ = server.accept()
+            render_server._recv_all(conn)
+            conn.sendall(data)
+            conn.close()
+
+        try:
+            for data in [b'{"rc": 0, "stdout": "trunc', b'{"rc": 0}', b'', b'\xff']:
+                thread = threading.Thread(target=reply, args=(data,))
+                thread.start()
+                with mock.patch('sys.stdout', new_callable=StringIO) as stdout, \
+                        mock.patch('sys.stderr', new_callable=StringIO) as stderr:
+                    rc = render_server.forward_to_server(['-v', 'key1'], socket_path)
+                thread.join()
+                self.assertEqual(rc, 1)
+                self.assertEqual(stdout.getvalue(), '')
+                self.assertIn('render server', stderr.getvalue())
+        finally:
+            server.close()
+            os.unlink(socket_path)
+
+    def test_is_serve_command(self):
+        for argv in [['--serve', '/tmp/s'], ['--serve=/tmp/s'], ['--ser', '/tmp/s'], ['-d', '--se=/tmp/s']]:
+            self.assertTrue(render_server.is_serve_command(argv))
+        for argv in [[], ['-v', 'key1'], ['--', '--serve'], ['-t', 'serve.j2'], ['--print-data']]:
+            self.assertFalse(render_server.is_serve_command(argv))
+
+    def test_all_namespaces_print_data(self):
+        argument = ['-m', self.sample_graph_simple, '-p', self.port_config, '--print-data']
+        expected = json.loads(self.run_script(argument))
+        output = json.loads(self.run_script(argument + ['--all-namespaces']))
+        self.assertEqual(output, {'localhost': expected})
+
+    def test_all_namespaces_invalid_args(self):
+        argument = ['-m', self.sample_graph_simple, '-p', self.port_config, '--all-namespaces', '-v', 'PORT']
+        with self.assertRaises(subprocess.CalledProcessError):
+            self.run_script(argument)
+
+    def test_compiled_template_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            argument = ['-y', os.path.join(self.test_dir, 'test.yml'), '-a', '{"key1":"value"}',
+                        '-t', os.path.join(self.test_dir, 'test.j2')]
+            with mock.patch.dict(os.environ, {'SONIC_J2_CACHE_DIR': cache_dir}):
+                expected = self.run_script(argument)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                self.assertEqual(self.run_script(argument), expected)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+        finally:
+            shutil.rmtree(cache_dir)
+
     def test_device_desc(self):
         argument = ['-v', "DEVICE_METADATA[\'localhost\'][\'hwsku\']", "-M", self.sample_device_desc]
         output = self.run_script(argument)
@@ -0,0 +1,102 @@
+import copy
+import os
+import subprocess
+
+import tests.common_utils as utils
+
+from unittest import TestCase
+
+test_dir = os.path.dirname(os.path.realpath(__file__))
+cfggen_path = os.path.join(test_dir, '..', 'sonic-cfggen')
+
+
+def serialize_key(key):
+    if isinstance(key, tuple):
+        return '|'.join(key)
+    return key
+
+
+def mod_config(db, data):
+    """ Apply data to db like ConfigDBConnector.mod_config, db holds the typed content of get_config() """
+    for table_name, table_data in data.items():
+        if table_data is None:
+            db.pop(table_name, None)
+            continue
+        table = db.setdefault(table_name, {})
+        for key, entry in table_data.items():
+            key = serialize_key(key)
+            if entry is None:
+                table.pop(key, None)
+                continue
+            fields = table.setdefault(key, {})
+            for name, value in entry.items():
+                fields[name] = [str(v) for v in value] if isinstance(value, list) else str(value)
+        if not table:
+            db.pop(table_name)
+    return db
+
+
+class TestCfgGenChangesOnly(TestCase):
+
+    def setUp(self):
+        self.cfggen = utils.load_cfggen()
+        self.current = {
+            'DEVICE_METADATA': {'localhost': {'hostname': 'switch1', 'bgp_asn': '65100'}},
+            'PORT': {
+                'Ethernet0': {'mtu': '9100', 'admin_status': 'up'},
+                'Ethernet4': {'mtu': '9100', 'admin_status': 'up'},
+            },
+            'ACL_TABLE': {'DATAACL': {'ports': ['Ethernet0', 'Ethernet4'], 'type': 'L3'}},
+            'VLAN_MEMBER': {'Vlan1000|Ethernet0': {'tagging_mode': 'untagged'}},
+            'LOOPBACK': {'Loopback0': {}},
+        }
+
+    def check_changes(self, data, expected):
+        changes = self.cfggen._config_changes(self.current, data, serialize_key)
+        self.assertEqual(changes, expected)
+        # Applying the changes gives the same content as applying the whole data
+        self.assertEqual(mod_config(copy.deepcopy(self.current), changes),
+                         mod_config(copy.deepcopy(self.current), data))
+
+    def test_unchanged_entry(self):
+        self.check_changes({
+            'DEVICE_METADATA': {'localhost': {'hostname': 'switch1', 'bgp_asn': 65100}},
+            'VLAN_MEMBER': {('Vlan1000', 'Ethernet0'): {'tagging_mode': 'untagged'}},
+        }, {})
+
+    def test_changed_field(self):
+        self.check_changes({
+            'PORT': {
+                'Ethernet0': {'mtu': '9100', 'admin_status': 'down'},
+                'Ethernet4': {'mtu': '9100', 'admin_status': 'up'},
+            },
+        }, {'PORT': {'Ethernet0': {'admin_status': 'down'}}})
+
+    def test_list_field(self):
+        self.check_changes({
+            'ACL_TABLE': {'DATAACL': {'ports': ['Ethernet0', 'Ethernet4'], 'type': 'L3'}},
+        }, {})
+        self.check_changes({
+            'ACL_TABLE': {'DATAACL': {'ports': ['Ethernet0'], 'type': 'L3'}},
+        }, {'ACL_TABLE': {'DATAACL': {'ports': ['Ethernet0']}}})
+
+    def test_new_entry(self):
+        self.check_changes({
+            'PORT': {'Ethernet8': {'mtu': '9100'}},
+            'VLAN': {'Vlan1000': {'vlanid': '1000'}},
+        }, {'PORT': {'Ethernet8': {'mtu': '9100'}}, 'VLAN': {'Vlan1000': {'vlanid': '1000'}}})
+
+    def test_deleted_entry(self):
+        self.check_changes({
+            'PORT': {'Ethernet4': None, 'Ethernet8': None},
+            'VLAN_MEMBER': {('Vlan1000', 'Ethernet0'): None},
+        }, {'PORT': {'Ethernet4': None}, 'VLAN_MEMBER': {('Vlan1000', 'Ethernet0'): None}})
+
+    def test_deleted_table(self):
+        self.check_changes({'PORT': None, 'VLAN': None}, {'PORT': None})
+
+    def test_changes_only_requires_write_to_db(self):
+        argument = [utils.PYTHON_INTERPRETTER, cfggen_path, '-a', '{"key1":"value1"}', '-v', 'key1', '--changes-only']
+        with self.assertRaises(subprocess.CalledProcessError) as cm:
+            subprocess.check_output(argument, stderr=subprocess.STDOUT)
+        self.assertIn(b'--changes-only requires --write-to-db', cm.exception.output)
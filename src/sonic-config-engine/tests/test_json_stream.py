@@ -0,0 +1,43 @@
+import io
+import json
+import json_stream
+
+from unittest import TestCase
+
+
+def read_tables(text, chunk_size):
+    data = {}
+    for table, key, value in json_stream.iter_table_entries(io.StringIO(text), chunk_size):
+        if key is None:
+            data[table] = value
+        else:
+            data.setdefault(table, {})[key] = value
+    return data
+
+
+class TestJsonStream(TestCase):
+
+    def test_iter_table_entries(self):
+        text = json.dumps({
+            'PORT': {'Ethernet0': {'mtu': '9100', 'lanes': '0,1,2,3'}, 'Ethernet4': {}},
+            'VLAN_MEMBER': {'Vlan1000|Ethernet0': {'tagging_mode': 'untagged'}},
+            'ACL_TABLE': {'DATAACL': {'ports': ['Ethernet0', 'Ethernet4'], 'type': 'L3'}},
+            'EMPTY': {},
+            'hwaddr': 'e4:1d:2d:a5:f3:ad',
+            'numbers': [1, -2.5e-3, 12345678901234567890],
+            'escaped é"': {'key\\with\\"escapes': None, '': True},
+        }, indent=4)
+        # Small chunks cut keys, strings and numbers at every position
+        for chunk_size in (1, 2, 3, 7, 64, json_stream.READ_CHUNK_SIZE):
+            self.assertEqual(read_tables(text, chunk_size), json.loads(text))
+
+    def test_iter_table_entries_order(self):
+        text = '{"B": {"y": 1, "x": 2}, "A": 3}'
+        self.assertEqual(list(json_stream.iter_table_entries(io.StringIO(text))),
+                         [('B', 'y', 1), ('B', 'x', 2), ('A', None, 3)])
+
+    def test_iter_table_entries_invalid(self):
+        for text in ['', '[{"PORT": {}}]', '{"PORT": {}', '{"PORT": {}} {}', '{"PORT" {}}',
+                     '{"PORT": {"Ethernet0": {},}}', '{"PORT": {"Ethernet0": 1.}}']:
+            with self.assertRaises(ValueError):
+                read_tables(text, 5)
@@ -1,6 +1,8 @@
 import json
 import os
+import shutil
 import subprocess
+import tempfile
 import ipaddress
 import tests.common_utils as utils
 import minigraph
@@ -575,3 +577,21 @@ class TestCfgGenCaseInsensitive(TestCase):
         # TC2: For other minigraph, result should not contain FLEX_COUNTER_TABLE
         result = minigraph.parse_xml(self.sample_graph, port_config_file=self.port_config)
         self.assertNotIn('FLEX_COUNTER_TABLE', result)
+
+    def test_parse_minigraph_file_cache(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            graph = os.path.join(tmp_dir, 'minigraph.xml')
+            shutil.copy(self.sample_graph, graph)
+            parsed = minigraph.parse_minigraph_file(graph)
+            self.assertIs(minigraph.parse_minigraph_file(graph), parsed)
+            self.assertIsNotNone(parsed.find(str(minigraph.QName(minigraph.ns, "DpgDec"))))
+
+            # A modified file is parsed again
+            stat = os.stat(graph)
+            os.utime(graph, (stat.st_atime, stat.st_mtime + 10))
+            self.assertIsNot(minigraph.parse_minigraph_file(graph), parsed)
+            self.assertEqual(minigraph.parse_xml(graph, port_config_file=self.port_config),
+                             minigraph.parse_xml(self.sample_graph, port_config_file=self.port_config))
+        finally:
+            shutil.rmtree(tmp_dir)
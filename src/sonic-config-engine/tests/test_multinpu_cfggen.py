@@ -7,7 +7,8 @@ import unittest
 import yaml
 import tests.common_utils as utils
 
-from unittest import TestCase
+from io import StringIO
+from unittest import TestCase, mock
 from sonic_py_common.general import getstatusoutput_noshell
 
 
@@ -549,5 +550,40 @@ class TestMultiNpuCfgGen(TestCase):
         output = json.loads(self.run_script(argument, check_stderr=False, validateYang=False))
         self.assertDictEqual(output, {})
 
+    def run_cfggen_multi_asic(self, cfggen, argument):
+        """ Run sonic-cfggen in this process on a device with NUM_ASIC asics """
+        def port_config_file(hwsku=None, asic=None):
+            return self.port_config[int(asic)] if asic is not None else self.sample_port_config
+
+        with mock.patch.object(cfggen, 'is_multi_asic', return_value=True), \
+                mock.patch.object(cfggen, 'get_num_asics', return_value=NUM_ASIC), \
+                mock.patch.object(cfggen, 'load_namespace_config'), \
+                mock.patch('minigraph.is_multi_asic', return_value=True), \
+                mock.patch('portconfig.db_connect_configdb', return_value=None), \
+                mock.patch('sonic_py_common.device_info.get_platform', return_value=None), \
+                mock.patch('sonic_py_common.device_info.get_path_to_port_config_file', side_effect=port_config_file), \
+                mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+            cfggen.main(argument)
+        return stdout.getvalue()
+
+    def test_all_namespaces(self):
+        cfggen = utils.load_cfggen()
+        argument = ['-m', self.sample_graph, '-p', self.sample_port_config]
+        output = json.loads(self.run_cfggen_multi_asic(cfggen, argument + ['--all-namespaces', '--print-data']))
+        self.assertEqual(list(output.keys()), ['localhost'] + ['asic{}'.format(asic) for asic in range(NUM_ASIC)])
+        self.assertEqual(output['localhost'], json.loads(self.run_cfggen_multi_asic(cfggen, argument + ['--print-data'])))
+        for asic in range(NUM_ASIC):
+            # Each asic reads its own port config, not the host one given with -p
+            expected = json.loads(self.run_cfggen_multi_asic(
+                cfggen, ['-m', self.sample_graph, '-n', 'asic{}'.format(asic), '--print-data']))
+            self.assertEqual(output['asic{}'.format(asic)], expected)
+        self.assertNotEqual(output['asic0']['PORT'], output['localhost']['PORT'])
+
+        with mock.patch.object(cfggen, '_write_to_db') as mock_write:
+            self.run_cfggen_multi_asic(cfggen, argument + ['--all-namespaces', '--write-to-db'])
+        written = dict((call[0][0] or 'localhost', cfggen.FormatConverter.to_serialized(call[0][2]))
+                       for call in mock_write.call_args_list)
+        self.assertEqual(json.loads(json.dumps(written, cls=cfggen.minigraph_encoder)), output)
+
     def tearDown(self):
         os.environ["CFGGEN_UNIT_TESTING"] = ""
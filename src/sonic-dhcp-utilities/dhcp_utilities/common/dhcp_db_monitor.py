@@ -471,15 +471,16 @@ class DhcpServdDbMonitor(object):
         """
         _enable_monitor_checkers(checker_names, self.checker_dict)
 
-    def check_db_update(self, db_snapshot):
+    def check_db_update(self, db_snapshot, select_timeout=None):
         """
         Fetch db and check update
         Args:
             db_snapshot: dict contains db snapshot parameter
+            select_timeout: timeout of select in millisecond, self.select_timeout is used if it is None
         Returns:
             Whether need to refresh config file for kea-dhcp-server
         """
-        state, _ = self.sel.select(self.select_timeout)
+        state, _ = self.sel.select(self.select_timeout if select_timeout is None else select_timeout)
         if state == swsscommon.Select.TIMEOUT or state != swsscommon.Select.OBJECT:
             return False
         need_refresh = False
@@ -38,6 +38,16 @@ class DhcpDbConnector(object):
         """
         return _parse_table_to_dict(swsscommon.Table(self.state_db, table_name))
 
+    def get_state_db_table_keys(self, table_name):
+        """
+        Get keys of table from state_db, without reading the entries.
+        Args:
+            table_name: Name of table want to get.
+        Return:
+            List of keys.
+        """
+        return list(swsscommon.Table(self.state_db, table_name).getKeys())
+
 
 def get_entry(table, entry_name):
     """
@@ -64,7 +74,7 @@ def terminate_proc(proc):
     """
     Terminate process, to make sure it exit successfully
     Args:
-        proc: Process object in psutil
+        proc: Process object in psutil, or subprocess.Popen object
     """
     proc.terminate()
     proc.wait()
@@ -150,6 +160,17 @@ def _parse_table_to_dict(table):
     return ret
 
 
+def get_target_processes(process_name):
+    """
+    Get running processes
+    Args:
+        process_name: name of process
+    Returns:
+        List of psutil.Process
+    """
+    return [proc for proc in psutil.process_iter() if proc.name() == process_name]
+
+
 def get_target_process_cmds(process_name):
     """
     Get running process cmds
@@ -158,8 +179,4 @@ def get_target_process_cmds(process_name):
     Returns:
         List of cmds list
     """
-    res = []
-    for proc in psutil.process_iter():
-        if proc.name() == process_name:
-            res.append(proc.cmdline())
-    return res
+    return [proc.cmdline() for proc in get_target_processes(process_name)]
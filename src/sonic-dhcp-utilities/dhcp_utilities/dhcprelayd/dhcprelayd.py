@@ -1,5 +1,5 @@
-# TODO Add support for running different dhcrelay processes for each dhcp interface
-# Currently if we run multiple dhcrelay processes, except for the last running process,
+# dhcrelay could run as one process per dhcp interface by relay_per_interface, but it is not enabled by default:
+# currently if we run multiple dhcrelay processes, except for the last running process,
 # others will not relay dhcp_release packet.
 import psutil
 import re
@@ -8,7 +8,7 @@ import sys
 import syslog
 import time
 from swsscommon import swsscommon
-from dhcp_utilities.common.utils import DhcpDbConnector, terminate_proc, get_target_process_cmds
+from dhcp_utilities.common.utils import DhcpDbConnector, terminate_proc, get_target_processes
 from dhcp_utilities.common.dhcp_db_monitor import DhcpRelaydDbMonitor, DhcpServerTableIntfEnablementEventChecker, \
      VlanTableEventChecker, VlanIntfTableEventChecker, DhcpServerFeatureStateChecker
 
@@ -26,6 +26,47 @@ VLAN_INTF_CHECKER = "VlanIntfTableEventChecker"
 KILLED_OLD = 1
 NOT_KILLED = 2
 NOT_FOUND_PROC = 3
+# Process exits in this time after started is considered as failed to start
+MIN_RUNNING_TIME = 10  # unit: sec
+DHCRELAY = "dhcrelay"
+DHCPMON = "dhcpmon"
+
+
+class SupervisedProcess(object):
+    """
+    Process started by dhcprelayd. Its exit is learned by polling its pid, without scanning all processes
+    """
+    def __init__(self, name, cmds):
+        """
+        Args:
+            name: name of process, like dhcrelay, dhcpmon
+            cmds: command list to start process
+        """
+        self.name = name
+        self.cmds = cmds
+        self.popen = None
+        self.start_time = None
+
+    def start(self):
+        self.popen = subprocess.Popen(self.cmds)
+        self.start_time = time.monotonic()
+        syslog.syslog(syslog.LOG_INFO, "{} process started, cmds: {}".format(self.name, self.cmds))
+
+    def stop(self):
+        terminate_proc(self.popen)
+        syslog.syslog(syslog.LOG_INFO, "Kill process: {}".format(self.name))
+
+    def has_exited(self):
+        """
+        Check whether process has exited, the exited process is reaped
+        """
+        return self.popen.poll() is not None
+
+    def is_failed_to_start(self):
+        """
+        Check whether process exited soon after it started
+        """
+        return time.monotonic() - self.start_time < MIN_RUNNING_TIME
 
 
 class DhcpRelayd(object):
@@ -34,11 +75,13 @@ class DhcpRelayd(object):
     dhcp_relay_supervisor_config = {}
     supervisord_conf_path = ""
 
-    def __init__(self, db_connector, db_monitor, supervisord_conf_path=SUPERVISORD_CONF_PATH):
+    def __init__(self, db_connector, db_monitor, supervisord_conf_path=SUPERVISORD_CONF_PATH,
+                 relay_per_interface=False):
         """
         Args:
             db_connector: db connector obj
             select_timeout: timeout setting for subscribe db change
+            relay_per_interface: if True, run a dhcrelay process for each dhcp interface
         """
         self.db_connector = db_connector
         self.last_refresh_time = None
@@ -46,6 +89,13 @@ class DhcpRelayd(object):
         self.enabled_dhcp_interfaces = set()
         self.dhcp_server_feature_enabled = None
         self.supervisord_conf_path = supervisord_conf_path
+        self.relay_per_interface = relay_per_interface
+        # Processes started by dhcprelayd, key is name of process and dhcp interfaces it serves
+        self.supervised_procs = {}
+        # Processes left before dhcprelayd started are not supervised, they are killed in first refresh
+        self.exist_procs_killed = set()
+        # Processes started by supervisord found last time
+        self.supervisord_procs = []
 
     def start(self):
         """
@@ -116,6 +166,7 @@ class DhcpRelayd(object):
                         self.refresh_dhcrelay(True)
                     elif res.get(VLAN_CHECKER, False) or res.get(DHCP_SERVER_CHECKER, False):
                         self.refresh_dhcrelay(False)
+                self._check_supervised_procs()
 
             # If dhcp_server feature is disabled, dhcprelayd will checke whether dhcpmon/dhcrelay processes,
             # if they are not running as expected, dhcprelayd will kill itself to make dhcp_relay container restart.
@@ -124,8 +175,7 @@ class DhcpRelayd(object):
                 # processes follow supervisord configuration
                 if dhcp_feature_statue_changed:
                     self.dhcp_relayd_monitor.disable_checkers([DHCP_SERVER_CHECKER, VLAN_CHECKER, VLAN_INTF_CHECKER])
-                    self._kill_exist_relay_releated_process([], "dhcpmon", True)
-                    self._kill_exist_relay_releated_process([], "dhcrelay", True)
+                    self._stop_supervised_procs()
                     self._execute_supervisor_dhcp_relay_process("start")
                 # disabled -> disabled, to check whether dhcpmon/dhcrelay running status consistent with supervisord
                 # configuration
@@ -163,7 +213,10 @@ class DhcpRelayd(object):
         """
         Check whether dhcrelay running as expected, if not, dhcprelayd will exit with code 1
         """
-        running_cmds = get_target_process_cmds("dhcrelay")
+        # Processes found last time are reused while they are running, to avoid scanning all processes every time
+        if len(self.supervisord_procs) == 0 or not all(proc.is_running() for proc in self.supervisord_procs):
+            self.supervisord_procs = get_target_processes(DHCRELAY)
+        running_cmds = [proc.cmdline() for proc in self.supervisord_procs]
         running_cmds.sort()
         expected_cmds = [value for key, value in self.dhcp_relay_supervisor_config.items() if "isc-dhcpv4-relay" in key]
         expected_cmds.sort()
@@ -199,57 +252,90 @@ class DhcpRelayd(object):
         return res
 
     def _start_dhcrelay_process(self, new_dhcp_interfaces, dhcp_server_ip, force_kill):
-        # To check whether need to kill dhcrelay process
-        kill_res = self._kill_exist_relay_releated_process(new_dhcp_interfaces, "dhcrelay", force_kill)
-        if kill_res == NOT_KILLED:
-            # Means old running status consistent with the new situation, no need to run new
-            return
-
-        # No need to start new dhcrelay process
-        if len(new_dhcp_interfaces) == 0:
-            return
-
-        cmds = ["/usr/sbin/dhcrelay", "-d", "-m", "discard", "-a", "%h:%p", "%P", "--name-alias-map-file",
-                "/tmp/port-name-alias-map.txt"]
-        for dhcp_interface in new_dhcp_interfaces:
-            cmds += ["-id", dhcp_interface]
-        cmds += ["-iu", "docker0", dhcp_server_ip]
-        popen_res = subprocess.Popen(cmds)
-        # To make sure process start successfully not in zombie status
-        proc = psutil.Process(popen_res.pid)
-        time.sleep(1)
-        if proc.status() == psutil.STATUS_ZOMBIE:
-            syslog.syslog(syslog.LOG_ERR, "Failed to start dhcrelay process with: {}".format(cmds))
-            terminate_proc(proc)
-            sys.exit(1)
-
-        syslog.syslog(syslog.LOG_INFO, "dhcrelay process started successfully, cmds: {}".format(cmds))
+        """
+        Start dhcrelay processes for dhcp interfaces, running processes which are still as expected are kept
+        Args:
+            new_dhcp_interfaces: set of dhcp interfaces
+            dhcp_server_ip: ip of dhcp server
+            force_kill: if True, force kill old processes
+        """
+        if self.relay_per_interface:
+            relay_interfaces = [[dhcp_interface] for dhcp_interface in sorted(new_dhcp_interfaces)]
+        else:
+            relay_interfaces = [sorted(new_dhcp_interfaces)] if len(new_dhcp_interfaces) != 0 else []
+        expected_cmds = {}
+        for dhcp_interfaces in relay_interfaces:
+            cmds = ["/usr/sbin/dhcrelay", "-d", "-m", "discard", "-a", "%h:%p", "%P", "--name-alias-map-file",
+                    "/tmp/port-name-alias-map.txt"]
+            for dhcp_interface in dhcp_interfaces:
+                cmds += ["-id", dhcp_interface]
+            cmds += ["-iu", "docker0", dhcp_server_ip]
+            expected_cmds["{}-{}".format(DHCRELAY, "-".join(dhcp_interfaces))] = cmds
+        self._refresh_supervised_procs(DHCRELAY, expected_cmds, force_kill)
 
     def _start_dhcpmon_process(self, new_dhcp_interfaces, force_kill):
-        # To check whether need to kill dhcrelay process
-        kill_res = self._kill_exist_relay_releated_process(new_dhcp_interfaces, "dhcpmon", force_kill)
-        if kill_res == NOT_KILLED:
-            # Means old running status consistent with the new situation, no need to run new
-            return
+        """
+        Start dhcpmon process for each dhcp interface, running processes which are still as expected are kept
+        Args:
+            new_dhcp_interfaces: set of dhcp interfaces
+            force_kill: if True, force kill old processes
+        """
+        expected_cmds = {}
+        for dhcp_interface in new_dhcp_interfaces:
+            expected_cmds["{}-{}".format(DHCPMON, dhcp_interface)] = \
+                ["/usr/sbin/dhcpmon", "-id", dhcp_interface, "-iu", "docker0", "-im", "eth0"]
+        self._refresh_supervised_procs(DHCPMON, expected_cmds, force_kill)
 
-        # No need to start new dhcrelay process
-        if len(new_dhcp_interfaces) == 0:
-            return
+    def _refresh_supervised_procs(self, process_name, expected_cmds, force_kill):
+        """
+        Make processes started by dhcprelayd consistent with expected cmds, only processes whose cmds changed are
+        restarted
+        Args:
+            process_name: name of process, like dhcrelay, dhcpmon
+            expected_cmds: dict of expected processes, key is process key, value is cmds list
+            force_kill: if True, restart all processes
+        """
+        if process_name not in self.exist_procs_killed:
+            self._kill_exist_relay_releated_process([], process_name, True)
+            self.exist_procs_killed.add(process_name)
+        for key, proc in list(self.supervised_procs.items()):
+            if proc.name == process_name and (force_kill or expected_cmds.get(key) != proc.cmds):
+                proc.stop()
+                del self.supervised_procs[key]
+        for key, cmds in expected_cmds.items():
+            if key not in self.supervised_procs:
+                proc = SupervisedProcess(process_name, cmds)
+                proc.start()
+                self.supervised_procs[key] = proc
 
-        pids_cmds = {}
-        for dhcp_interface in new_dhcp_interfaces:
-            cmds = ["/usr/sbin/dhcpmon", "-id", dhcp_interface, "-iu", "docker0", "-im", "eth0"]
-            popen_res = subprocess.Popen(cmds)
-            pids_cmds[popen_res.pid] = cmds
-        time.sleep(1)
-        # To make sure process start successfully not in zombie status
-        for pid, cmds in pids_cmds.items():
-            proc = psutil.Process(pid)
-            if proc.status() == psutil.STATUS_ZOMBIE:
-                syslog.syslog(syslog.LOG_ERR, "Faild to start dhcpmon process: {}".format(cmds))
-                terminate_proc(proc)
-            else:
-                syslog.syslog(syslog.LOG_INFO, "dhcpmon process started successfully, cmds: {}".format(cmds))
+    def _check_supervised_procs(self):
+        """
+        Restart processes started by dhcprelayd which exited. If dhcrelay failed to start, dhcprelayd will exit with
+        code 1
+        """
+        for key, proc in list(self.supervised_procs.items()):
+            if not proc.has_exited():
+                continue
+            if proc.is_failed_to_start():
+                syslog.syslog(syslog.LOG_ERR, "Failed to start {} process with: {}".format(proc.name, proc.cmds))
+                if proc.name == DHCRELAY:
+                    sys.exit(1)
+                del self.supervised_procs[key]
+                continue
+            syslog.syslog(syslog.LOG_WARNING, "{} process exited, restart it".format(proc.name))
+            proc.start()
+
+    def _stop_supervised_procs(self):
+        """
+        Stop all dhcrelay/dhcpmon processes started by dhcprelayd
+        """
+        for proc in self.supervised_procs.values():
+            proc.stop()
+        self.supervised_procs = {}
+        for process_name in [DHCPMON, DHCRELAY]:
+            if process_name not in self.exist_procs_killed:
+                self._kill_exist_relay_releated_process([], process_name, True)
+                self.exist_procs_killed.add(process_name)
 
     def _kill_exist_relay_releated_process(self, new_dhcp_interfaces, process_name, force_kill):
         old_dhcp_interfaces = set()
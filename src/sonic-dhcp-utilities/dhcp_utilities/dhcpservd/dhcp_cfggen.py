@@ -2,6 +2,7 @@
 
 import ipaddress
 import os
+import socket
 import syslog
 
 from jinja2 import Environment, FileSystemLoader
@@ -26,6 +27,57 @@ DHCP_OPTION_FILE = f"{SCRIPT_DIR}/dhcp_option.csv"
 SUPPORT_DHCP_OPTION_TYPE = ["binary", "boolean", "ipv4-address", "string", "uint8", "uint16", "uint32"]
 
 
+def _ip_address(ip):
+    """
+    Same as ipaddress.ip_address(), but parse IPv4 address by inet_pton, which is much faster
+    """
+    try:
+        return ipaddress.IPv4Address(socket.inet_pton(socket.AF_INET, ip))
+    except OSError:
+        return ipaddress.ip_address(ip)
+
+
+class Ipv4NetworkIndex(object):
+    """
+    Index of IPv4 networks of a DHCP interface. Networks are indexed by network address for each prefix length, then
+    the network which contains a range is found by a lookup per prefix length, rather than checking every network
+    """
+    def __init__(self, dhcp_interface):
+        """
+        Args:
+            dhcp_interface: Ip and network information of DHCP interface, sample:
+                [{
+                    'network': IPv4Network('192.168.0.0/24'),
+                    'ip': '192.168.0.1/24'
+                }]
+        """
+        # key: netmask, value: dict of network address to (order of ip, ip)
+        self.networks = {}
+        for order, dhcp_interface_ip in enumerate(dhcp_interface):
+            network = dhcp_interface_ip["network"]
+            self.networks.setdefault(int(network.netmask), {}) \
+                .setdefault(int(network.network_address), (order, dhcp_interface_ip["ip"]))
+
+    def lookup(self, range_start, range_end):
+        """
+        Find the first ip of DHCP interface whose network contains the range
+        Args:
+            range_start: Start of range, in integer.
+            range_end: End of range, in integer.
+        Returns:
+            Ip string like '192.168.0.1/24', None if range is not in any network
+        """
+        res = None
+        for netmask, networks in self.networks.items():
+            network_address = range_start & netmask
+            if range_end & netmask != network_address:
+                continue
+            item = networks.get(network_address)
+            if item is not None and (res is None or item[0] < res[0]):
+                res = item
+        return res[1] if res is not None else None
+
+
 class DhcpServCfgGenerator(object):
     port_alias_map = {}
     lease_update_script_path = ""
@@ -37,6 +89,11 @@ class DhcpServCfgGenerator(object):
         self.db_connector = dhcp_db_connector
         self.lease_path = lease_path
         self.lease_update_script_path = lease_update_script_path
+        # Subnets and client classes of each DHCP interface, with config they are constructed from
+        self.interface_obj_cache = {}
+        # Last render object and config rendered from it. Objects are kept without copy, because config tables are
+        # read and parsed again for each generation, and these objects are not modified after construction
+        self.rendered_config = None
         # Read port alias map file, this file is render after container start, so it would not change any more
         self._parse_port_map_alias()
         # Get kea config template
@@ -101,7 +158,11 @@ class DhcpServCfgGenerator(object):
         return customized_options
 
     def _render_config(self, render_obj):
+        # Rendering is skipped if nothing changed since last time
+        if self.rendered_config is not None and self.rendered_config[0] == render_obj:
+            return self.rendered_config[1]
         output = self.kea_template.render(render_obj)
+        self.rendered_config = (render_obj, output)
         return output
 
     def _parse_vlan(self, vlan_interface, vlan_member):
@@ -134,7 +195,6 @@ class DhcpServCfgGenerator(object):
         client_classes = []
         enabled_dhcp_interfaces = set()
         used_options = set()
-        customized_option_keys = customized_options.keys()
         # Different mode would subscribe different table, always subscribe DHCP_SERVER_IPV4
         subscribe_table = set(["DhcpServerTableCfgChangeEventChecker"])
         for dhcp_interface_name, dhcp_config in dhcp_server_ipv4.items():
@@ -147,45 +207,17 @@ class DhcpServCfgGenerator(object):
                     syslog.syslog(syslog.LOG_WARNING, "Cannot get DHCP port config for {}"
                                   .format(dhcp_interface_name))
                     continue
-                curr_options = {}
-                if "customized_options" in dhcp_config:
-                    for option in dhcp_config["customized_options"]:
-                        if option not in customized_option_keys:
-                            syslog.syslog(syslog.LOG_WARNING, "Customized option {} configured for {} is not defined"
-                                          .format(option, dhcp_interface_name))
-                            continue
-                        curr_options[option] = {
-                            "always_send": customized_options[option]["always_send"],
-                            "value": customized_options[option]["value"]
-                        }
-                for dhcp_interface_ip, port_config in port_ips[dhcp_interface_name].items():
-                    pools = []
-                    for port_name, ip_ranges in port_config.items():
-                        ip_range = None
-                        for ip_range in ip_ranges:
-                            client_class = "{}:{}".format(hostname, port_name)
-                            ip_range = {
-                                "range": "{} - {}".format(ip_range[0], ip_range[1]),
-                                "client_class": client_class
-                            }
-                            pools.append(ip_range)
-                        if ip_range is not None:
-                            class_len = len(client_class)
-                            client_classes.append({
-                                "name": client_class,
-                                "condition": "substring(relay4[1].hex, -{}, {}) == '{}'".format(class_len, class_len,
-                                                                                                client_class)
-                            })
-                    subnet_obj = {
-                        "subnet": str(ipaddress.ip_network(dhcp_interface_ip, strict=False)),
-                        "pools": pools,
-                        "gateway": dhcp_config["gateway"],
-                        "server_id": dhcp_interface_ip.split("/")[0],
-                        "lease_time": dhcp_config["lease_time"] if "lease_time" in dhcp_config else DEFAULT_LEASE_TIME,
-                        "customized_options": curr_options
-                    }
+                intf_subnets, intf_client_classes = \
+                    self._get_interface_obj(dhcp_interface_name, dhcp_config, port_ips[dhcp_interface_name], hostname,
+                                            customized_options)
+                for subnet_obj in intf_subnets:
                     used_options = used_options | set(subnet_obj["customized_options"])
-                    subnets.append(subnet_obj)
+                subnets += intf_subnets
+                client_classes += intf_client_classes
+        # Drop objects of interfaces which are no longer in config
+        for dhcp_interface_name in list(self.interface_obj_cache.keys()):
+            if dhcp_interface_name not in port_ips or dhcp_interface_name not in enabled_dhcp_interfaces:
+                del self.interface_obj_cache[dhcp_interface_name]
         render_obj = {
             "subnets": subnets,
             "client_classes": client_classes,
@@ -195,6 +227,67 @@ class DhcpServCfgGenerator(object):
         }
         return render_obj, enabled_dhcp_interfaces, used_options, subscribe_table
 
+    def _get_interface_obj(self, dhcp_interface_name, dhcp_config, intf_port_ips, hostname, customized_options):
+        """
+        Get subnets and client classes of a DHCP interface, they are constructed again only if config of this
+        interface changed
+        Args:
+            dhcp_interface_name: Name of DHCP interface.
+            dhcp_config: Entry of DHCP interface in DHCP_SERVER_IPV4 table.
+            intf_port_ips: Ip ranges assign to member ports of DHCP interface.
+            hostname: Host name.
+            customized_options: Dict of customized options.
+        Returns:
+            List of subnets, list of client classes
+        """
+        intf_options = {option: customized_options.get(option) for option in dhcp_config.get("customized_options", [])}
+        inputs = (dhcp_config, intf_port_ips, hostname, intf_options)
+        cached_obj = self.interface_obj_cache.get(dhcp_interface_name)
+        if cached_obj is not None and cached_obj[0] == inputs:
+            return cached_obj[1], cached_obj[2]
+
+        subnets = []
+        client_classes = []
+        curr_options = {}
+        for option, config in intf_options.items():
+            if config is None:
+                syslog.syslog(syslog.LOG_WARNING, "Customized option {} configured for {} is not defined"
+                              .format(option, dhcp_interface_name))
+                continue
+            curr_options[option] = {
+                "always_send": config["always_send"],
+                "value": config["value"]
+            }
+        for dhcp_interface_ip, port_config in intf_port_ips.items():
+            pools = []
+            for port_name, ip_ranges in port_config.items():
+                ip_range = None
+                for ip_range in ip_ranges:
+                    client_class = "{}:{}".format(hostname, port_name)
+                    ip_range = {
+                        "range": "{} - {}".format(ip_range[0], ip_range[1]),
+                        "client_class": client_class
+                    }
+                    pools.append(ip_range)
+                if ip_range is not None:
+                    class_len = len(client_class)
+                    client_classes.append({
+                        "name": client_class,
+                        "condition": "substring(relay4[1].hex, -{}, {}) == '{}'".format(class_len, class_len,
+                                                                                        client_class)
+                    })
+            subnet_obj = {
+                "subnet": str(ipaddress.ip_network(dhcp_interface_ip, strict=False)),
+                "pools": pools,
+                "gateway": dhcp_config["gateway"],
+                "server_id": dhcp_interface_ip.split("/")[0],
+                "lease_time": dhcp_config["lease_time"] if "lease_time" in dhcp_config else DEFAULT_LEASE_TIME,
+                "customized_options": curr_options
+            }
+            subnets.append(subnet_obj)
+        self.interface_obj_cache[dhcp_interface_name] = (inputs, subnets, client_classes)
+        return subnets, client_classes
+
     def _get_dhcp_ipv4_tables_from_db(self):
         """
         Get DHCP Server IPv4 related table from config_db.
@@ -258,8 +351,8 @@ class DhcpServCfgGenerator(object):
             if list_length == 0 or list_length > 2:
                 syslog.syslog(syslog.LOG_WARNING, f"Length of {curr_range} is {list_length}, which is invalid!")
                 continue
-            address_start = ipaddress.ip_address(curr_range[0])
-            address_end = ipaddress.ip_address(curr_range[1] if list_length == 2 else curr_range[0])
+            address_start = _ip_address(curr_range[0])
+            address_end = _ip_address(curr_range[1] if list_length == 2 else curr_range[0])
             # To make sure order of range is correct
             if address_start > address_end:
                 syslog.syslog(syslog.LOG_WARNING, f"Start of {curr_range} is greater than end, skip it")
@@ -268,41 +361,36 @@ class DhcpServCfgGenerator(object):
 
         return ranges
 
-    def _match_range_network(self, dhcp_interface, dhcp_interface_name, port, range, port_ips):
+    def _match_range_network(self, network_index, dhcp_interface_name, port, range, port_ips):
         """
-        Loop the IP of the dhcp interface and find the network that target range is in this network. And to construct
-        below data to record range - port map
+        Find the first IP of the dhcp interface whose network contains target range. And to construct below data to
+        record range - port map
         {
             'Vlan1000': {
                 '192.168.0.1/24': {
                     'etp2': [
-                        [IPv4Address('192.168.0.7'), IPv4Address('192.168.0.7')]
+                        [3232235527, 3232235527]
                     ]
                 }
             }
         }
         Args:
-            dhcp_interface: Ip and network information of current DHCP interface, sample:
-                [{
-                    'network': IPv4Network('192.168.0.0/24'),
-                    'ip': '192.168.0.1/24'
-                }]
+            network_index: Ipv4NetworkIndex of current DHCP interface.
             dhcp_interface_name: Name of DHCP interface.
             port: Name of DHCP member port.
             range: Ip Range, sample:
                 [IPv4Address('192.168.0.2'), IPv4Address('192.168.0.5')]
         """
-        for dhcp_interface_ip in dhcp_interface:
-            if not range[0] in dhcp_interface_ip["network"] or \
-               not range[1] in dhcp_interface_ip["network"]:
-                continue
-            dhcp_interface_ip_str = dhcp_interface_ip["ip"]
-            if dhcp_interface_ip_str not in port_ips[dhcp_interface_name]:
-                port_ips[dhcp_interface_name][dhcp_interface_ip_str] = {}
-            if port not in port_ips[dhcp_interface_name][dhcp_interface_ip_str]:
-                port_ips[dhcp_interface_name][dhcp_interface_ip_str][port] = []
-            port_ips[dhcp_interface_name][dhcp_interface_ip_str][port].append([range[0], range[1]])
-            break
+        # Range of ipv6 addresses is not in any network
+        if range[0].version != 4 or range[1].version != 4:
+            return
+        range_start = int(range[0])
+        range_end = int(range[1])
+        dhcp_interface_ip_str = network_index.lookup(range_start, range_end)
+        if dhcp_interface_ip_str is None:
+            return
+        intf_port_ips = port_ips[dhcp_interface_name].setdefault(dhcp_interface_ip_str, {})
+        intf_port_ips.setdefault(port, []).append([range_start, range_end])
 
     def _parse_port(self, port_ipv4, vlan_interfaces, vlan_members, ranges):
         """
@@ -336,7 +424,7 @@ class DhcpServCfgGenerator(object):
             Set of used ranges.
         """
         port_ips = {}
-        ip_ports = {}
+        network_indexes = {}
         used_ranges = set()
         for port_key in list(port_ipv4.keys()):
             port_config = port_ipv4.get(port_key, {})
@@ -362,17 +450,15 @@ class DhcpServCfgGenerator(object):
                 continue
             if dhcp_interface_name not in port_ips:
                 port_ips[dhcp_interface_name] = {}
-            # Get ip information of Vlan
-            dhcp_interface = vlan_interfaces[dhcp_interface_name]
-
-            for dhcp_interface_ip in dhcp_interface:
-                ip_ports[str(dhcp_interface_ip["network"])] = dhcp_interface_name
+                # Index ip information of Vlan
+                network_indexes[dhcp_interface_name] = Ipv4NetworkIndex(vlan_interfaces[dhcp_interface_name])
+            network_index = network_indexes[dhcp_interface_name]
 
             if "ips" in port_config and len(port_config["ips"]) != 0:
                 for ip in set(port_config["ips"]):
-                    ip_address = ipaddress.ip_address(ip)
-                    # Loop the IP of the dhcp interface and find the network that target ip is in this network.
-                    self._match_range_network(dhcp_interface, dhcp_interface_name, port, [ip_address, ip_address],
+                    ip_address = _ip_address(ip)
+                    # Find the network of the dhcp interface that target ip is in.
+                    self._match_range_network(network_index, dhcp_interface_name, port, [ip_address, ip_address],
                                               port_ips)
             if "ranges" in port_config and len(port_config["ranges"]) != 0:
                 for range_name in list(port_config["ranges"]):
@@ -381,14 +467,15 @@ class DhcpServCfgGenerator(object):
                         continue
                     used_ranges.add(range_name)
                     range = ranges[range_name]
-                    # Loop the IP of the dhcp interface and find the network that target range is in this network.
-                    self._match_range_network(dhcp_interface, dhcp_interface_name, port, range, port_ips)
+                    # Find the network of the dhcp interface that target range is in.
+                    self._match_range_network(network_index, dhcp_interface_name, port, range, port_ips)
         # Merge ranges to avoid overlap
         for dhcp_interface_name, value in port_ips.items():
             for dhcp_interface_ip, port_range in value.items():
                 for port_name, ip_range in port_range.items():
                     ranges = merge_intervals(ip_range)
-                    ranges = [[str(range[0]), str(range[1])] for range in ranges]
+                    ranges = [[str(ipaddress.IPv4Address(range[0])), str(ipaddress.IPv4Address(range[1]))]
+                              for range in ranges]
                     port_ips[dhcp_interface_name][dhcp_interface_ip][port_name] = ranges
         return port_ips, used_ranges
 
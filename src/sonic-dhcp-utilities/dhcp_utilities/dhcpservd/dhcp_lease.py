@@ -1,14 +1,16 @@
+import os
 import signal
 import syslog
 import threading
-import time
 from abc import abstractmethod
-from collections import deque
 from datetime import datetime
+from swsscommon import swsscommon
 
 DHCP_SERVER_IPV4_LEASE = "DHCP_SERVER_IPV4_LEASE"
 KEA_LEASE_FILE_PATH = "/tmp/kea-lease.csv"
+KEA_LEASE_FILE_COLUMNS = 12
 DEFAULE_LEASE_UPDATE_INTERVAL = 2  # unit: sec
+LEASE_PIPELINE_SIZE = 1024
 
 
 class LeaseManager(object):
@@ -28,6 +30,9 @@ class LeaseHanlder(object):
         self.db_connector = db_connector
         self.lease_update_interval = lease_update_interval
         self.last_update_time = None
+        self.update_timer = None
+        # Leases written to STATE_DB, key is "<dhcp interface>|<mac>"
+        self.synced_lease = None
         self.lock = threading.Lock()
 
     @abstractmethod
@@ -44,52 +49,68 @@ class LeaseHanlder(object):
         """
         raise NotImplementedError
 
-    def update_lease(self):
+    def schedule_update(self):
+        """
+        Schedule an update of lease table. Updates requested while one is pending are merged into it, and an update
+        runs at least self.lease_update_interval after the previous one. Called in signal handler, hence never blocks
         """
-        Update lease table in STATE_DB
-        """
-        last_update_time = self.last_update_time
-        curr_time = datetime.now()
-        # If the time since the last update is less than self.lease_update_interval, then wait for a
-        # self.lease_update_interval
-        if last_update_time is not None and (curr_time - last_update_time).seconds < self.lease_update_interval:
-            time.sleep(self.lease_update_interval)
-            if self.last_update_time != last_update_time:
-                # Means lease has been updated during sleep, no need to update this lease
-                return
-        if not self.lock.acquire(False):
+        if self.update_timer is not None:
             return
-        new_lease = self._read()
-        # Store old lease key
-        old_lease_table = self.db_connector.get_state_db_table(DHCP_SERVER_IPV4_LEASE)
-        old_lease_key = set(old_lease_table.keys())
-
-        # 1.1 If start time equal to end time or lease expired, means lease has been released
-        #     1.1.1 If current lease table has this old lease, delete it
-        #     1.1.2 Else skip
-        # 1.2 Else, means lease valid, save it.
-        for key, value in new_lease.items():
+        delay = 0
+        if self.last_update_time is not None:
+            elapsed = (datetime.now() - self.last_update_time).total_seconds()
+            delay = max(0, self.lease_update_interval - elapsed)
+        self.update_timer = threading.Timer(delay, self._run_scheduled_update)
+        self.update_timer.daemon = True
+        self.update_timer.start()
+
+    def _run_scheduled_update(self):
+        # Clear timer before reading lease, lease changed after this would be handled by a new scheduled update
+        self.update_timer = None
+        try:
+            self.update_lease()
+        except Exception as err:
+            syslog.syslog(syslog.LOG_ERR, "Failed to update lease: {}".format(err))
+
+    def update_lease(self):
+        """
+        Update lease table in STATE_DB, only changed leases are written, in one pipeline
+        """
+        with self.lock:
+            new_lease = self._read()
+            if self.synced_lease is None:
+                # Lease table may be left by previous process, entries not valid now would be deleted
+                self.synced_lease = dict.fromkeys(self.db_connector.get_state_db_table_keys(DHCP_SERVER_IPV4_LEASE))
+
+            # If start time equal to end time or lease expired, means lease has been released
             unix_time = datetime.now().timestamp()
-            if value["lease_start"] == value["lease_end"] or unix_time >= int(value["lease_end"]):
-                if key in old_lease_key:
-                    self.db_connector.state_db.delete("{}|{}".format(DHCP_SERVER_IPV4_LEASE, key))
-                continue
-            new_key = "{}|{}".format(DHCP_SERVER_IPV4_LEASE, key)
-            for k, v in new_lease[key].items():
-                self.db_connector.state_db.hset(new_key, k, v)
-        # Delete old lease not in new lease set
-        for key in old_lease_key:
-            if key not in new_lease.keys():
-                # Delete entry
-                self.db_connector.state_db.delete("{}|{}".format(DHCP_SERVER_IPV4_LEASE, key))
-        self.last_update_time = datetime.now()
-        self.lock.release()
+            valid_lease = {key: value for key, value in new_lease.items()
+                           if value["lease_start"] != value["lease_end"] and unix_time < int(value["lease_end"])}
+
+            pipeline = swsscommon.RedisPipeline(self.db_connector.state_db, LEASE_PIPELINE_SIZE)
+            lease_table = swsscommon.Table(pipeline, DHCP_SERVER_IPV4_LEASE, True)
+            for key, value in valid_lease.items():
+                if self.synced_lease.get(key) != value:
+                    lease_table.set(key, swsscommon.FieldValuePairs(list(value.items())))
+            # Delete old lease not in valid lease set
+            for key in self.synced_lease.keys():
+                if key not in valid_lease:
+                    lease_table._del(key)
+            pipeline.flush()
+            self.synced_lease = valid_lease
+            self.last_update_time = datetime.now()
 
 
 class KeaDhcp4LeaseHandler(LeaseHanlder):
     def __init__(self, db_connector, lease_file=KEA_LEASE_FILE_PATH):
         LeaseHanlder.__init__(self, db_connector)
         self.lease_file = lease_file
+        # Offset of lease file has been read, and the inode of file, which changes when kea rewrites lease file
+        self.lease_file_offset = 0
+        self.lease_file_inode = None
+        self.lease_file_columns = KEA_LEASE_FILE_COLUMNS
+        # Newest lease row of each client, key is mac address, value is (ip, valid_lifetime, expire)
+        self.lease_rows = {}
 
     def register(self):
         """
@@ -97,35 +118,54 @@ class KeaDhcp4LeaseHandler(LeaseHanlder):
         """
         signal.signal(signal.SIGUSR1, self._update_lease)
 
-    def _read(self):
-        # Read lease file generated by kea-dhcp4
+    def _read_new_rows(self):
+        """
+        Read rows appended to lease file since last read. Kea only appends lease to lease file, except that it
+        rewrites the whole file when cleanup, then file would be read from start
+        """
         try:
-            with open(self.lease_file, "r", encoding="utf-8") as fb:
-                dq = deque(fb)
+            with open(self.lease_file, "rb") as fb:
+                stat = os.fstat(fb.fileno())
+                if stat.st_ino != self.lease_file_inode or stat.st_size < self.lease_file_offset:
+                    self.lease_file_inode = stat.st_ino
+                    self.lease_file_offset = 0
+                    self.lease_file_columns = KEA_LEASE_FILE_COLUMNS
+                    self.lease_rows = {}
+                fb.seek(self.lease_file_offset)
+                content = fb.read()
         except FileNotFoundError as err:
             syslog.syslog(syslog.LOG_ERR, "Cannot find lease file: {}".format(self.lease_file))
             raise err
 
-        fdb_info = self._get_fdb_info()
-        new_lease = {}
-        # Get newest lease information of each client
-        while dq:
-            last_row = dq.pop()
-            splits = last_row.split(",")
+        rows = content.decode("utf-8").split("\n")
+        # Rows are ended with line break, so the last one is an empty string, or a row being written. The later is
+        # parsed only if it has all columns, and it would be read again next time
+        partial_row = rows.pop()
+        self.lease_file_offset += len(content) - len(partial_row.encode("utf-8"))
+        if len(partial_row.split(",")) >= self.lease_file_columns:
+            rows.append(partial_row)
+        for row in rows:
+            splits = row.split(",")
             # Skip header
             if splits[0] == "address":
-                break
-            ip_str = splits[0]
-            mac_address = splits[1]
-            valid_lifetime = splits[3]
-            lease_end = splits[4]
+                self.lease_file_columns = len(splits)
+                continue
+            if len(splits) < 5:
+                continue
+            # Later row is newer
+            self.lease_rows[splits[1]] = (splits[0], splits[3], splits[4])
 
+    def _read(self):
+        # Read lease file generated by kea-dhcp4
+        self._read_new_rows()
+        fdb_info = self._get_fdb_info()
+        new_lease = {}
+        # Get newest lease information of each client
+        for mac_address, (ip_str, valid_lifetime, lease_end) in self.lease_rows.items():
             if mac_address not in fdb_info:
                 syslog.syslog(syslog.LOG_WARNING, "Cannot not find {} in fdb table".format(mac_address))
                 continue
             new_key = "{}|{}".format(fdb_info[mac_address], mac_address)
-            if new_key in new_lease:
-                continue
             new_lease[new_key] = {
                 "lease_start": str(int(lease_end) - int(valid_lifetime)),
                 "lease_end": lease_end,
@@ -142,12 +182,11 @@ class KeaDhcp4LeaseHandler(LeaseHanlder):
                 "aa:bb:cc:dd:ee:ff": "Vlan1000"
             }
         """
-        fdb_table = self.db_connector.get_state_db_table("FDB_TABLE")
         ret = {}
-        for key in fdb_table.keys():
+        for key in self.db_connector.get_state_db_table_keys("FDB_TABLE"):
             splits = key.split(":", 1)
             ret[splits[1]] = splits[0]
         return ret
 
     def _update_lease(self, signum, frame):
-        self.update_lease()
+        self.schedule_update()
@@ -20,6 +20,8 @@ DHCP_SERVER_IPV4_SERVER_IP = "DHCP_SERVER_IPV4_SERVER_IP"
 DHCP_SERVER_INTERFACE = "eth0"
 AF_INET = 2
 DEFAULT_SELECT_TIMEOUT = 5000  # millisecond
+COALESCE_SELECT_TIMEOUT = 500  # millisecond
+MAX_COALESCE_TIME = 5  # unit: sec
 
 
 class DhcpServd(object):
@@ -32,14 +34,25 @@ class DhcpServd(object):
         self.kea_dhcp4_config_path = kea_dhcp4_config_path
         self.dhcp_servd_monitor = monitor
         self.enabled_checker = None
+        self.kea_dhcp4_config = None
+        self.kea_dhcp4_proc = None
 
     def _notify_kea_dhcp4_proc(self):
         """
-        Send SIGHUP signal to kea-dhcp4 process
+        Send SIGHUP signal to kea-dhcp4 process, process found before is used if it is still running
         """
+        if self.kea_dhcp4_proc is not None:
+            try:
+                if self.kea_dhcp4_proc.is_running():
+                    self.kea_dhcp4_proc.send_signal(signal.SIGHUP)
+                    return
+            except psutil.NoSuchProcess:
+                pass
+            self.kea_dhcp4_proc = None
         for proc in psutil.process_iter():
             if KEA_DHCP4_PROC_NAME in proc.name():
                 proc.send_signal(signal.SIGHUP)
+                self.kea_dhcp4_proc = proc
                 break
 
     def dump_dhcp4_config(self):
@@ -56,10 +69,14 @@ class DhcpServd(object):
         self.used_range = used_ranges
         self.enabled_dhcp_interfaces = enabled_dhcp_interfaces
         self.used_options = used_options
+        # Config changes which don't change kea config don't need kea-dhcp4 to reload
+        if kea_dhcp4_config == self.kea_dhcp4_config:
+            return
         with open(self.kea_dhcp4_config_path, "w") as write_file:
             write_file.write(kea_dhcp4_config)
             # After refresh kea-config, we need to SIGHUP kea-dhcp4 process to read new config
             self._notify_kea_dhcp4_proc()
+        self.kea_dhcp4_config = kea_dhcp4_config
 
     def _update_dhcp_server_ip(self):
         """
@@ -86,17 +103,30 @@ class DhcpServd(object):
         lease_manager = LeaseManager(self.db_connector, KEA_LEASE_FILE_PATH)
         lease_manager.start()
 
+    def _get_db_snapshot(self):
+        return {
+            "enabled_dhcp_interfaces": self.enabled_dhcp_interfaces,
+            "used_range": self.used_range,
+            "used_options": self.used_options
+        }
+
     def wait(self):
         while True:
-            db_snapshot = {
-                "enabled_dhcp_interfaces": self.enabled_dhcp_interfaces,
-                "used_range": self.used_range,
-                "used_options": self.used_options
-            }
-            res = self.dhcp_servd_monitor.check_db_update(db_snapshot)
+            res = self.dhcp_servd_monitor.check_db_update(self._get_db_snapshot())
             if res:
+                self._wait_for_update_done()
                 self.dump_dhcp4_config()
 
+    def _wait_for_update_done(self):
+        """
+        Wait until no more config change comes in COALESCE_SELECT_TIMEOUT, but no longer than MAX_COALESCE_TIME, to
+        make a burst of config changes cause one config generation
+        """
+        end_time = time.time() + MAX_COALESCE_TIME
+        while time.time() < end_time:
+            if not self.dhcp_servd_monitor.check_db_update(self._get_db_snapshot(), COALESCE_SELECT_TIMEOUT):
+                break
+
 
 def main():
     dhcp_db_connector = DhcpDbConnector(redis_sock=REDIS_SOCK_PATH)
@@ -70,6 +70,9 @@ class MockProc(object):
     def send_signal(self, sig_num):
         pass
 
+    def is_running(self):
+        return True
+
     def cmdline(self):
         if self.proc_name == "dhcrelay":
             return ["/usr/sbin/dhcrelay", "-d", "-m", "discard", "-a", "%h:%p", "%P", "--name-alias-map-file",
@@ -88,8 +91,18 @@ class MockProc(object):
 
 
 class MockPopen(object):
-    def __init__(self, pid):
+    def __init__(self, pid, returncode=None):
         self.pid = pid
+        self.returncode = returncode
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        pass
+
+    def wait(self):
+        pass
 
 
 def mock_exit_func(status):
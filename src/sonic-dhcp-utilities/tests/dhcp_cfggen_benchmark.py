@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""dhcp_cfggen_benchmark.py
+
+Measure the kea-dhcp4 config generation of DhcpServCfgGenerator on a large
+generated CONFIG_DB: DHCP interfaces on many VLANs, thousands of member ports
+in PORT mode, and ranges and ips assigned to each of them. CONFIG_DB is read
+from memory, the config is rendered with the template in tests/test_data.
+
+Examples:
+    python3 tests/dhcp_cfggen_benchmark.py
+    python3 tests/dhcp_cfggen_benchmark.py --ports 4000 --ranges 10000 --vlans 64
+"""
+
+import argparse
+import ipaddress
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from dhcp_utilities.common.utils import DhcpDbConnector  # noqa: E402
+from dhcp_utilities.dhcpservd.dhcp_cfggen import DhcpServCfgGenerator  # noqa: E402
+from swsscommon import swsscommon  # noqa: E402
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_data", "kea-dhcp4.conf.j2")
+OPTION_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "dhcp_utilities", "dhcpservd",
+                           "dhcp_option.csv")
+
+
+def generate_config_db(num_ports, num_ranges, num_vlans):
+    """
+    Generate CONFIG_DB with num_vlans DHCP interfaces, each has a /16 network and a /24 network. Ports are spread
+    over vlans, ranges are spread over ports, every 10th port gets ips instead of ranges
+    """
+    config_db = {
+        "DEVICE_METADATA": {"localhost": {"hostname": "sonic-host"}},
+        "PORT": {},
+        "PORTCHANNEL": {},
+        "VLAN_INTERFACE": {},
+        "VLAN_MEMBER": {},
+        "DHCP_SERVER_IPV4": {},
+        "DHCP_SERVER_IPV4_CUSTOMIZED_OPTIONS": {},
+        "DHCP_SERVER_IPV4_RANGE": {},
+        "DHCP_SERVER_IPV4_PORT": {}
+    }
+    networks = []
+    for vlan_idx in range(num_vlans):
+        vlan = "Vlan{}".format(1000 + vlan_idx)
+        network = ipaddress.ip_network("10.{}.0.0/16".format(vlan_idx))
+        config_db["VLAN_INTERFACE"][vlan] = {"NULL": "NULL"}
+        config_db["VLAN_INTERFACE"]["{}|10.{}.0.1/16".format(vlan, vlan_idx)] = {"NULL": "NULL"}
+        config_db["VLAN_INTERFACE"]["{}|172.{}.{}.1/24".format(vlan, 16 + vlan_idx // 256, vlan_idx % 256)] = \
+            {"NULL": "NULL"}
+        config_db["VLAN_INTERFACE"]["{}|fc02:{}::1/64".format(vlan, 1000 + vlan_idx)] = {"NULL": "NULL"}
+        config_db["DHCP_SERVER_IPV4"][vlan] = {
+            "gateway": "10.{}.0.1".format(vlan_idx),
+            "lease_time": "900",
+            "mode": "PORT",
+            "netmask": "255.255.0.0",
+            "state": "enabled"
+        }
+        networks.append((vlan, int(network.network_address)))
+
+    for port_idx in range(num_ports):
+        port = "Ethernet{}".format(port_idx)
+        vlan, _ = networks[port_idx % num_vlans]
+        config_db["PORT"][port] = {"alias": "etp{}".format(port_idx + 1)}
+        config_db["VLAN_MEMBER"]["{}|{}".format(vlan, port)] = {"tagging_mode": "untagged"}
+        config_db["DHCP_SERVER_IPV4_PORT"]["{}|{}".format(vlan, port)] = {"ranges": []}
+
+    for range_idx in range(num_ranges):
+        port_idx = range_idx % num_ports
+        vlan, network_start = networks[port_idx % num_vlans]
+        port_key = "{}|Ethernet{}".format(vlan, port_idx)
+        # Ports of a vlan get consecutive blocks of 8 addresses in its /16 network
+        start = network_start + 256 + (range_idx // num_vlans) * 8
+        range_name = "range{}".format(range_idx)
+        config_db["DHCP_SERVER_IPV4_RANGE"][range_name] = {
+            "range": [str(ipaddress.ip_address(start)), str(ipaddress.ip_address(start + 5))]
+        }
+        if port_idx % 10 == 0:
+            config_db["DHCP_SERVER_IPV4_PORT"][port_key] = {"ips": [str(ipaddress.ip_address(start + 6))]}
+        else:
+            config_db["DHCP_SERVER_IPV4_PORT"][port_key]["ranges"].append(range_name)
+    return config_db
+
+
+def run(config_db):
+    with patch.object(DhcpDbConnector, "get_config_db_table", side_effect=lambda table: config_db.get(table, {})):
+        dhcp_cfg_generator = DhcpServCfgGenerator(DhcpDbConnector(), dhcp_option_path=OPTION_PATH,
+                                                  kea_conf_template_path=TEMPLATE_PATH)
+        vlan_interfaces, vlan_members = dhcp_cfg_generator._parse_vlan(config_db["VLAN_INTERFACE"],
+                                                                       config_db["VLAN_MEMBER"])
+        ranges = dhcp_cfg_generator._parse_range(config_db["DHCP_SERVER_IPV4_RANGE"])
+        start = time.time()
+        port_ips, _ = dhcp_cfg_generator._parse_port(config_db["DHCP_SERVER_IPV4_PORT"], vlan_interfaces,
+                                                     vlan_members, ranges)
+        parse_port_time = time.time() - start
+        start = time.time()
+        kea_dhcp4_config, _, _, _, _ = dhcp_cfg_generator.generate()
+        generate_time = time.time() - start
+    return parse_port_time, generate_time, port_ips, kea_dhcp4_config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark kea-dhcp4 config generation of DhcpServCfgGenerator")
+    parser.add_argument("--ports", type=int, default=4000, help="number of DHCP member ports")
+    parser.add_argument("--ranges", type=int, default=10000, help="number of ranges")
+    parser.add_argument("--vlans", type=int, default=16, help="number of DHCP interfaces")
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    config_db = generate_config_db(args.ports, args.ranges, args.vlans)
+    parse_port_timings = []
+    generate_timings = []
+    with patch.object(swsscommon.DBConnector, "__init__", return_value=None):
+        for _ in range(args.iterations):
+            parse_port_time, generate_time, port_ips, kea_dhcp4_config = run(config_db)
+            parse_port_timings.append(parse_port_time)
+            generate_timings.append(generate_time)
+
+    pool_count = sum(len(ip_ranges) for intf in port_ips.values() for ip in intf.values()
+                     for ip_ranges in ip.values())
+    print("{} ports, {} ranges, {} vlans: {} pools, {} bytes of config".format(
+        args.ports, args.ranges, args.vlans, pool_count, len(kea_dhcp4_config)))
+    print("_parse_port: min {:.1f} ms, mean {:.1f} ms over {} runs".format(
+        min(parse_port_timings) * 1000, sum(parse_port_timings) / len(parse_port_timings) * 1000, args.iterations))
+    print("generate: min {:.1f} ms, mean {:.1f} ms over {} runs".format(
+        min(generate_timings) * 1000, sum(generate_timings) / len(generate_timings) * 1000, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
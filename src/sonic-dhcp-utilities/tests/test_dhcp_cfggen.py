@@ -4,8 +4,8 @@ import json
 import pytest
 from common_utils import MockConfigDb, mock_get_config_db_table, PORT_MODE_CHECKER
 from dhcp_utilities.common.utils import DhcpDbConnector
-from dhcp_utilities.dhcpservd.dhcp_cfggen import DhcpServCfgGenerator
-from unittest.mock import patch
+from dhcp_utilities.dhcpservd.dhcp_cfggen import DhcpServCfgGenerator, Ipv4NetworkIndex, _ip_address
+from unittest.mock import patch, MagicMock
 
 expected_dhcp_config = {
     "Dhcp4": {
@@ -316,6 +316,26 @@ def test_parse_port(test_config_db, mock_swsscommon_dbconnector_init, mock_get_r
                            if test_config_db == "mock_config_db.json" else set())
 
 
+def test_ipv4_network_index():
+    dhcp_interface = [
+        {"network": ipaddress.ip_network("192.168.0.0/21"), "ip": "192.168.0.1/21"},
+        {"network": ipaddress.ip_network("192.168.0.0/24"), "ip": "192.168.0.2/24"},
+        {"network": ipaddress.ip_network("192.168.1.0/24"), "ip": "192.168.1.1/24"},
+        {"network": ipaddress.ip_network("10.0.0.0/8"), "ip": "10.0.0.1/8"}
+    ]
+    network_index = Ipv4NetworkIndex(dhcp_interface)
+    for range, expected_ip in [(["192.168.1.2", "192.168.1.10"], "192.168.0.1/21"),
+                               (["192.168.0.2", "192.168.2.10"], "192.168.0.1/21"),
+                               (["10.1.2.3", "10.1.2.3"], "10.0.0.1/8"),
+                               (["192.168.7.2", "192.168.8.10"], None),
+                               (["172.16.0.1", "172.16.0.5"], None)]:
+        range_start, range_end = [int(_ip_address(ip)) for ip in range]
+        assert network_index.lookup(range_start, range_end) == expected_ip
+    assert Ipv4NetworkIndex(dhcp_interface[1:]).lookup(int(_ip_address("192.168.1.2")),
+                                                       int(_ip_address("192.168.1.2"))) == "192.168.1.1/24"
+    assert _ip_address("fc02::1") == ipaddress.ip_address("fc02::1")
+
+
 def test_generate(mock_swsscommon_dbconnector_init, mock_parse_port_map_alias, mock_get_render_template):
     with patch.object(DhcpServCfgGenerator, "_parse_hostname"), \
          patch.object(DhcpServCfgGenerator, "_parse_vlan", return_value=(None, None)), \
@@ -365,6 +385,54 @@ def test_construct_obj_for_template(mock_swsscommon_dbconnector_init, mock_parse
     assert subscribe_table == set(PORT_MODE_CHECKER)
 
 
+def test_construct_obj_for_template_cache(mock_swsscommon_dbconnector_init, mock_parse_port_map_alias,
+                                          mock_get_render_template):
+    mock_config_db = MockConfigDb(config_db_path="tests/test_data/mock_config_db.json")
+    dhcp_server_ipv4 = copy.deepcopy(mock_config_db.config_db.get("DHCP_SERVER_IPV4"))
+    customized_options = {"option223": {"id": "223", "value": "dummy_value", "type": "string", "always_send": "true"}}
+    port_ips = {
+        "Vlan1000": {
+            "192.168.0.1/21": {
+                "etp8": [["192.168.0.2", "192.168.0.6"], ["192.168.0.10", "192.168.0.10"]],
+                "etp7": [["192.168.0.7", "192.168.0.7"]],
+                "etp9": []
+            }
+        }
+    }
+    dhcp_cfg_generator = DhcpServCfgGenerator(DhcpDbConnector())
+    render_obj, _, _, _ = dhcp_cfg_generator._construct_obj_for_template(dhcp_server_ipv4, port_ips, "sonic-host",
+                                                                         customized_options)
+    assert render_obj == expected_render_obj
+    subnet_obj = render_obj["subnets"][0]
+    # Objects of interface are reused when its config doesn't change
+    render_obj, _, _, _ = dhcp_cfg_generator._construct_obj_for_template(dhcp_server_ipv4, port_ips, "sonic-host",
+                                                                         customized_options)
+    assert render_obj["subnets"][0] is subnet_obj
+    # And constructed again after it changes
+    dhcp_server_ipv4 = copy.deepcopy(dhcp_server_ipv4)
+    dhcp_server_ipv4["Vlan1000"]["lease_time"] = "1800"
+    render_obj, _, _, _ = dhcp_cfg_generator._construct_obj_for_template(dhcp_server_ipv4, port_ips, "sonic-host",
+                                                                         customized_options)
+    assert render_obj["subnets"][0] is not subnet_obj
+    assert render_obj["subnets"][0]["lease_time"] == "1800"
+    dhcp_server_ipv4 = copy.deepcopy(dhcp_server_ipv4)
+    dhcp_server_ipv4["Vlan1000"]["state"] = "disabled"
+    dhcp_cfg_generator._construct_obj_for_template(dhcp_server_ipv4, port_ips, "sonic-host", customized_options)
+    assert dhcp_cfg_generator.interface_obj_cache == {}
+
+
+def test_render_config_cache(mock_swsscommon_dbconnector_init, mock_parse_port_map_alias, mock_get_render_template):
+    dhcp_cfg_generator = DhcpServCfgGenerator(DhcpDbConnector())
+    dhcp_cfg_generator.kea_template = MagicMock()
+    dhcp_cfg_generator.kea_template.render.return_value = "dummy_config"
+    render_obj = copy.deepcopy(expected_render_obj)
+    assert dhcp_cfg_generator._render_config(render_obj) == "dummy_config"
+    assert dhcp_cfg_generator._render_config(copy.deepcopy(expected_render_obj)) == "dummy_config"
+    dhcp_cfg_generator.kea_template.render.assert_called_once_with(render_obj)
+    dhcp_cfg_generator._render_config(dict(render_obj, subnets=[]))
+    assert dhcp_cfg_generator.kea_template.render.call_count == 2
+
+
 @pytest.mark.parametrize("with_port_config", [True, False])
 @pytest.mark.parametrize("with_option_config", [True, False])
 def test_render_config(mock_swsscommon_dbconnector_init, mock_parse_port_map_alias, with_port_config,
@@ -1,3 +1,5 @@
+import copy
+from datetime import datetime
 from dhcp_utilities.common.utils import DhcpDbConnector
 from dhcp_utilities.dhcpservd.dhcp_lease import KeaDhcp4LeaseHandler, LeaseHanlder
 from freezegun import freeze_time
@@ -54,13 +56,13 @@ def test_read_kea_lease(mock_swsscommon_dbconnector_init):
 
 
 def test_get_fdb_info(mock_swsscommon_dbconnector_init):
-    mock_fdb_table = {
-        "Vlan2000:10:70:fd:b6:13:15": {"port": "Ethernet31", "type": "dynamic"},
-        "Vlan1000:10:70:fd:b6:13:00": {"port": "Ethernet32", "type": "dynamic"},
-        "Vlan1000:10:70:fd:b6:13:17": {"port": "Ethernet33", "type": "dynamic"},
-        "Vlan1000:10:70:fd:b6:13:18": {"port": "Ethernet34", "type": "dynamic"}
-    }
-    with patch("dhcp_utilities.common.utils.DhcpDbConnector.get_state_db_table", return_value=mock_fdb_table):
+    mock_fdb_keys = [
+        "Vlan2000:10:70:fd:b6:13:15",
+        "Vlan1000:10:70:fd:b6:13:00",
+        "Vlan1000:10:70:fd:b6:13:17",
+        "Vlan1000:10:70:fd:b6:13:18"
+    ]
+    with patch("dhcp_utilities.common.utils.DhcpDbConnector.get_state_db_table_keys", return_value=mock_fdb_keys):
         db_connector = DhcpDbConnector()
         kea_lease_handler = KeaDhcp4LeaseHandler(db_connector, lease_file="tests/test_data/kea-lease.csv")
         # Verify whether lease information read is as expected
@@ -68,41 +70,108 @@ def test_get_fdb_info(mock_swsscommon_dbconnector_init):
         assert fdb_info == expected_fdb_info
 
 
+def test_read_kea_lease_incrementally(mock_swsscommon_dbconnector_init, tmp_path):
+    lease_file = tmp_path / "kea-lease.csv"
+    with open("tests/test_data/kea-lease.csv") as fb:
+        rows = fb.readlines()
+    lease_file.write_text("".join(rows[:-1]))
+    with patch.object(KeaDhcp4LeaseHandler, "_get_fdb_info", return_value=expected_fdb_info):
+        db_connector = DhcpDbConnector()
+        kea_lease_handler = KeaDhcp4LeaseHandler(db_connector, lease_file=str(lease_file))
+        lease = kea_lease_handler._read()
+        assert "Vlan1000|10:70:fd:b6:13:18" not in lease
+        # Appended row is read, and a row being written is left to next read
+        with open(str(lease_file), "a") as fb:
+            fb.write(rows[-1] + "\n192.168.0.3,10:70:fd:b6:13:15,,36")
+        offset = kea_lease_handler.lease_file_offset
+        assert kea_lease_handler._read() == expected_lease
+        assert kea_lease_handler.lease_file_offset == offset + len(rows[-1]) + 1
+        # Lease file rewritten by kea lease file cleanup is read from start
+        lease_file.write_text(rows[0] + rows[-1])
+        assert kea_lease_handler._read() == {
+            "Vlan1000|10:70:fd:b6:13:18": expected_lease["Vlan1000|10:70:fd:b6:13:18"]
+        }
+
+
 # Cannot mock built-in/extension type function(datetime.datetime.timestamp), need to free time
 @freeze_time("2023-09-08")
 def test_update_kea_lease(mock_swsscommon_dbconnector_init, mock_swsscommon_table_init):
-    tested_lease = expected_lease
-    mock_lease_table = {
-        "Vlan1000|aa:bb:cc:dd:ee:ff": {},
-        "Vlan1000|10:70:fd:b6:13:00": {},
-        "Vlan1000|10:70:fd:b6:13:17": {},
-        "Vlan1000|10:70:fd:b6:13:18": {}
-    }
-    with patch.object(swsscommon.Table, "getKeys"), \
-         patch.object(swsscommon.DBConnector, "hset") as mock_hset, \
+    tested_lease = copy.deepcopy(expected_lease)
+    mock_lease_keys = [
+        "Vlan1000|aa:bb:cc:dd:ee:ff",
+        "Vlan1000|10:70:fd:b6:13:00",
+        "Vlan1000|10:70:fd:b6:13:17",
+        "Vlan1000|10:70:fd:b6:13:18"
+    ]
+    with patch.object(swsscommon, "RedisPipeline") as mock_pipeline, \
+         patch.object(swsscommon.Table, "set", create=True) as mock_set, \
+         patch.object(swsscommon.Table, "_del", create=True) as mock_del, \
          patch.object(KeaDhcp4LeaseHandler, "_read", MagicMock(return_value=tested_lease)), \
-         patch.object(DhcpDbConnector, "get_state_db_table",
-                      return_value=mock_lease_table), \
-         patch.object(swsscommon.DBConnector, "delete") as mock_delete, \
-         patch("time.sleep", return_value=None) as mock_sleep:
+         patch.object(DhcpDbConnector, "get_state_db_table_keys", return_value=mock_lease_keys) as mock_get_keys:
         db_connector = DhcpDbConnector()
         kea_lease_handler = KeaDhcp4LeaseHandler(db_connector)
         kea_lease_handler.update_lease()
         # Verify that old key was deleted
-        mock_delete.assert_has_calls([
-            call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:00"),
-            call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:17"),
-            call("DHCP_SERVER_IPV4_LEASE|Vlan1000|aa:bb:cc:dd:ee:ff")
-        ])
+        mock_del.assert_has_calls([
+            call("Vlan1000|aa:bb:cc:dd:ee:ff"),
+            call("Vlan1000|10:70:fd:b6:13:00"),
+            call("Vlan1000|10:70:fd:b6:13:17")
+        ], any_order=True)
+        assert mock_del.call_count == 3
         # Verify that lease has been updated, to be noted that lease for "192.168.0.2" didn't been updated because
         # lease_start equals to lease_end
-        mock_hset.assert_has_calls([
-            call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:18", "lease_start", "1697607205"),
-            call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:18", "lease_end", "1697610805"),
-            call("DHCP_SERVER_IPV4_LEASE|Vlan1000|10:70:fd:b6:13:18", "ip", "193.168.0.132")
+        mock_set.assert_called_once_with("Vlan1000|10:70:fd:b6:13:18", [
+            ("lease_start", "1697607205"),
+            ("lease_end", "1697610805"),
+            ("ip", "193.168.0.132")
         ])
+        mock_pipeline.return_value.flush.assert_called_once_with()
+
+        # Only changed lease is written, lease table in STATE_DB is read once
+        mock_set.reset_mock()
+        mock_del.reset_mock()
+        tested_lease["Vlan1000|10:70:fd:b6:13:18"] = dict(tested_lease["Vlan1000|10:70:fd:b6:13:18"],
+                                                          ip="193.168.0.133")
+        tested_lease["Vlan1000|10:70:fd:b6:13:19"] = {
+            "lease_start": "1697607205",
+            "lease_end": "1697610805",
+            "ip": "193.168.0.134"
+        }
+        kea_lease_handler.update_lease()
+        mock_set.assert_has_calls([
+            call("Vlan1000|10:70:fd:b6:13:18", [
+                ("lease_start", "1697607205"), ("lease_end", "1697610805"), ("ip", "193.168.0.133")
+            ]),
+            call("Vlan1000|10:70:fd:b6:13:19", [
+                ("lease_start", "1697607205"), ("lease_end", "1697610805"), ("ip", "193.168.0.134")
+            ])
+        ])
+        assert mock_set.call_count == 2
+        mock_del.assert_not_called()
+        del tested_lease["Vlan1000|10:70:fd:b6:13:19"]
         kea_lease_handler.update_lease()
-        mock_sleep.assert_called_once_with(2)
+        mock_del.assert_called_once_with("Vlan1000|10:70:fd:b6:13:19")
+        mock_get_keys.assert_called_once_with("DHCP_SERVER_IPV4_LEASE")
+
+
+def test_schedule_update_lease(mock_swsscommon_dbconnector_init):
+    with patch("threading.Timer") as mock_timer, \
+         patch.object(KeaDhcp4LeaseHandler, "update_lease") as mock_update_lease:
+        db_connector = DhcpDbConnector()
+        kea_lease_handler = KeaDhcp4LeaseHandler(db_connector)
+        # Signals received while update is pending are merged
+        kea_lease_handler._update_lease(None, None)
+        kea_lease_handler._update_lease(None, None)
+        mock_timer.assert_called_once_with(0, kea_lease_handler._run_scheduled_update)
+        mock_timer.return_value.start.assert_called_once_with()
+        kea_lease_handler._run_scheduled_update()
+        mock_update_lease.assert_called_once_with()
+        # Update is delayed to lease_update_interval after last update
+        mock_timer.reset_mock()
+        kea_lease_handler.last_update_time = datetime.now()
+        kea_lease_handler._update_lease(None, None)
+        delay = mock_timer.call_args[0][0]
+        assert 0 < delay <= kea_lease_handler.lease_update_interval
 
 
 def test_no_implement(mock_swsscommon_dbconnector_init):
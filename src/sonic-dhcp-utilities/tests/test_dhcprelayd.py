@@ -6,9 +6,10 @@ import time
 from common_utils import mock_get_config_db_table, MockProc, MockPopen, MockSubprocessRes, mock_exit_func
 from dhcp_utilities.common.utils import DhcpDbConnector
 from dhcp_utilities.common.dhcp_db_monitor import ConfigDbEventChecker, DhcpRelaydDbMonitor
-from dhcp_utilities.dhcprelayd.dhcprelayd import DhcpRelayd, KILLED_OLD, NOT_KILLED, NOT_FOUND_PROC
+from dhcp_utilities.dhcprelayd.dhcprelayd import DhcpRelayd, SupervisedProcess, KILLED_OLD, NOT_KILLED, \
+    NOT_FOUND_PROC
 from swsscommon import swsscommon
-from unittest.mock import patch, call, ANY, PropertyMock
+from unittest.mock import patch, call, ANY, MagicMock, PropertyMock
 
 
 @pytest.mark.parametrize("dhcp_server_enabled", [True, False])
@@ -43,64 +44,124 @@ def test_refresh_dhcrelay(mock_swsscommon_dbconnector_init):
 
 
 @pytest.mark.parametrize("new_dhcp_interfaces", [[], ["Vlan1000"], ["Vlan1000", "Vlan2000"]])
-@pytest.mark.parametrize("kill_res", [KILLED_OLD, NOT_KILLED, NOT_FOUND_PROC])
-@pytest.mark.parametrize("proc_status", [psutil.STATUS_ZOMBIE, psutil.STATUS_RUNNING])
-def test_start_dhcrelay_process(mock_swsscommon_dbconnector_init, new_dhcp_interfaces, kill_res, proc_status,):
-    with patch.object(DhcpRelayd, "_kill_exist_relay_releated_process", return_value=kill_res), \
+@pytest.mark.parametrize("relay_per_interface", [True, False])
+def test_start_dhcrelay_process(mock_swsscommon_dbconnector_init, new_dhcp_interfaces, relay_per_interface):
+    with patch.object(DhcpRelayd, "_kill_exist_relay_releated_process", return_value=NOT_FOUND_PROC) as mock_kill, \
          patch.object(subprocess, "Popen", return_value=MockPopen(999)) as mock_popen, \
-         patch.object(time, "sleep"), \
          patch("dhcp_utilities.dhcprelayd.dhcprelayd.terminate_proc", return_value=None) as mock_terminate, \
-         patch.object(psutil.Process, "__init__", return_value=None), \
-         patch.object(psutil.Process, "status", return_value=proc_status), \
-         patch.object(sys, "exit") as mock_exit, \
          patch.object(ConfigDbEventChecker, "enable"):
         dhcp_db_connector = DhcpDbConnector()
-        dhcprelayd = DhcpRelayd(dhcp_db_connector, None)
-        dhcprelayd._start_dhcrelay_process(new_dhcp_interfaces, "240.127.1.2", False)
-        if len(new_dhcp_interfaces) == 0 or kill_res == NOT_KILLED:
-            mock_popen.assert_not_called()
-        else:
+        dhcprelayd = DhcpRelayd(dhcp_db_connector, None, relay_per_interface=relay_per_interface)
+        dhcprelayd._start_dhcrelay_process(set(new_dhcp_interfaces), "240.127.1.2", False)
+        # Processes left before dhcprelayd started are killed once
+        mock_kill.assert_called_once_with([], "dhcrelay", True)
+        calls = []
+        relay_interfaces = [[interface] for interface in new_dhcp_interfaces] if relay_per_interface else \
+            [new_dhcp_interfaces] if len(new_dhcp_interfaces) != 0 else []
+        for interfaces in relay_interfaces:
             call_param = ["/usr/sbin/dhcrelay", "-d", "-m", "discard", "-a", "%h:%p", "%P", "--name-alias-map-file",
                           "/tmp/port-name-alias-map.txt"]
-            for interface in new_dhcp_interfaces:
+            for interface in interfaces:
                 call_param += ["-id", interface]
             call_param += ["-iu", "docker0", "240.127.1.2"]
-            mock_popen.assert_called_once_with(call_param)
-        if len(new_dhcp_interfaces) != 0 and kill_res != NOT_KILLED and proc_status == psutil.STATUS_ZOMBIE:
+            calls.append(call(call_param))
+        assert mock_popen.call_args_list == calls
+        # Running processes are kept if they are still as expected
+        mock_popen.reset_mock()
+        dhcprelayd._start_dhcrelay_process(set(new_dhcp_interfaces), "240.127.1.2", False)
+        mock_popen.assert_not_called()
+        mock_terminate.assert_not_called()
+        mock_kill.assert_called_once_with([], "dhcrelay", True)
+        # Force kill restarts all of them
+        dhcprelayd._start_dhcrelay_process(set(new_dhcp_interfaces), "240.127.1.2", True)
+        assert mock_popen.call_args_list == calls
+        assert mock_terminate.call_count == len(calls)
+        # Only process of changed interface is restarted if relay per interface
+        if len(new_dhcp_interfaces) == 2:
+            mock_popen.reset_mock()
+            mock_terminate.reset_mock()
+            dhcprelayd._start_dhcrelay_process(set(new_dhcp_interfaces[:1]), "240.127.1.2", False)
             mock_terminate.assert_called_once()
-            mock_exit.assert_called_once_with(1)
-        else:
-            mock_terminate.assert_not_called()
-            mock_exit.assert_not_called()
+            if relay_per_interface:
+                mock_popen.assert_not_called()
+            else:
+                mock_popen.assert_called_once_with(["/usr/sbin/dhcrelay", "-d", "-m", "discard", "-a", "%h:%p", "%P",
+                                                    "--name-alias-map-file", "/tmp/port-name-alias-map.txt", "-id",
+                                                    "Vlan1000", "-iu", "docker0", "240.127.1.2"])
 
 
 @pytest.mark.parametrize("new_dhcp_interfaces_list", [[], ["Vlan1000"], ["Vlan1000", "Vlan2000"]])
-@pytest.mark.parametrize("kill_res", [KILLED_OLD, NOT_KILLED, NOT_FOUND_PROC])
-@pytest.mark.parametrize("proc_status", [psutil.STATUS_ZOMBIE, psutil.STATUS_RUNNING])
-def test_start_dhcpmon_process(mock_swsscommon_dbconnector_init, new_dhcp_interfaces_list, kill_res, proc_status):
+def test_start_dhcpmon_process(mock_swsscommon_dbconnector_init, new_dhcp_interfaces_list):
     new_dhcp_interfaces = set(new_dhcp_interfaces_list)
-    with patch.object(DhcpRelayd, "_kill_exist_relay_releated_process", return_value=kill_res), \
+    with patch.object(DhcpRelayd, "_kill_exist_relay_releated_process", return_value=NOT_FOUND_PROC) as mock_kill, \
          patch.object(subprocess, "Popen", return_value=MockPopen(999)) as mock_popen, \
-         patch.object(time, "sleep"), \
          patch("dhcp_utilities.dhcprelayd.dhcprelayd.terminate_proc", return_value=None) as mock_terminate, \
-         patch.object(psutil.Process, "__init__", return_value=None), \
-         patch.object(psutil.Process, "status", return_value=proc_status), \
          patch.object(ConfigDbEventChecker, "enable"):
         dhcp_db_connector = DhcpDbConnector()
         dhcprelayd = DhcpRelayd(dhcp_db_connector, None)
         dhcprelayd._start_dhcpmon_process(new_dhcp_interfaces, False)
-        if len(new_dhcp_interfaces) == 0 or kill_res == NOT_KILLED:
-            mock_popen.assert_not_called()
-        else:
-            calls = []
-            for interface in new_dhcp_interfaces:
-                call_param = ["/usr/sbin/dhcpmon", "-id", interface, "-iu", "docker0", "-im", "eth0"]
-                calls.append(call(call_param))
-            mock_popen.assert_has_calls(calls)
-        if len(new_dhcp_interfaces) != 0 and kill_res != NOT_KILLED and proc_status == psutil.STATUS_ZOMBIE:
-            mock_terminate.assert_called_once()
+        mock_kill.assert_called_once_with([], "dhcpmon", True)
+        calls = []
+        for interface in new_dhcp_interfaces:
+            call_param = ["/usr/sbin/dhcpmon", "-id", interface, "-iu", "docker0", "-im", "eth0"]
+            calls.append(call(call_param))
+        mock_popen.assert_has_calls(calls, any_order=True)
+        assert mock_popen.call_count == len(calls)
+        # Only dhcpmon of new interface is started
+        mock_popen.reset_mock()
+        dhcprelayd._start_dhcpmon_process(new_dhcp_interfaces | set(["Vlan3000"]), False)
+        mock_popen.assert_called_once_with(["/usr/sbin/dhcpmon", "-id", "Vlan3000", "-iu", "docker0", "-im", "eth0"])
+        mock_terminate.assert_not_called()
+        # Only dhcpmon of removed interface is stopped
+        mock_popen.reset_mock()
+        dhcprelayd._start_dhcpmon_process(new_dhcp_interfaces, False)
+        mock_popen.assert_not_called()
+        mock_terminate.assert_called_once()
+
+
+@pytest.mark.parametrize("process_name", ["dhcrelay", "dhcpmon"])
+@pytest.mark.parametrize("running_time", [1, 100])
+def test_check_supervised_procs(mock_swsscommon_dbconnector_init, process_name, running_time):
+    with patch.object(subprocess, "Popen", return_value=MockPopen(999)) as mock_popen, \
+         patch.object(time, "monotonic", return_value=1000), \
+         patch.object(sys, "exit", side_effect=mock_exit_func) as mock_exit:
+        dhcp_db_connector = DhcpDbConnector()
+        dhcprelayd = DhcpRelayd(dhcp_db_connector, None)
+        proc = SupervisedProcess(process_name, ["/usr/sbin/{}".format(process_name)])
+        proc.start()
+        dhcprelayd.supervised_procs["{}-Vlan1000".format(process_name)] = proc
+        # Running process is not touched
+        dhcprelayd._check_supervised_procs()
+        assert mock_popen.call_count == 1
+        proc.popen = MockPopen(999, returncode=1)
+        time.monotonic.return_value = 1000 + running_time
+        try:
+            dhcprelayd._check_supervised_procs()
+        except SystemExit:
+            assert process_name == "dhcrelay" and running_time == 1
+            mock_exit.assert_called_once_with(1)
+            return
+        if running_time == 1:
+            # dhcpmon failed to start is not restarted
+            assert mock_popen.call_count == 1
+            assert dhcprelayd.supervised_procs == {}
         else:
-            mock_terminate.assert_not_called()
+            assert mock_popen.call_count == 2
+            assert dhcprelayd.supervised_procs == {"{}-Vlan1000".format(process_name): proc}
+
+
+def test_stop_supervised_procs(mock_swsscommon_dbconnector_init):
+    with patch.object(DhcpRelayd, "_kill_exist_relay_releated_process", return_value=NOT_FOUND_PROC) as mock_kill, \
+         patch.object(subprocess, "Popen", return_value=MockPopen(999)), \
+         patch("dhcp_utilities.dhcprelayd.dhcprelayd.terminate_proc", return_value=None) as mock_terminate:
+        dhcp_db_connector = DhcpDbConnector()
+        dhcprelayd = DhcpRelayd(dhcp_db_connector, None)
+        dhcprelayd._start_dhcpmon_process(set(["Vlan1000", "Vlan2000"]), False)
+        dhcprelayd._stop_supervised_procs()
+        assert mock_terminate.call_count == 2
+        assert dhcprelayd.supervised_procs == {}
+        # dhcrelay processes are not started by dhcprelayd yet, need to find them
+        mock_kill.assert_has_calls([call([], "dhcpmon", True), call([], "dhcrelay", True)])
 
 
 @pytest.mark.parametrize("new_dhcp_interfaces_list", [[], ["Vlan1000"], ["Vlan1000", "Vlan2000"]])
@@ -199,7 +260,9 @@ def test_execute_supervisor_dhcp_relay_process(mock_swsscommon_dbconnector_init,
 @pytest.mark.parametrize("target_cmds", [[["/usr/bin/dhcrelay"]], [["/usr/bin/dhcpmon"]]])
 def test_check_dhcp_relay_process(mock_swsscommon_dbconnector_init, mock_swsscommon_table_init, target_cmds):
     exp_config = {"isc-dhcpv4-relay-Vlan1000": ["/usr/bin/dhcrelay"]}
-    with patch("dhcp_utilities.dhcprelayd.dhcprelayd.get_target_process_cmds", return_value=target_cmds), \
+    target_procs = [MagicMock(cmdline=MagicMock(return_value=cmds)) for cmds in target_cmds]
+    with patch("dhcp_utilities.dhcprelayd.dhcprelayd.get_target_processes",
+               return_value=target_procs) as get_target_processes, \
          patch.object(DhcpRelayd, "dhcp_relay_supervisor_config",
                       return_value=exp_config, new_callable=PropertyMock), \
          patch.object(sys, "exit", mock_exit_func):
@@ -213,6 +276,9 @@ def test_check_dhcp_relay_process(mock_swsscommon_dbconnector_init, mock_swsscom
             assert exp_cmds != target_cmds
         else:
             assert exp_cmds == target_cmds
+            # Processes found are reused while they are running
+            dhcprelayd._check_dhcp_relay_processes()
+            get_target_processes.assert_called_once_with("dhcrelay")
 
 
 def test_get_dhcp_relay_config(mock_swsscommon_dbconnector_init, mock_swsscommon_table_init):
@@ -60,6 +60,9 @@ def test_dump_dhcp4_config(mock_swsscommon_dbconnector_init, enabled_checker):
         else:
             mock_unsubscribe.assert_called_once_with(enabled_checker - new_enabled_checker)
             mock_subscribe.assert_called_once_with(new_enabled_checker - enabled_checker)
+        # Verify that kea-dhcp4 is not notified if config doesn't change
+        dhcpservd.dump_dhcp4_config()
+        mock_notify_kea_dhcp4_proc.assert_called_once_with()
 
 
 @pytest.mark.parametrize("process_list", [["proc1", "proc2", "kea-dhcp4"], ["proc1", "proc2"]])
@@ -78,6 +81,14 @@ def test_notify_kea_dhcp4_proc(process_list, mock_swsscommon_dbconnector_init, m
             ])
         else:
             mock_send_signal.assert_not_called()
+        # Verify that process found is reused while it is running
+        dhcpservd._notify_kea_dhcp4_proc()
+        if "kea-dhcp4" in process_list:
+            assert mock_send_signal.call_count == 2
+            psutil.process_iter.assert_called_once_with()
+            with patch.object(MockProc, "is_running", return_value=False):
+                dhcpservd._notify_kea_dhcp4_proc()
+            assert psutil.process_iter.call_count == 2
 
 
 @pytest.mark.parametrize("mock_intf", [True, False])
@@ -119,6 +130,27 @@ def test_start(mock_swsscommon_dbconnector_init, mock_parse_port_map_alias, mock
         mock_update_dhcp_server_ip.assert_called_once_with()
 
 
+def test_wait(mock_swsscommon_dbconnector_init, mock_parse_port_map_alias, mock_get_render_template):
+    mock_monitor = MagicMock()
+    # Burst of config changes, stopped by an exception to get out of loop
+    mock_monitor.check_db_update.side_effect = [False, True, True, True, False, True, False, Exception("stop")]
+    with patch.object(DhcpServd, "dump_dhcp4_config") as mock_dump:
+        dhcp_db_connector = DhcpDbConnector()
+        dhcp_cfg_generator = DhcpServCfgGenerator(dhcp_db_connector)
+        dhcpservd = DhcpServd(dhcp_cfg_generator, dhcp_db_connector, mock_monitor)
+        dhcpservd.enabled_dhcp_interfaces = set()
+        dhcpservd.used_range = set()
+        dhcpservd.used_options = set()
+        with pytest.raises(Exception, match="stop"):
+            dhcpservd.wait()
+        assert mock_dump.call_count == 2
+        mock_monitor.check_db_update.assert_has_calls([
+            call({"enabled_dhcp_interfaces": set(), "used_range": set(), "used_options": set()}),
+            call({"enabled_dhcp_interfaces": set(), "used_range": set(), "used_options": set()}),
+            call({"enabled_dhcp_interfaces": set(), "used_range": set(), "used_options": set()}, 500)
+        ])
+
+
 class MockIntf(object):
     def __init__(self, family, address):
         self.family = family
@@ -103,6 +103,7 @@ def test_get_db_table(mock_swsscommon_dbconnector_init, mock_swsscommon_table_in
             "key1": {"list": ["1", "2"], "value": "3,4"},
             "key2": {"list": ["1", "2"], "value": "3,4"}
         }
+        assert dhcp_db_connector.get_state_db_table_keys("VLAN") == ["key1", "key2"]
 
 
 def test_get_entry(mock_swsscommon_dbconnector_init, mock_swsscommon_table_init):
@@ -627,6 +627,45 @@ class BGPKeyMapList(list):
                     except ValueError:
                         pass
             super(BGPKeyMapList, self).append((db_field, BGPKeyMapInfo(cmd_str, hdl_func, hdl_data)))
+        self.compile()
+    def compile(self):
+        # parse the field specs of every command once, and index the commands by the fields they depend on
+        self.cmd_field_list = []
+        self.field_index = {}
+        for cmd_idx, (db_field, key_map) in enumerate(self):
+            merge_vals = False
+            if type(db_field) is not list and type(db_field) is not tuple:
+                db_field = [db_field]
+            elif type(db_field) is tuple:
+                merge_vals = True
+            req_idx_list = []
+            opt_idx_list = set()
+            field_list = []
+            for idx, dkey in enumerate(db_field):
+                optional = False
+                if len(dkey) > 0 and dkey[0] == '+':
+                    if len(dkey) > 1 and dkey[1] == '+':
+                        opt_idx_list.add(idx)
+                        dkey = dkey[2:]
+                    else:
+                        dkey = dkey[1:]
+                    optional = True
+                else:
+                    req_idx_list.append(idx)
+                keys = dkey.split('&')
+                field_list.append((keys, optional))
+                for k in keys:
+                    cmd_idx_list = self.field_index.setdefault(k, [])
+                    if cmd_idx not in cmd_idx_list:
+                        cmd_idx_list.append(cmd_idx)
+            self.cmd_field_list.append((merge_vals, field_list, req_idx_list, opt_idx_list, key_map))
+    def get_changed_cmd_list(self, data):
+        # commands without changed field generate nothing, skip them
+        cmd_idx_set = set()
+        for k, v in data.items():
+            if isinstance(v, CachedDataWithOp) and v.op != CachedDataWithOp.OP_NONE:
+                cmd_idx_set.update(self.field_index.get(k, []))
+        return [self.cmd_field_list[idx] for idx in sorted(cmd_idx_set)]
     def __eq__(self, other):
         return super(BGPKeyMapList, self).__eq__(other) and self.table_name == other.table_name and self.table_key == other.table_key
     def __ne__(self, other):
@@ -713,32 +752,12 @@ class BGPKeyMapList(list):
         start_idx = len(upper_vals)
         ret_val = False
         run_cmd_cnt = 0
-        for db_field, key_map in self:
-            merge_vals = False
-            if type(db_field) is not list and type(db_field) is not tuple:
-                db_field = [db_field]
-            elif type(db_field) is tuple:
-                db_field = list(db_field)
-                merge_vals = True
-
-            idx = 0
-            req_idx_list = []
+        for merge_vals, field_list, req_idx_list, opt_idx_list, key_map in self.get_changed_cmd_list(data):
             key_list_list = []
-            opt_idx_list = set()
             run_cmd = True
-            for dkey in db_field:
-                optional = False
-                if len(dkey) > 0 and dkey[0] == '+':
-                    if len(dkey) > 1 and dkey[1] == '+':
-                        opt_idx_list.add(idx)
-                        dkey = dkey[2:]
-                    else:
-                        dkey = dkey[1:]
-                    optional = True
-                else:
-                    req_idx_list.append(idx)
+            for keys, optional in field_list:
                 key_list = []
-                for k in dkey.split('&'):
+                for k in keys:
                     if k in data and isinstance(data[k], CachedDataWithOp):
                         key_list.append(k)
                 if not optional and len(key_list) == 0:
@@ -764,7 +783,6 @@ class BGPKeyMapList(list):
                                     new_list.append(k_lst + [k])
                     if len(new_list) > 0:
                         key_list_list = new_list
-                idx += 1
             if not run_cmd:
                 continue
 
@@ -1527,6 +1545,9 @@ def reformat_srv6_sidlist(data):
     return upd_data
 
 class ExtConfigDBConnector(ConfigDBConnector):
+    # max number of keyspace events popped per listener wakeup
+    LISTEN_BATCH_SIZE = 1000
+
     def __init__(self, ns_attrs = None):
         super(ExtConfigDBConnector, self).__init__()
         self.nosort_attrs = ns_attrs if ns_attrs is not None else {}
@@ -1541,13 +1562,22 @@ class ExtConfigDBConnector(ConfigDBConnector):
             if type(val) is list and key not in self.nosort_attrs.get(table, set()):
                 val.sort()
         return data
-    def sub_msg_handler(self, msg_item):
+    def get_msg_key(self, msg_item):
         if msg_item['type'] == 'pmessage':
-            key = msg_item['channel'].split(':', 1)[1]
+            return msg_item['channel'].split(':', 1)[1]
+        return None
+
+    def sub_msg_handler(self, msg_item):
+        key = self.get_msg_key(msg_item)
+        if key is not None:
+            self.fire_keys([key])
+
+    def fire_keys(self, key_list):
+        client = self.get_redis_client(self.db_name)
+        for key in key_list:
             try:
                 (table, row) = key.split(self.TABLE_NAME_SEPARATOR, 1)
                 if table in self.handlers:
-                    client = self.get_redis_client(self.db_name)
                     data = self.raw_to_typed(client.hgetall(key), table)
                     super(ExtConfigDBConnector, self)._ConfigDBConnector__fire(table, row, data)
             except ValueError:
@@ -1556,14 +1586,32 @@ class ExtConfigDBConnector(ConfigDBConnector):
                 syslog.syslog(syslog.LOG_ERR, '[bgp cfgd] Failed handling config DB update with exception:' + str(e))
                 logging.exception(e)
 
+    def pop_changed_keys(self, timeout):
+        """Wait for keyspace events and pop all the pending ones.
+           Return the changed keys in the order of their first event. A key changed several times is returned
+           once, and its handler reads the latest content of the entry.
+        """
+        keys = {}
+        msg = self.pubsub.get_message(timeout, True)
+        msg_count = 0
+        while msg:
+            key = self.get_msg_key(msg)
+            if key is not None:
+                keys.setdefault(key, None)
+            msg_count += 1
+            if msg_count >= self.LISTEN_BATCH_SIZE:
+                break
+            msg = self.pubsub.get_message(0, True)
+        return list(keys)
+
     def listen_thread(self, timeout):
         self.__listen_thread_running = True
         sub_key_space = "__keyspace@{}__:*".format(self.get_dbid(self.db_name))
         self.pubsub.psubscribe(sub_key_space)
         while self.__listen_thread_running:
-            msg = self.pubsub.get_message(timeout, True)
-            if msg:
-                self.sub_msg_handler(msg)
+            key_list = self.pop_changed_keys(timeout)
+            if key_list:
+                self.fire_keys(key_list)
 
         self.pubsub.punsubscribe(sub_key_space)
 
@@ -2359,6 +2407,7 @@ class BGPConfigDaemon:
 
         ]
         self.bgp_message = queue.Queue(0)
+        self.key_map_cache = {}
         self.table_data_cache = self.config_db.get_table_data([tbl for tbl, _ in self.table_handler_list])
         syslog.syslog(syslog.LOG_DEBUG, 'Init Cached DB data')
         for key, entry in self.table_data_cache.items():
@@ -2660,6 +2709,15 @@ class BGPConfigDaemon:
 
         return cmd_suffix, None
 
+    def __get_key_map(self, table, tbl_key):
+        # key map lists are compiled once for each table and key variant
+        cache_key = (table, None if tbl_key is None else tuple(sorted(tbl_key.items())))
+        key_map = self.key_map_cache.get(cache_key, None)
+        if key_map is None:
+            key_map = BGPKeyMapList(self.tbl_to_key_map[table], table, tbl_key)
+            self.key_map_cache[cache_key] = key_map
+        return key_map
+
     def __update_bgp(self, data_list):
         while not self.bgp_message.empty():
             key, del_table, table, data = self.bgp_message.get()
@@ -2702,7 +2760,7 @@ class BGPConfigDaemon:
                     if new_key is not None:
                         key = new_key
                         tbl_key = {'ip_prefix': ('ipv4' if af_id == socket.AF_INET else 'ipv6')}
-                key_map = BGPKeyMapList(self.tbl_to_key_map[table], table, tbl_key)
+                key_map = self.__get_key_map(table, tbl_key)
             else:
                 key_map = None
             if table == 'BGP_GLOBALS':
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""frrcfgd_benchmark.py
+
+Measure the frrcfgd handling of CONFIG_DB updates by replaying them through
+the table handlers of BGPConfigDaemon. FRR commands are counted, not run.
+
+The updates are read from a json file holding a list of [table, key, data]
+records in the order they were written to CONFIG_DB, with a null data for a
+deleted entry. Without a file, a BGP config push is generated: thousands of
+neighbors and route-map entries are added, several of their fields are
+changed, and then they are deleted.
+
+Examples:
+    python3 tests/frrcfgd_benchmark.py
+    python3 tests/frrcfgd_benchmark.py --neighbors 4000 --route-maps 2000
+    python3 tests/frrcfgd_benchmark.py --updates recorded_updates.json
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+from unittest.mock import MagicMock, NonCallableMagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+swsscommon_module_mock = MagicMock(ConfigDBConnector = NonCallableMagicMock)
+mockmapping = {'swsscommon.swsscommon': swsscommon_module_mock}
+
+LOCAL_ASN = '65100'
+
+
+def _neighbor_ip(index):
+    return '10.{}.{}.{}'.format(index // 65536 % 256, index // 256 % 256, index % 256)
+
+
+def generate_updates(num_neighbors, num_route_maps):
+    updates = [['BGP_GLOBALS', 'default', {'local_asn': LOCAL_ASN, 'router_id': '10.1.0.32'}]]
+    neighbors = {}
+    for i in range(num_neighbors):
+        key = 'default|' + _neighbor_ip(i)
+        neighbors[key] = {'asn': str(64600 + i % 1000), 'name': 'ARISTA{:04d}T0'.format(i),
+                          'local_addr': '10.1.0.32', 'admin_status': 'true',
+                          'keepalive': '60', 'holdtime': '180', 'ebgp_multihop': 'true'}
+    route_maps = {}
+    for i in range(num_route_maps):
+        key = 'RM_{}|{}'.format(i // 10, (i % 10 + 1) * 10)
+        route_maps[key] = {'route_operation': 'permit', 'match_tag': str(i), 'set_local_pref': '100',
+                           'set_origin': 'IGP', 'set_med': '10'}
+
+    # add the entries in one push
+    updates += [['BGP_NEIGHBOR', key, data] for key, data in neighbors.items()]
+    updates += [['ROUTE_MAP', key, data] for key, data in route_maps.items()]
+    # change some fields of every entry
+    for key, data in neighbors.items():
+        data = copy.copy(data)
+        data.update({'name': data['name'] + '_new', 'keepalive': '30', 'holdtime': '90'})
+        updates.append(['BGP_NEIGHBOR', key, data])
+    for key, data in route_maps.items():
+        data = copy.copy(data)
+        data.update({'set_local_pref': '200', 'set_med': '20'})
+        updates.append(['ROUTE_MAP', key, data])
+    # delete them
+    updates += [['ROUTE_MAP', key, None] for key in route_maps]
+    updates += [['BGP_NEIGHBOR', key, None] for key in neighbors]
+    return updates
+
+
+class ConfigDB(object):
+    """ CONFIG_DB content the daemon reads while it handles the updates """
+    def __init__(self):
+        self.tables = {}
+
+    def update(self, table, key, data):
+        if data is None:
+            self.tables.get(table, {}).pop(key, None)
+        else:
+            self.tables.setdefault(table, {})[key] = data
+
+    def get_table(self, table):
+        return {tuple(key.split('|')) if '|' in key else key: copy.copy(data)
+                for key, data in self.tables.get(table, {}).items()}
+
+    def get_entry(self, table, key):
+        return copy.copy(self.tables.get(table, {}).get(self.serialize_key(key), {}))
+
+    @staticmethod
+    def serialize_key(key):
+        return '|'.join(key) if type(key) is tuple else key
+
+
+def replay(updates):
+    cmd_count = [0]
+    def run_command(table, command, use_bgpd_client, daemons, ignore_fail = False):
+        cmd_count[0] += 1
+        return True
+
+    with patch.dict('sys.modules', **mockmapping):
+        from frrcfgd.frrcfgd import BGPConfigDaemon
+        with patch('frrcfgd.frrcfgd.g_run_command', run_command):
+            daemon = BGPConfigDaemon()
+            config_db = ConfigDB()
+            for attr in ['get_table', 'get_entry', 'serialize_key']:
+                setattr(daemon.config_db, attr, getattr(config_db, attr))
+            handlers = dict(daemon.table_handler_list)
+            start = time.time()
+            for table, key, data in updates:
+                config_db.update(table, key, data)
+                handlers[table](table, key, copy.copy(data))
+            return time.time() - start, cmd_count[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frrcfgd handling of CONFIG_DB updates")
+    parser.add_argument("--updates", help="json file of recorded [table, key, data] updates")
+    parser.add_argument("--neighbors", type=int, default=2000, help="number of generated BGP neighbors")
+    parser.add_argument("--route-maps", type=int, default=1000, help="number of generated route-map entries")
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.updates:
+        with open(args.updates) as f:
+            updates = json.load(f)
+    else:
+        updates = generate_updates(args.neighbors, args.route_maps)
+
+    timings = []
+    for _ in range(args.iterations):
+        elapsed, cmd_count = replay(updates)
+        timings.append(elapsed)
+
+    print('{} updates: min {:.1f} ms, mean {:.1f} ms over {} runs ({} FRR commands)'.format(
+        len(updates), min(timings) * 1000, sum(timings) / len(timings) * 1000, len(timings), cmd_count))
+
+
+if __name__ == '__main__':
+    main()
@@ -19,6 +19,33 @@ def test_contructor():
     daemon.config_db.pubsub.punsubscribe.assert_called_once()
     assert(daemon.config_db.sub_thread.is_alive() == False)
 
+@patch.dict('sys.modules', **mockmapping)
+def test_listen_batch():
+    from frrcfgd.frrcfgd import ExtConfigDBConnector, ConfigDBConnector
+    config_db = ExtConfigDBConnector()
+    config_db.TABLE_NAME_SEPARATOR = '|'
+    config_db.handlers = {'BGP_NEIGHBOR': None, 'ROUTE_MAP': None}
+    keys = ['BGP_NEIGHBOR|default|10.0.0.1', 'ROUTE_MAP|map1|10', 'BGP_NEIGHBOR|default|10.0.0.1',
+            'OTHER_TABLE|key', 'BGP_NEIGHBOR|default|10.0.0.1']
+    msgs = [{'type': 'pmessage', 'channel': '__keyspace@4__:' + key} for key in keys]
+    msgs.insert(1, {'type': 'psubscribe', 'channel': '__keyspace@4__:*'})
+    config_db.pubsub = MagicMock()
+    config_db.pubsub.get_message.side_effect = msgs + [None]
+    key_list = config_db.pop_changed_keys(10)
+    assert(key_list == ['BGP_NEIGHBOR|default|10.0.0.1', 'ROUTE_MAP|map1|10', 'OTHER_TABLE|key'])
+    config_db.pubsub.get_message.assert_any_call(10, True)
+    assert(config_db.pubsub.get_message.call_count == len(msgs) + 1)
+
+    client = config_db.get_redis_client.return_value
+    client.hgetall.side_effect = lambda key: {'name': key}
+    with patch.object(ExtConfigDBConnector, 'raw_to_typed', side_effect = lambda data, table: data), \
+         patch.object(ConfigDBConnector, '_ConfigDBConnector__fire', create = True) as fire_mock:
+        config_db.fire_keys(key_list)
+    assert(client.hgetall.call_count == 2)
+    assert(fire_mock.call_args_list == [
+        (('BGP_NEIGHBOR', 'default|10.0.0.1', {'name': 'BGP_NEIGHBOR|default|10.0.0.1'}),),
+        (('ROUTE_MAP', 'map1|10', {'name': 'ROUTE_MAP|map1|10'}),)])
+
 class CmdMapTestInfo:
     data_buf = {}
     def __init__(self, table, key, data, exp_cmd, no_del = False, neg_cmd = None,
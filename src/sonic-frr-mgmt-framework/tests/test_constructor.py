@@ -83,6 +83,27 @@ def test_command_map_list():
     for idx, cmd_map in enumerate(cmd_map_list):
         assert(chk_map_list[idx] == cmd_map[1])
 
+def test_command_map_field_index():
+    map_list = [('abc', 'set attribute abc'),
+                (['name', '+desc&comment'], 'describe {} {}'),
+                (('x', 'abc'), 'merged x abc'),
+                ('ip_cmd|ipv4', 'test on ipv4')]
+    cmd_map_list = BGPKeyMapList(map_list, 'frrcfg', {'ip_cmd': 'ipv4'})
+    assert(cmd_map_list.field_index == {'abc': [0, 2], 'name': [1], 'desc': [1], 'comment': [1], 'x': [2], 'ip_cmd': [3]})
+    merge_vals, field_list, req_idx_list, opt_idx_list, key_map = cmd_map_list.cmd_field_list[1]
+    assert(not merge_vals)
+    assert(field_list == [(['name'], False), (['desc', 'comment'], True)])
+    assert(req_idx_list == [0])
+    assert(len(opt_idx_list) == 0)
+    assert(key_map.run_cmd == 'describe {} {}')
+    assert(cmd_map_list.cmd_field_list[2][0])
+    data = {'abc': CachedDataWithOp('1', CachedDataWithOp.OP_NONE),
+            'name': CachedDataWithOp('n', CachedDataWithOp.OP_NONE),
+            'x': CachedDataWithOp('2', CachedDataWithOp.OP_UPDATE)}
+    assert([cmd[4].run_cmd for cmd in cmd_map_list.get_changed_cmd_list(data)] == ['merged x abc'])
+    data['abc'].op = CachedDataWithOp.OP_DELETE
+    assert([cmd[4].run_cmd for cmd in cmd_map_list.get_changed_cmd_list(data)] == ['set attribute abc', 'merged x abc'])
+
 def test_community_list():
     for ext in [False, True]:
         comm_list = CommunityList('comm', ext)
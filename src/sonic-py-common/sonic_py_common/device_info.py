@@ -16,6 +16,9 @@ CONTAINER_PLATFORM_PATH = USR_SHARE_SONIC_PATH + "/platform"
 MACHINE_CONF_PATH = "/host/machine.conf"
 SONIC_VERSION_YAML_PATH = "/etc/sonic/sonic_version.yml"
 
+# Snapshot of the parsed device config files, saved at boot
+DEVICE_INFO_SNAPSHOT_PATH = "/etc/sonic/device_info_snapshot.json"
+
 # Port configuration file names
 PORT_CONFIG_FILE = "port_config.ini"
 PLATFORM_JSON_FILE = "platform.json"
@@ -48,9 +51,129 @@ CHASSIS_INFO_REV_FIELD = 'revision'
 # DPU constants
 DPU_NAME_PREFIX = "dpu"
 
+# System MAC address sources and cache
+ETH0_ADDRESS_PATH = "/sys/class/net/eth0/address"
+SYSEEPROM_CACHE_PATH = "/var/cache/sonic/decode-syseeprom/syseeprom_cache"
+TLVINFO_HEADER = bytearray(b"TlvInfo\x00")
+TLVINFO_HEADER_LEN = 11
+TLV_CODE_MAC_BASE = 0x24
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+SYSTEM_MAC_CACHE_PATH = "/run/sonic_system_mac.json"
+
 # Cacheable Objects
 sonic_ver_info = {}
 hw_info_dict = {}
+# Parsed device config files: path -> (file signature, content)
+conf_file_cache = {}
+conf_file_snapshot_loaded = False
+
+
+def clear_cache():
+    """
+    Drop the cached device information, so that it is read again from the
+    device config files and Config DB
+    """
+    global sonic_ver_info, hw_info_dict, conf_file_snapshot_loaded
+
+    sonic_ver_info = {}
+    hw_info_dict = {}
+    conf_file_cache.clear()
+    conf_file_snapshot_loaded = False
+
+
+def _get_file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_ino, st.st_size, st.st_mtime]
+
+
+def _read_conf_file(path):
+    conf_vars = {}
+    with open(path) as conf_file:
+        for line in conf_file:
+            tokens = line.split('=')
+            if len(tokens) < 2:
+                continue
+            conf_vars[tokens[0]] = tokens[1].strip()
+    return conf_vars
+
+
+def _read_yaml_file(path):
+    with open(path) as stream:
+        if yaml.__version__ >= "5.1":
+            return yaml.full_load(stream)
+        else:
+            return yaml.safe_load(stream)
+
+
+def _get_conf_value(conf_vars, name):
+    for key, value in conf_vars.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _load_conf_file_snapshot():
+    global conf_file_snapshot_loaded
+
+    conf_file_snapshot_loaded = True
+    try:
+        with open(DEVICE_INFO_SNAPSHOT_PATH) as snapshot_file:
+            snapshot = json.load(snapshot_file)
+        for path, (signature, content) in snapshot.items():
+            conf_file_cache.setdefault(path, (signature, content))
+    except Exception:
+        pass
+
+
+def _get_cached_conf_file(path, reader):
+    """
+    Read a device config file once per process. The file is read again if
+    its signature shows that it was replaced or modified.
+    """
+    signature = _get_file_signature(path)
+    if signature is None:
+        return reader(path)
+
+    if not conf_file_snapshot_loaded:
+        _load_conf_file_snapshot()
+    entry = conf_file_cache.get(path)
+    if entry is None or entry[0] != signature:
+        entry = (signature, reader(path))
+        conf_file_cache[path] = entry
+    return entry[1]
+
+
+def save_device_info_snapshot():
+    """
+    Save the parsed device config files of the host, so that the processes
+    started later load them at once instead of parsing each of them
+    """
+    snapshot = {}
+    platform = get_platform(config_db=None)
+    conf_files = [(MACHINE_CONF_PATH, _read_conf_file), (SONIC_VERSION_YAML_PATH, _read_yaml_file)]
+    if platform:
+        conf_files.append((os.path.join(HOST_DEVICE_PATH, platform, ASIC_CONF_FILENAME), _read_conf_file))
+        conf_files.append((os.path.join(HOST_DEVICE_PATH, platform, PLATFORM_ENV_CONF_FILENAME), _read_conf_file))
+
+    for path, reader in conf_files:
+        signature = _get_file_signature(path)
+        if signature is None:
+            continue
+        content = reader(path)
+        try:
+            json.dumps(content)
+        except (TypeError, ValueError):
+            continue
+        snapshot[path] = [signature, content]
+
+    tmp_path = DEVICE_INFO_SNAPSHOT_PATH + '.tmp'
+    with open(tmp_path, 'w') as snapshot_file:
+        json.dump(snapshot, snapshot_file)
+    os.rename(tmp_path, DEVICE_INFO_SNAPSHOT_PATH)
+
 
 def get_localhost_info(field, config_db=None):
     try:
@@ -84,15 +207,7 @@ def get_machine_info():
     if not os.path.isfile(MACHINE_CONF_PATH):
         return None
 
-    machine_vars = {}
-    with open(MACHINE_CONF_PATH) as machine_conf_file:
-        for line in machine_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-                continue
-            machine_vars[tokens[0]] = tokens[1].strip()
-
-    return machine_vars
+    return dict(_get_cached_conf_file(MACHINE_CONF_PATH, _read_conf_file))
 
 def get_platform(**kwargs):
     """
@@ -457,11 +572,7 @@ def get_sonic_version_info():
     if sonic_ver_info:
         return sonic_ver_info
 
-    with open(SONIC_VERSION_YAML_PATH) as stream:
-        if yaml.__version__ >= "5.1":
-            sonic_ver_info = yaml.full_load(stream)
-        else:
-            sonic_ver_info = yaml.safe_load(stream)
+    sonic_ver_info = _get_cached_conf_file(SONIC_VERSION_YAML_PATH, _read_yaml_file)
 
     return sonic_ver_info
 
@@ -544,14 +655,8 @@ def get_num_npus():
     asic_conf_file_path = get_asic_conf_file_path()
     if asic_conf_file_path is None:
         return 1
-    with open(asic_conf_file_path) as asic_conf_file:
-        for line in asic_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-               continue
-            if tokens[0].lower() == 'num_asic':
-                num_npus = tokens[1].strip()
-        return int(num_npus)
+    asic_conf = _get_cached_conf_file(asic_conf_file_path, _read_conf_file)
+    return int(_get_conf_value(asic_conf, 'num_asic'))
 
 
 def is_multi_npu():
@@ -577,16 +682,8 @@ def is_supervisor():
     platform_env_conf_file_path = get_platform_env_conf_file_path()
     if platform_env_conf_file_path is None:
         return False
-    with open(platform_env_conf_file_path) as platform_env_conf_file:
-        for line in platform_env_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-               continue
-            if tokens[0].lower() == 'supervisor':
-                val = tokens[1].strip()
-                if val == '1':
-                    return True
-        return False
+    platform_env_conf = _get_cached_conf_file(platform_env_conf_file_path, _read_conf_file)
+    return _get_conf_value(platform_env_conf, 'supervisor') == '1'
 
 # Check if this platform has macsec capability.
 def is_macsec_supported():
@@ -597,16 +694,10 @@ def is_macsec_supported():
     if platform_env_conf_file_path is None:
         return supported
 
-    # Else open the file check for keyword - macsec_enabled -
-    with open(platform_env_conf_file_path) as platform_env_conf_file:
-        for line in platform_env_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-               continue
-            if tokens[0].lower() == 'macsec_enabled':
-                supported = tokens[1].strip()
-                break
-    return int(supported)
+    # Else check the file for keyword - macsec_enabled -
+    platform_env_conf = _get_cached_conf_file(platform_env_conf_file_path, _read_conf_file)
+    supported = _get_conf_value(platform_env_conf, 'macsec_enabled')
+    return int(supported) if supported is not None else 0
 
 
 def get_device_runtime_metadata():
@@ -688,12 +779,72 @@ def run_command_pipe(cmd0, cmd1, cmd2):
     return (out, err)
 
 
-def get_system_mac(namespace=None):
+def _read_file_output(path):
+    try:
+        with open(path) as f:
+            return (f.read(), None)
+    except (IOError, OSError) as e:
+        return ('', str(e))
+
+
+def _grep_conf_value(path, pattern):
+    """
+    Values of the 'key=value' lines of a file which contain the pattern
+    """
+    out, err = _read_file_output(path)
+    if err:
+        return (out, err)
+    values = [line.split('=')[1] if '=' in line else line
+              for line in out.splitlines() if pattern in line]
+    if not values:
+        return ('', "{} not found in {}".format(pattern, path))
+    return ('\n'.join(values) + '\n', None)
+
+
+def _parse_tlvinfo_base_mac(data):
+    """
+    Retrieve the base MAC address from the content of a TlvInfo EEPROM
+    """
+    data = bytearray(data)
+    if data[:len(TLVINFO_HEADER)] != TLVINFO_HEADER or len(data) < TLVINFO_HEADER_LEN:
+        return None
+    end = min(len(data), TLVINFO_HEADER_LEN + ((data[9] << 8) | data[10]))
+    pos = TLVINFO_HEADER_LEN
+    while pos + 2 <= end:
+        code = data[pos]
+        value = data[pos + 2:pos + 2 + data[pos + 1]]
+        if code == TLV_CODE_MAC_BASE and len(value) == 6:
+            return ':'.join('{:02X}'.format(b) for b in value)
+        pos += 2 + len(value)
+    return None
+
+
+def _get_syseeprom_mac():
+    """
+    Retrieve the base MAC address from the EEPROM cache of decode-syseeprom.
+    decode-syseeprom is only run when the cache is not available, because it
+    reads the EEPROM when it has no cache.
+    """
+    try:
+        with open(SYSEEPROM_CACHE_PATH, 'rb') as cache_file:
+            mac = _parse_tlvinfo_base_mac(cache_file.read())
+    except (IOError, OSError):
+        mac = None
+    if mac is not None:
+        return (mac, None)
+    return run_command(["sudo", "decode-syseeprom", "-m"])
+
+
+def _read_system_mac(namespace=None):
+    """
+    Read the system MAC address from the hardware
+
+    Returns:
+        (mac, fallback), fallback is True if the MAC address was not read from
+        the primary source of the platform, but from eth0 instead
+    """
+    # (mac, err, fallback) of each source, in order of preference
     hw_mac_entry_outputs = []
-    syseeprom_cmd = ["sudo", "decode-syseeprom", "-m"]
-    iplink_cmd0 = ["ip", 'link', 'show', 'eth0']
-    iplink_cmd1 = ['grep', 'ether']
-    iplink_cmd2 = ['awk', '{print $2}']
     version_info = get_sonic_version_info()
 
     if (version_info['asic_type'] == 'mellanox'):
@@ -708,56 +859,51 @@ def get_system_mac(namespace=None):
             mac = machine_vars[base_mac_key]
             mac = mac.strip()
             if _valid_mac_address(mac):
-                return mac
+                return (mac, False)
 
-        (mac, err) = run_command(syseeprom_cmd)
-        hw_mac_entry_outputs.append((mac, err))
+        (mac, err) = _get_syseeprom_mac()
+        hw_mac_entry_outputs.append((mac, err, False))
     elif (version_info['asic_type'] == 'marvell'):
         # Try valid mac in eeprom, else fetch it from eth0
         platform = get_platform()
         machine_key = "onie_machine"
         machine_vars = get_machine_info()
-        (mac, err) = run_command(syseeprom_cmd)
-        hw_mac_entry_outputs.append((mac, err))
+        (mac, err) = _get_syseeprom_mac()
+        hw_mac_entry_outputs.append((mac, err, False))
         if machine_vars is not None and machine_key in machine_vars:
             hwsku = machine_vars[machine_key]
             profile_file = HOST_DEVICE_PATH + '/' + platform + '/' + hwsku + '/profile.ini'
             if os.path.exists(profile_file):
-                profile_cmd0 = ['cat', profile_file]
-                profile_cmd1 = ['grep', 'switchMacAddress']
-                profile_cmd2 = ['cut', '-f2', '-d', '=']
-                (mac, err) = run_command_pipe(profile_cmd0, profile_cmd1, profile_cmd2)
-                hw_mac_entry_outputs.append((mac, err))
+                (mac, err) = _grep_conf_value(profile_file, 'switchMacAddress')
+                hw_mac_entry_outputs.append((mac, err, False))
         else:
-            profile_cmd = ["false"]
-            (mac, err) = run_command(profile_cmd)
-            hw_mac_entry_outputs.append((mac, err))
-        (mac, err) = run_command_pipe(iplink_cmd0, iplink_cmd1, iplink_cmd2)
-        hw_mac_entry_outputs.append((mac, err))
+            hw_mac_entry_outputs.append(('', "{} not found in machine.conf".format(machine_key), False))
+        (mac, err) = _read_file_output(ETH0_ADDRESS_PATH)
+        hw_mac_entry_outputs.append((mac, err, True))
     elif (version_info['asic_type'] == 'cisco-8000'):
         # Try to get valid MAC from profile.ini first, else fetch it from syseeprom or eth0
         platform = get_platform()
         if namespace is not None:
-            profile_cmd0 = ['cat', HOST_DEVICE_PATH + '/' + platform + '/profile.ini']
-            profile_cmd1 = ['grep', str(namespace)+'switchMacAddress']
-            profile_cmd2 = ['cut', '-f2', '-d', '=']
-            (mac, err) = run_command_pipe(profile_cmd0, profile_cmd1, profile_cmd2)
+            profile_file = HOST_DEVICE_PATH + '/' + platform + '/profile.ini'
+            (mac, err) = _grep_conf_value(profile_file, str(namespace) + 'switchMacAddress')
         else:
-            profile_cmd = ["false"]
-            (mac, err) = run_command(profile_cmd)
-        hw_mac_entry_outputs.append((mac, err))
-        (mac, err) = run_command(syseeprom_cmd)
-        hw_mac_entry_outputs.append((mac, err))
-        (mac, err) = run_command_pipe(iplink_cmd0, iplink_cmd1, iplink_cmd2)
-        hw_mac_entry_outputs.append((mac, err))
+            (mac, err) = ('', "no namespace for profile.ini")
+        hw_mac_entry_outputs.append((mac, err, False))
+        (mac, err) = _get_syseeprom_mac()
+        hw_mac_entry_outputs.append((mac, err, False))
+        (mac, err) = _read_file_output(ETH0_ADDRESS_PATH)
+        hw_mac_entry_outputs.append((mac, err, True))
     else:
-        mac_address_cmd = ["cat", "/sys/class/net/eth0/address"]
         if namespace is not None:
-            mac_address_cmd = ['sudo', 'ip', 'netns', 'exec', str(namespace)] + mac_address_cmd
-        (mac, err) = run_command(mac_address_cmd)
-        hw_mac_entry_outputs.append((mac, err))
+            # The eth0 of the namespace is only visible from within it
+            mac_address_cmd = ['sudo', 'ip', 'netns', 'exec', str(namespace), "cat", ETH0_ADDRESS_PATH]
+            (mac, err) = run_command(mac_address_cmd)
+        else:
+            (mac, err) = _read_file_output(ETH0_ADDRESS_PATH)
+        # eth0 is the primary source of the other platforms
+        hw_mac_entry_outputs.append((mac, err, False))
 
-    for (mac, err) in hw_mac_entry_outputs:
+    for (mac, err, fallback) in hw_mac_entry_outputs:
         if err:
             continue
         mac = mac.strip()
@@ -765,7 +911,7 @@ def get_system_mac(namespace=None):
             break
 
     if not _valid_mac_address(mac):
-        return None
+        return (None, False)
 
     # Align last byte of MAC if necessary
     if version_info and version_info['asic_type'] == 'centec':
@@ -773,6 +919,53 @@ def get_system_mac(namespace=None):
         mac_tmp = "{:012x}".format(int(mac_tmp, 16) + 1)
         mac_tmp = re.sub("(.{2})", "\\1:", mac_tmp, 0, re.DOTALL)
         mac = mac_tmp[:-1]
+    return (mac, fallback)
+
+
+def _get_boot_id():
+    out, err = _read_file_output(BOOT_ID_PATH)
+    return None if err else out.strip()
+
+
+def _load_system_mac_cache(boot_id):
+    try:
+        with open(SYSTEM_MAC_CACHE_PATH) as cache_file:
+            cache = json.load(cache_file)
+        if cache.get('boot_id') == boot_id:
+            return cache.get('mac', {})
+    except Exception:
+        pass
+    return {}
+
+
+def _save_system_mac_cache(boot_id, macs):
+    tmp_path = SYSTEM_MAC_CACHE_PATH + '.tmp'
+    try:
+        with open(tmp_path, 'w') as cache_file:
+            json.dump({'boot_id': boot_id, 'mac': macs}, cache_file)
+        os.rename(tmp_path, SYSTEM_MAC_CACHE_PATH)
+    except (IOError, OSError):
+        # Processes without write access to the cache still read the MAC
+        pass
+
+
+def get_system_mac(namespace=None):
+    """
+    Retrieve the system MAC address of the device, or of an ASIC namespace.
+    The MAC address is read from the hardware once per boot, and cached in
+    SYSTEM_MAC_CACHE_PATH. A MAC address of the eth0 fallback is not cached,
+    so the primary source is read again on the next call.
+    """
+    boot_id = _get_boot_id()
+    cache_key = '' if namespace is None else str(namespace)
+    macs = _load_system_mac_cache(boot_id) if boot_id else {}
+    if cache_key in macs:
+        return macs[cache_key]
+
+    mac, fallback = _read_system_mac(namespace)
+    if mac is not None and not fallback and boot_id:
+        macs[cache_key] = mac
+        _save_system_mac_cache(boot_id, macs)
     return mac
 
 
@@ -856,14 +1049,8 @@ def get_num_dpus():
     if platform_env_conf_file_path is None:
         return num_dpus
 
-    # Else open the file check for keyword - num_dpu -
-    with open(platform_env_conf_file_path) as platform_env_conf_file:
-        for line in platform_env_conf_file:
-            tokens = line.split('=')
-            if len(tokens) < 2:
-               continue
-            if tokens[0].lower() == 'num_dpu':
-                num_dpus = tokens[1].strip()
-                break
-    return int(num_dpus)
+    # Else check the file for keyword - num_dpu -
+    platform_env_conf = _get_cached_conf_file(platform_env_conf_file_path, _read_conf_file)
+    num_dpus = _get_conf_value(platform_env_conf, 'num_dpu')
+    return int(num_dpus) if num_dpus is not None else 0
 
@@ -49,6 +49,19 @@ def connect_config_db_for_ns(namespace=DEFAULT_NAMESPACE):
     return config_db
 
 
+def get_config_db_for_ns(namespace=DEFAULT_NAMESPACE):
+    """
+    The function returns the config DB handle of a namespace, which is
+    connected on first use and then shared by the callers of the process
+
+    Returns:
+      handle to the config_db for a namespace
+    """
+    if namespace not in config_db_handle:
+        config_db_handle[namespace] = connect_config_db_for_ns(namespace)
+    return config_db_handle[namespace]
+
+
 def connect_to_all_dbs_for_ns(namespace=DEFAULT_NAMESPACE):
     """
     The function connects to the DBs for a given namespace and
@@ -216,9 +229,7 @@ def get_all_namespaces():
     if is_multi_asic():
         for asic in range(num_asics):
             namespace = "{}{}".format(ASIC_NAME_PREFIX, asic)
-            if namespace not in config_db_handle:
-                config_db_handle[namespace] =  connect_config_db_for_ns(namespace)
-            config_db = config_db_handle[namespace]
+            config_db = get_config_db_for_ns(namespace)
 
             metadata = config_db.get_table('DEVICE_METADATA')
             if metadata['localhost']['sub_role'] == FRONTEND_ASIC_SUB_ROLE:
@@ -282,14 +293,14 @@ def get_port_table(namespace=None):
 
 def get_port_entry_for_asic(port, namespace):
 
-    config_db = connect_config_db_for_ns(namespace)
+    config_db = get_config_db_for_ns(namespace)
     ports = config_db.get_entry(PORT_CFG_DB_TABLE, port)
     return ports
 
 
 def get_port_table_for_asic(namespace):
 
-    config_db = connect_config_db_for_ns(namespace)
+    config_db = get_config_db_for_ns(namespace)
     ports = config_db.get_table(PORT_CFG_DB_TABLE)
     return ports
 
@@ -353,7 +364,7 @@ def is_port_channel_internal(port_channel, namespace=None):
     ns_list = get_namespace_list(namespace)
 
     for ns in ns_list:
-        config_db = connect_config_db_for_ns(ns)
+        config_db = get_config_db_for_ns(ns)
         port_channel_members = config_db.get_keys(PORT_CHANNEL_MEMBER_CFG_DB_TABLE)
 
         for port_channel_member in port_channel_members:
@@ -378,7 +389,7 @@ def get_back_end_interface_set(namespace=None):
     if len(bk_end_intf_list):
         ns_list = get_namespace_list(namespace)
         for ns in ns_list:
-            config_db = connect_config_db_for_ns(ns)
+            config_db = get_config_db_for_ns(ns)
             port_channel_members = config_db.get_keys(PORT_CHANNEL_MEMBER_CFG_DB_TABLE)
             # a back-end LAG must be configured with all of its member from back-end interfaces.
             # mixing back-end and front-end interfaces is miss configuration and not allowed.
@@ -400,7 +411,7 @@ def is_bgp_session_internal(bgp_neigh_ip, namespace=None):
 
     for ns in ns_list:
 
-        config_db = connect_config_db_for_ns(ns)
+        config_db = get_config_db_for_ns(ns)
         bgp_sessions = config_db.get_entry(
             BGP_INTERNAL_NEIGH_CFG_DB_TABLE, bgp_neigh_ip
         )
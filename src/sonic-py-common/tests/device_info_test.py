@@ -162,6 +162,126 @@ class TestDeviceInfo(object):
         assert mock_hwsku.called_once()
         mock_cfg_inst.get_table.assert_called_once_with("DEVICE_METADATA")
 
+    def test_conf_file_cache(self, tmp_path):
+        machine_conf_path = str(tmp_path / "machine.conf")
+        with open(machine_conf_path, "w") as machine_conf_file:
+            machine_conf_file.write(MACHINE_CONF_CONTENTS)
+        device_info.clear_cache()
+        with mock.patch("sonic_py_common.device_info.MACHINE_CONF_PATH", machine_conf_path), \
+                mock.patch("sonic_py_common.device_info.DEVICE_INFO_SNAPSHOT_PATH", str(tmp_path / "snapshot.json")), \
+                mock.patch("sonic_py_common.device_info._read_conf_file", wraps=device_info._read_conf_file) as read_mocked:
+            for _ in range(0,5):
+                assert device_info.get_machine_info() == EXPECTED_GET_MACHINE_INFO_RESULT
+            assert read_mocked.call_count == 1
+
+            # A modified file is read again
+            with open(machine_conf_path, "a") as machine_conf_file:
+                machine_conf_file.write("\nonie_base_mac=e4:1d:2d:44:5e:80")
+            assert device_info.get_machine_info()['onie_base_mac'] == 'e4:1d:2d:44:5e:80'
+            assert read_mocked.call_count == 2
+
+            # Explicit invalidation
+            device_info.clear_cache()
+            device_info.get_machine_info()
+            assert read_mocked.call_count == 3
+        device_info.clear_cache()
+
+    def test_device_info_snapshot(self, tmp_path):
+        machine_conf_path = str(tmp_path / "machine.conf")
+        sonic_version_path = str(tmp_path / "sonic_version.yml")
+        snapshot_path = str(tmp_path / "snapshot.json")
+        with open(machine_conf_path, "w") as machine_conf_file:
+            machine_conf_file.write(MACHINE_CONF_CONTENTS)
+        with open(sonic_version_path, "w") as sonic_version_file:
+            sonic_version_file.write(SONIC_VERISON_YML)
+        device_info.clear_cache()
+        with mock.patch("sonic_py_common.device_info.MACHINE_CONF_PATH", machine_conf_path), \
+                mock.patch("sonic_py_common.device_info.SONIC_VERSION_YAML_PATH", sonic_version_path), \
+                mock.patch("sonic_py_common.device_info.DEVICE_INFO_SNAPSHOT_PATH", snapshot_path):
+            device_info.save_device_info_snapshot()
+            device_info.clear_cache()
+            with mock.patch("sonic_py_common.device_info._read_yaml_file") as read_yaml_mocked, \
+                    mock.patch("sonic_py_common.device_info._read_conf_file") as read_conf_mocked:
+                assert device_info.get_sonic_version_info() == SONIC_VERISON_YML_RESULT
+                assert device_info.get_machine_info() == EXPECTED_GET_MACHINE_INFO_RESULT
+                assert device_info.get_platform() == "x86_64-mlnx_msn2700-r0"
+                assert not read_yaml_mocked.called
+                assert not read_conf_mocked.called
+
+            # A snapshot entry of a modified file is not used
+            with open(machine_conf_path, "w") as machine_conf_file:
+                machine_conf_file.write("onie_platform=x86_64-mlnx_msn2100-r0")
+            device_info.clear_cache()
+            assert device_info.get_platform() == "x86_64-mlnx_msn2100-r0"
+        device_info.clear_cache()
+
+    def test_get_system_mac(self, tmp_path):
+        eeprom_path = str(tmp_path / "syseeprom_cache")
+        boot_id_path = str(tmp_path / "boot_id")
+        mac_cache_path = str(tmp_path / "system_mac.json")
+        # TlvInfo EEPROM: product name, base MAC address and CRC
+        tlvs = bytearray(b"\x21\x04SKU1") + bytearray(b"\x24\x06\xe4\x1d\x2d\x44\x5e\x80") + bytearray(b"\xfe\x04\x00\x00\x00\x00")
+        with open(eeprom_path, "wb") as eeprom_file:
+            eeprom_file.write(bytearray(b"TlvInfo\x00\x01") + bytearray([0, len(tlvs)]) + tlvs)
+        with open(boot_id_path, "w") as boot_id_file:
+            boot_id_file.write("boot-1\n")
+
+        with mock.patch("sonic_py_common.device_info.SYSEEPROM_CACHE_PATH", eeprom_path), \
+                mock.patch("sonic_py_common.device_info.BOOT_ID_PATH", boot_id_path), \
+                mock.patch("sonic_py_common.device_info.SYSTEM_MAC_CACHE_PATH", mac_cache_path), \
+                mock.patch("sonic_py_common.device_info.get_machine_info", return_value={}), \
+                mock.patch("sonic_py_common.device_info.get_sonic_version_info", return_value={'asic_type': 'mellanox'}), \
+                mock.patch("sonic_py_common.device_info.run_command") as run_command_mocked:
+            assert device_info.get_system_mac() == "E4:1D:2D:44:5E:80"
+            # The cached MAC address is used until the next boot
+            with open(eeprom_path, "wb") as eeprom_file:
+                eeprom_file.write(bytearray(b"corrupted"))
+            assert device_info.get_system_mac() == "E4:1D:2D:44:5E:80"
+            assert not run_command_mocked.called
+
+            # decode-syseeprom is run without a valid EEPROM cache
+            with open(boot_id_path, "w") as boot_id_file:
+                boot_id_file.write("boot-2\n")
+            run_command_mocked.return_value = ("e4:1d:2d:44:5e:81\n", "")
+            assert device_info.get_system_mac() == "e4:1d:2d:44:5e:81"
+            run_command_mocked.assert_called_once_with(["sudo", "decode-syseeprom", "-m"])
+
+    def test_get_system_mac_fallback(self, tmp_path):
+        eeprom_path = str(tmp_path / "syseeprom_cache")
+        eth0_path = str(tmp_path / "eth0_address")
+        boot_id_path = str(tmp_path / "boot_id")
+        mac_cache_path = str(tmp_path / "system_mac.json")
+        with open(eth0_path, "w") as eth0_file:
+            eth0_file.write("00:11:22:33:44:55\n")
+        with open(boot_id_path, "w") as boot_id_file:
+            boot_id_file.write("boot-1\n")
+
+        with mock.patch("sonic_py_common.device_info.SYSEEPROM_CACHE_PATH", eeprom_path), \
+                mock.patch("sonic_py_common.device_info.ETH0_ADDRESS_PATH", eth0_path), \
+                mock.patch("sonic_py_common.device_info.BOOT_ID_PATH", boot_id_path), \
+                mock.patch("sonic_py_common.device_info.SYSTEM_MAC_CACHE_PATH", mac_cache_path), \
+                mock.patch("sonic_py_common.device_info.get_platform", return_value="x86_64-marvell-r0"), \
+                mock.patch("sonic_py_common.device_info.get_machine_info", return_value={}), \
+                mock.patch("sonic_py_common.device_info.get_sonic_version_info", return_value={'asic_type': 'marvell'}), \
+                mock.patch("sonic_py_common.device_info.run_command") as run_command_mocked:
+            # The eth0 MAC address is used while the syseeprom can't be read, but not cached
+            run_command_mocked.return_value = ("", "decode-syseeprom failed")
+            assert device_info.get_system_mac() == "00:11:22:33:44:55"
+            assert not os.path.exists(mac_cache_path)
+
+            run_command_mocked.return_value = ("e4:1d:2d:44:5e:81\n", "")
+            assert device_info.get_system_mac() == "e4:1d:2d:44:5e:81"
+            run_command_mocked.return_value = ("", "decode-syseeprom failed")
+            assert device_info.get_system_mac() == "e4:1d:2d:44:5e:81"
+
+    def test_grep_conf_value(self, tmp_path):
+        profile_path = str(tmp_path / "profile.ini")
+        with open(profile_path, "w") as profile_file:
+            profile_file.write("asic0switchMacAddress=00:11:22:33:44:55\nasic1switchMacAddress=00:11:22:33:44:66\n")
+        assert device_info._grep_conf_value(profile_path, "asic1switchMacAddress") == ("00:11:22:33:44:66\n", None)
+        assert device_info._grep_conf_value(profile_path, "asic2switchMacAddress")[1]
+        assert device_info._grep_conf_value(str(tmp_path / "none.ini"), "switchMacAddress")[1]
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
@@ -0,0 +1,58 @@
+from unittest import mock
+
+from sonic_py_common import multi_asic
+
+PORT_TABLES = {
+    'asic0': {'Ethernet0': {'role': 'Ext'}, 'Ethernet-BP0': {'role': 'Int'}},
+    'asic1': {'Ethernet4': {'lanes': '4'}, 'Ethernet-BP4': {'role': 'Int'}},
+}
+
+
+class FakeConfigDb(object):
+    """ Config DB handle which serves the PORT table of its namespace """
+    def __init__(self, namespace):
+        self.namespace = namespace
+
+    def get_table(self, table):
+        return dict(PORT_TABLES[self.namespace])
+
+    def get_entry(self, table, key):
+        return dict(PORT_TABLES[self.namespace].get(key, {}))
+
+
+class TestMultiAsic(object):
+    def setup_method(self):
+        multi_asic.config_db_handle.clear()
+
+    def teardown_method(self):
+        multi_asic.config_db_handle.clear()
+
+    @mock.patch("sonic_py_common.multi_asic.connect_config_db_for_ns")
+    def test_get_config_db_for_ns(self, mock_connect):
+        mock_connect.side_effect = lambda ns: mock.MagicMock(namespace=ns)
+        assert multi_asic.get_config_db_for_ns('asic0') is multi_asic.get_config_db_for_ns('asic0')
+        assert multi_asic.get_config_db_for_ns('asic1').namespace == 'asic1'
+        assert mock_connect.call_count == 2
+
+    @mock.patch("sonic_py_common.multi_asic.get_namespace_list")
+    @mock.patch("sonic_py_common.multi_asic.connect_config_db_for_ns")
+    def test_port_lookups(self, mock_connect, mock_ns_list):
+        mock_connect.side_effect = FakeConfigDb
+        mock_ns_list.side_effect = lambda namespace=None: ['asic0', 'asic1'] if namespace is None else [namespace]
+
+        assert multi_asic.get_namespace_for_port('Ethernet4') == 'asic1'
+        assert multi_asic.get_port_role('Ethernet0') == 'Ext'
+        assert multi_asic.get_port_role('Ethernet4') == 'Ext'
+        assert multi_asic.is_port_internal('Ethernet-BP4')
+        assert multi_asic.get_external_ports(['Ethernet0', 'Ethernet4', 'Ethernet-BP0']) == {'Ethernet0', 'Ethernet4'}
+        assert multi_asic.get_port_table() == dict(PORT_TABLES['asic0'], **PORT_TABLES['asic1'])
+
+        # PORT is read through the pooled handle, so a change is seen right away
+        PORT_TABLES['asic1']['Ethernet4'] = {'role': 'Int'}
+        try:
+            assert multi_asic.is_port_internal('Ethernet4')
+        finally:
+            PORT_TABLES['asic1']['Ethernet4'] = {'lanes': '4'}
+
+        # One config DB connection per namespace
+        assert mock_connect.call_count == 2
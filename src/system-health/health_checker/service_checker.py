@@ -2,6 +2,7 @@ import docker
 import os
 import pickle
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from swsscommon import swsscommon
 from sonic_py_common import multi_asic, device_info
@@ -35,6 +36,12 @@ class ServiceChecker(HealthChecker):
     CHECK_CMD = 'monit summary -B'
     MIN_CHECK_CMD_LINES = 3
 
+    # Command to get status of the processes in a container
+    GET_PROCESS_STATUS_CMD = 'docker exec {} bash -c "supervisorctl status"'
+
+    # Max number of containers whose process status are queried at the same time
+    MAX_PROCESS_STATUS_WORKERS = 8
+
     # Expect status for different system service category.
     EXPECT_STATUS_DICT = {
         'System': 'Running',
@@ -51,6 +58,16 @@ class ServiceChecker(HealthChecker):
 
         self.container_feature_dict = {}
 
+        # Id of the running container that critical processes are read from, a container recreated with the
+        # same name gets a new id, and its critical processes are read again
+        self.container_ids = {}
+        # Running container objects got from docker in current check
+        self.running_container_objs = {}
+        # Output of supervisorctl status of containers queried in current check
+        self.container_process_status = {}
+
+        self.docker_client = None
+
         self.need_save_cache = False
 
         self.config_db = None
@@ -112,16 +129,23 @@ class ServiceChecker(HealthChecker):
         Returns:
             running_containers: A set of running container names
         """
-        DOCKER_CLIENT = docker.DockerClient(base_url='unix://var/run/docker.sock')
+        if not self.docker_client:
+            self.docker_client = docker.DockerClient(base_url='unix://var/run/docker.sock')
         running_containers = set()
-        ctrs = DOCKER_CLIENT.containers
+        self.running_container_objs = {}
+        ctrs = self.docker_client.containers
         try:
             lst = ctrs.list(filters={"status": "running"})
 
             for ctr in lst:
                 running_containers.add(ctr.name)
+                self.running_container_objs[ctr.name] = ctr
                 if ctr.name not in self.container_critical_processes:
                     self.fill_critical_process_by_container(ctr.name)
+                elif self.container_ids.get(ctr.name, ctr.id) != ctr.id:
+                    # Container is recreated, its image may be changed
+                    self.fill_critical_process_by_container(ctr.name)
+                self.container_ids[ctr.name] = ctr.id
         except docker.errors.APIError as err:
             logger.log_error("Failed to retrieve the running container list. Error: '{}'".format(err))
 
@@ -189,6 +213,14 @@ class ServiceChecker(HealthChecker):
         self.need_save_cache = True
 
     def _get_container_folder(self, container):
+        ctr = self.running_container_objs.get(container)
+        if ctr is not None:
+            # Container list got from docker already has the inspect result
+            try:
+                return ctr.attrs['GraphDriver']['Data']['MergedDir']
+            except (KeyError, TypeError):
+                pass
+
         container_folder = utils.run_command(ServiceChecker.GET_CONTAINER_FOLDER_CMD.format(container))
         if container_folder is None:
             return container_folder
@@ -281,6 +313,7 @@ class ServiceChecker(HealthChecker):
         newly_disabled_containers = set(self.container_critical_processes.keys()).difference(expected_running_containers)
         for newly_disabled_container in newly_disabled_containers:
             self.container_critical_processes.pop(newly_disabled_container)
+            self.container_ids.pop(newly_disabled_container, None)
 
         self.save_critical_process_cache()
 
@@ -293,6 +326,8 @@ class ServiceChecker(HealthChecker):
             self.set_object_not_ok('Service', 'system', 'no critical process found')
             return
 
+        self.fetch_process_status([container for container in self.container_critical_processes
+                                   if self._is_container_enabled(container, feature_table)])
         for container, critical_process_list in self.container_critical_processes.items():
             self.check_process_existence(container, critical_process_list, config, feature_table)
 
@@ -336,6 +371,34 @@ class ServiceChecker(HealthChecker):
             params["process_name"] = process_name
             swsscommon.event_publish(self.events_handle, EVENTS_PUBLISHER_TAG, params)
 
+    def _is_container_enabled(self, container_name, feature_table):
+        # We look into the 'FEATURE' table to verify whether the container is disabled or not.
+        feature_name = self.container_feature_dict[container_name]
+        return (feature_name in feature_table and "state" in feature_table[feature_name]
+                and feature_table[feature_name]["state"] not in ["disabled", "always_disabled"])
+
+    def _get_process_status(self, container_name):
+        # We are using supervisorctl status to check the critical process status. We cannot leverage psutil here because
+        # it not always possible to get process cmdline in supervisor.conf. E.g, cmdline of orchagent is "/usr/bin/orchagent",
+        # however, in supervisor.conf it is "/usr/bin/orchagent.sh"
+        return utils.run_command(ServiceChecker.GET_PROCESS_STATUS_CMD.format(container_name))
+
+    def fetch_process_status(self, containers):
+        """Query process status of containers concurrently, the result is used by check_process_existence in
+           current check. Process status is not kept between checks, as a process may exit without container
+           being restarted.
+
+        Args:
+            containers (list): Container names
+        """
+        self.container_process_status = {}
+        if not containers:
+            return
+
+        max_workers = min(len(containers), ServiceChecker.MAX_PROCESS_STATUS_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            self.container_process_status = dict(zip(containers, executor.map(self._get_process_status, containers)))
+
     def check_process_existence(self, container_name, critical_process_list, config, feature_table):
         """Check whether the process in the specified container is running or not.
 
@@ -345,33 +408,27 @@ class ServiceChecker(HealthChecker):
             config (object): Health checker configuration.
             feature_table (object): Feature table
         """
-        feature_name = self.container_feature_dict[container_name]
-        if feature_name in feature_table:
-            # We look into the 'FEATURE' table to verify whether the container is disabled or not.
-            # If the container is diabled, we exit.
-            if ("state" in feature_table[feature_name]
-                    and feature_table[feature_name]["state"] not in ["disabled", "always_disabled"]):
-
-                # We are using supervisorctl status to check the critical process status. We cannot leverage psutil here because
-                # it not always possible to get process cmdline in supervisor.conf. E.g, cmdline of orchagent is "/usr/bin/orchagent",
-                # however, in supervisor.conf it is "/usr/bin/orchagent.sh"
-                cmd = 'docker exec {} bash -c "supervisorctl status"'.format(container_name)
-                process_status = utils.run_command(cmd)
-                if process_status is None:
-                    for process_name in critical_process_list:
-                        self.set_object_not_ok('Process', '{}:{}'.format(container_name, process_name), "Process '{}' in container '{}' is not running".format(process_name, container_name))
-                    self.publish_events(container_name, critical_process_list)
-                    return
-
-                process_status = self._parse_supervisorctl_status(process_status.strip().splitlines())
+        # If the container is diabled, we exit.
+        if self._is_container_enabled(container_name, feature_table):
+            if container_name in self.container_process_status:
+                process_status = self.container_process_status[container_name]
+            else:
+                process_status = self._get_process_status(container_name)
+            if process_status is None:
                 for process_name in critical_process_list:
-                    if config and config.ignore_services and process_name in config.ignore_services:
-                        continue
-
-                    # Sometimes process_name is in critical_processes file, but it is not in supervisor.conf, such process will not run in container.
-                    # and it is safe to ignore such process. E.g, radv. So here we only check those processes which are in process_status.
-                    if process_name in process_status:
-                        if process_status[process_name] != 'RUNNING':
-                            self.set_object_not_ok('Process', '{}:{}'.format(container_name, process_name), "Process '{}' in container '{}' is not running".format(process_name, container_name))
-                        else:
-                            self.set_object_ok('Process', '{}:{}'.format(container_name, process_name))
+                    self.set_object_not_ok('Process', '{}:{}'.format(container_name, process_name), "Process '{}' in container '{}' is not running".format(process_name, container_name))
+                self.publish_events(container_name, critical_process_list)
+                return
+
+            process_status = self._parse_supervisorctl_status(process_status.strip().splitlines())
+            for process_name in critical_process_list:
+                if config and config.ignore_services and process_name in config.ignore_services:
+                    continue
+
+                # Sometimes process_name is in critical_processes file, but it is not in supervisor.conf, such process will not run in container.
+                # and it is safe to ignore such process. E.g, radv. So here we only check those processes which are in process_status.
+                if process_name in process_status:
+                    if process_status[process_name] != 'RUNNING':
+                        self.set_object_not_ok('Process', '{}:{}'.format(container_name, process_name), "Process '{}' in container '{}' is not running".format(process_name, container_name))
+                    else:
+                        self.set_object_ok('Process', '{}:{}'.format(container_name, process_name))
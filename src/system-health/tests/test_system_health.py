@@ -225,6 +225,64 @@ def test_service_checker_multi_asic(mock_config_db, mock_docker_client):
     assert checker._info['snmp2:snmp-subagent'][HealthChecker.INFO_FIELD_OBJECT_STATUS] == HealthChecker.STATUS_NOT_OK
 
 
+@patch('swsscommon.swsscommon.ConfigDBConnector.connect', MagicMock())
+@patch('health_checker.service_checker.ServiceChecker.check_by_monit', MagicMock())
+@patch('health_checker.service_checker.ServiceChecker.fill_critical_process_by_container')
+@patch('sonic_py_common.multi_asic.is_multi_asic', MagicMock(return_value=False))
+@patch('docker.DockerClient')
+@patch('health_checker.utils.run_command')
+@patch('swsscommon.swsscommon.ConfigDBConnector')
+def test_service_checker_container_cache(mock_config_db, mock_run, mock_docker_client, mock_fill):
+    mock_db_data = MagicMock()
+    mock_db_data.get_table = MagicMock(return_value={
+        'snmp': {
+            'state': 'enabled',
+            'has_global_scope': 'True',
+            'has_per_asic_scope': 'False',
+        },
+        'lldp': {
+            'state': 'enabled',
+            'has_global_scope': 'True',
+            'has_per_asic_scope': 'False',
+        }
+    })
+    mock_config_db.return_value = mock_db_data
+
+    mock_snmp_container = MagicMock()
+    mock_snmp_container.name = 'snmp'
+    mock_snmp_container.id = 'id1'
+    mock_snmp_container.attrs = {'GraphDriver': {'Data': {'MergedDir': test_path}}}
+    mock_lldp_container = MagicMock()
+    mock_lldp_container.name = 'lldp'
+    mock_lldp_container.id = 'id2'
+    mock_containers = MagicMock()
+    mock_containers.list = MagicMock(return_value=[mock_snmp_container, mock_lldp_container])
+    mock_docker_client.return_value.containers = mock_containers
+    mock_run.return_value = mock_supervisorctl_output
+
+    checker = ServiceChecker()
+    checker.container_critical_processes = {'snmp': ['snmpd'], 'lldp': ['lldpd']}
+    config = Config()
+    checker.check(config)
+    checker.check(config)
+    # Critical processes are cached, docker client is created once, process status is queried in each check
+    mock_fill.assert_not_called()
+    assert mock_docker_client.call_count == 1
+    assert mock_run.call_count == 4
+    mock_run.assert_any_call(ServiceChecker.GET_PROCESS_STATUS_CMD.format('lldp'))
+    assert checker._info['snmp:snmpd'][HealthChecker.INFO_FIELD_OBJECT_STATUS] == HealthChecker.STATUS_OK
+    assert checker._get_container_folder('snmp') == test_path
+
+    # Critical processes of recreated container are read again, only once
+    mock_snmp_container.id = 'id3'
+    checker.check(config)
+    mock_fill.assert_called_once_with('snmp')
+    assert checker.container_ids == {'snmp': 'id3', 'lldp': 'id2'}
+    checker.check(config)
+    mock_fill.assert_called_once_with('snmp')
+    assert mock_run.call_count == 8
+
+
 @patch('swsscommon.swsscommon.ConfigDBConnector', MagicMock())
 @patch('swsscommon.swsscommon.ConfigDBConnector.connect', MagicMock())
 @patch('health_checker.service_checker.ServiceChecker.check_by_monit', MagicMock())